@@ -1,8 +1,37 @@
 """AWS integration: EC2, RDS, Lambda, CloudWatch."""
 
-from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.aws.cloudwatch import (
+    CloudWatchClient,
+    LogTailCursor,
+    MetricDataResult,
+    metric_query,
+)
+from devops_framework.aws.credentials import AssumeRoleCredentialCache, get_credential_cache
 from devops_framework.aws.ec2 import EC2Client
+from devops_framework.aws.enhanced_monitoring import OSMetricsSeries, get_os_metrics
 from devops_framework.aws.lambda_ import LambdaClient
-from devops_framework.aws.rds import RDSClient
+from devops_framework.aws.metric_catalog import MetricCatalog
+from devops_framework.aws.metric_publisher import EMFWriter, MetricPublisher
+from devops_framework.aws.rds import RDSClient, RDSEventCursor, RDSLogMarkers
+from devops_framework.aws.session import ClientPool, get_client_pool
 
-__all__ = ["EC2Client", "RDSClient", "LambdaClient", "CloudWatchClient"]
+__all__ = [
+    "EC2Client",
+    "RDSClient",
+    "RDSEventCursor",
+    "RDSLogMarkers",
+    "LambdaClient",
+    "CloudWatchClient",
+    "MetricDataResult",
+    "metric_query",
+    "LogTailCursor",
+    "MetricCatalog",
+    "MetricPublisher",
+    "EMFWriter",
+    "OSMetricsSeries",
+    "get_os_metrics",
+    "ClientPool",
+    "get_client_pool",
+    "AssumeRoleCredentialCache",
+    "get_credential_cache",
+]
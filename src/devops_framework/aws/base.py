@@ -2,62 +2,267 @@
 
 from __future__ import annotations
 
-from functools import cached_property
-from typing import Any
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cached_property, partial
+from typing import Any, Self
 
 import boto3
 import botocore.config
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 
+from devops_framework.aws.credentials import assume_role_session, get_credential_cache
+from devops_framework.aws.session import get_client_pool
 from devops_framework.core.base import IntegrationBaseClient
+from devops_framework.core.concurrency import (
+    DEFAULT_MAX_WORKERS,
+    BatchLoader,
+    fan_out,
+    prefetch,
+)
 from devops_framework.core.config import Config
 from devops_framework.core.exceptions import AWSAPIError, AWSAuthError
 
 
-_RETRY_CONFIG = botocore.config.Config(
+_CLIENT_CONFIG = botocore.config.Config(
     retries={"max_attempts": 3, "mode": "adaptive"},
+    max_pool_connections=50,
 )
 
+ALL_REGIONS = "all"
+REGION_KEY = "Region"
+
+_LOADERS: dict[tuple[Any, ...], BatchLoader[Any, Any]] = {}
+_LOADERS_LOCK = threading.Lock()
+
+
+def is_multi_region(regions: str | None) -> bool:
+    """Return True if a ``--region`` style value names more than one region."""
+    if not regions:
+        return False
+    return regions == ALL_REGIONS or "," in regions
+
 
 class AWSBaseClient(IntegrationBaseClient):
     """
     Base class for all AWS service clients.
 
-    Lazily initialises a boto3 session and individual service clients.
+    Sessions and service clients come from the process-wide
+    :class:`~devops_framework.aws.session.ClientPool`, so every client object
+    with the same region, profile and role shares one session and one connection pool.
     Authentication follows standard boto3 credential resolution:
       env vars → ~/.aws/credentials → IAM instance role → etc.
+    When a role ARN is given (or ``Config.aws_role_arn`` is set) those credentials
+    are used to ``sts:AssumeRole`` into it, with the temporary credentials cached
+    until shortly before they expire.
     """
 
     def __init__(
-        self, region: str | None = None, profile: str | None = None, config: Config | None = None
+        self,
+        region: str | None = None,
+        profile: str | None = None,
+        config: Config | None = None,
+        role_arn: str | None = None,
     ) -> None:
         super().__init__(config)
         self._region = region or self.config.aws_region
         self._profile = profile or self.config.aws_profile
+        self._role_arn = role_arn or self.config.aws_role_arn
 
     @property
     def region(self) -> str:
         return self._region
 
+    @property
+    def role_arn(self) -> str | None:
+        return self._role_arn
+
     @cached_property
+    def account_id(self) -> str:
+        """The AWS account these credentials act in, via STS GetCallerIdentity (cached)."""
+        try:
+            return str(self._boto_client("sts").get_caller_identity()["Account"])
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "STS get_caller_identity failed") from exc
+
+    @property
     def session(self) -> boto3.Session:
-        kwargs: dict[str, Any] = {"region_name": self._region}
-        if self._profile:
-            kwargs["profile_name"] = self._profile
+        return self._ensure_session()
+
+    def _ensure_session(self) -> boto3.Session:
+        """Return the pooled session, raising AWSAuthError if it cannot be created."""
+        factory = partial(self._assume_role_session, self._role_arn) if self._role_arn else None
         try:
-            return boto3.Session(**kwargs)
+            return get_client_pool().session(self._region, self._profile, self._role_arn, factory)
+        except AWSAuthError:
+            raise
         except (BotoCoreError, Exception) as exc:
             raise AWSAuthError(f"Failed to create AWS session: {exc}") from exc
 
-    def _boto_client(self, service: str) -> Any:
-        """Return a boto3 service client with retry config."""
+    def _assume_role_session(self, role_arn: str) -> boto3.Session:
+        sts = get_client_pool().client("sts", self._region, self._profile, config=_CLIENT_CONFIG)
+        return assume_role_session(
+            role_arn,
+            self._region,
+            sts,
+            get_credential_cache(self.config.aws_credential_cache_dir),
+            session_name=self.config.aws_role_session_name,
+            source_profile=self._profile,
+        )
+
+    def _boto_client(self, service: str, parse_timestamps: bool = True) -> Any:
+        """
+        Return the pooled boto3 service client with retry config.
+
+        With ``parse_timestamps=False`` the client returns timestamps as raw wire
+        values (ISO strings or epoch numbers) and skips ``datetime`` parsing.
+        """
+        self._ensure_session()
+        factory = partial(self._assume_role_session, self._role_arn) if self._role_arn else None
         try:
-            return self.session.client(service, config=_RETRY_CONFIG)
+            return get_client_pool().client(
+                service,
+                self._region,
+                self._profile,
+                self._role_arn,
+                factory,
+                config=_CLIENT_CONFIG,
+                parse_timestamps=parse_timestamps,
+            )
         except NoCredentialsError as exc:
             raise AWSAuthError("AWS credentials not found") from exc
         except (BotoCoreError, ClientError) as exc:
             raise AWSAPIError(f"Failed to create {service} client: {exc}") from exc
 
+    @staticmethod
+    def _iter_pages(
+        client: Any, operation: str, prefetch_pages: bool = True, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate the pages of a paginated operation, optionally one page ahead."""
+        pages = client.get_paginator(operation).paginate(**kwargs)
+        return prefetch(pages) if prefetch_pages else iter(pages)
+
+    def _shared_loader(
+        self,
+        name: str,
+        batch_fn: Callable[[list[Any]], Mapping[Any, Any]],
+        window: float,
+        max_batch_size: int,
+    ) -> BatchLoader[Any, Any]:
+        """
+        Return the process-wide :class:`BatchLoader` for ``name`` and these credentials.
+
+        Client objects of the same type, region, profile and role share one loader,
+        so lookups coalesce even when every thread builds its own client.
+        """
+        key = (type(self).__name__, name, self._region, self._profile, self._role_arn)
+        with _LOADERS_LOCK:
+            loader = _LOADERS.get(key)
+            if loader is None:
+                loader = _LOADERS[key] = BatchLoader(batch_fn, window, max_batch_size)
+            return loader
+
+    def for_region(self, region: str) -> Self:
+        """Return a client of the same type and credentials bound to ``region``."""
+        return type(self)(
+            region=region, profile=self._profile, config=self.config, role_arn=self._role_arn
+        )
+
+    def for_account(self, role_arn: str) -> Self:
+        """Return a client of the same type and region that assumes ``role_arn``."""
+        return type(self)(
+            region=self._region, profile=self._profile, config=self.config, role_arn=role_arn
+        )
+
+    def enabled_regions(self) -> list[str]:
+        """Return the regions enabled for this account, via EC2 DescribeRegions."""
+        try:
+            resp = self._boto_client("ec2").describe_regions(AllRegions=False)
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "EC2 describe_regions failed") from exc
+        return sorted(r["RegionName"] for r in resp.get("Regions", []))
+
+    def resolve_regions(self, regions: str | Iterable[str] | None) -> list[str]:
+        """
+        Expand a region selector into a list of region names.
+
+        Accepts ``None`` (this client's region), ``"all"`` (every enabled
+        region), a comma-separated string, or an iterable of names.
+        """
+        if regions is None:
+            return [self._region]
+        if isinstance(regions, str):
+            if regions == ALL_REGIONS:
+                return self.enabled_regions()
+            regions = regions.split(",")
+        return list(dict.fromkeys(r.strip() for r in regions if r.strip()))
+
+    def across_regions(
+        self,
+        method: str,
+        *args: Any,
+        regions: str | Iterable[str] | None = ALL_REGIONS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Run a list method in several regions at once and merge the results.
+
+        ``method`` names a method on this client that returns a list of dicts,
+        e.g. ``"list_instances"``. Each region is queried on a bounded worker
+        pool and every returned item is tagged with its region under
+        ``"Region"``. Raises :class:`AWSAPIError` naming the failed regions if
+        any region errors.
+        """
+        targets = self.resolve_regions(regions)
+
+        def _run(region: str) -> list[dict[str, Any]]:
+            items: list[dict[str, Any]] = getattr(self.for_region(region), method)(*args, **kwargs)
+            for item in items:
+                item[REGION_KEY] = region
+            return items
+
+        results = fan_out(_run, targets, max_workers=max_workers, return_exceptions=True)
+        merged: list[dict[str, Any]] = []
+        failed: dict[str, str] = {}
+        for region, result in zip(targets, results):
+            if isinstance(result, Exception):
+                failed[region] = str(result)
+            else:
+                merged.extend(result)
+        if failed:
+            raise AWSAPIError(
+                f"{method} failed in {len(failed)} of {len(targets)} region(s)",
+                details={"failed_regions": failed},
+            )
+        return merged
+
+    def across_accounts(
+        self,
+        method: str,
+        role_arns: Iterable[str],
+        *args: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Run any client method in several accounts at once.
+
+        Each role ARN is assumed (through the shared credential cache) and
+        ``method`` is called on a client bound to it, on a bounded worker pool.
+        Returns a dict of ``role_arn -> result``. With ``return_exceptions``
+        a failing account maps to its exception; otherwise the first failure
+        is raised.
+        """
+        arns = list(dict.fromkeys(role_arns))
+
+        def _run(role_arn: str) -> Any:
+            return getattr(self.for_account(role_arn), method)(*args, **kwargs)
+
+        results = fan_out(_run, arns, max_workers=max_workers, return_exceptions=return_exceptions)
+        return dict(zip(arns, results))
+
     def health_check(self) -> bool:
         """Verify AWS credentials are valid by calling STS GetCallerIdentity."""
         try:
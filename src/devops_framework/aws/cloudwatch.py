@@ -2,14 +2,344 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import heapq
+import json
+import os
+import re
+import tempfile
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from functools import cached_property
+from itertools import chain, islice
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from botocore.exceptions import ClientError
 
 from devops_framework.aws.base import AWSBaseClient
-from devops_framework.core.exceptions import ResourceNotFoundError
+from devops_framework.core.concurrency import (
+    DEFAULT_MAX_WORKERS,
+    chain_concurrently,
+    fan_out,
+    prefetch,
+)
+from devops_framework.core.exceptions import AWSAPIError, ResourceNotFoundError
+from devops_framework.core.timeseries import TimeSeriesStore
+
+# GetMetricData accepts at most 500 MetricDataQuery entries per request.
+_MAX_METRIC_DATA_QUERIES = 500
+# GetMetricStatistics returns at most 1,440 datapoints per request.
+_MAX_STATISTICS_DATAPOINTS = 1440
+# A Logs Insights query can name at most 50 log groups.
+_MAX_INSIGHTS_LOG_GROUPS = 50
+# Default account quota for concurrently running Logs Insights queries.
+_MAX_CONCURRENT_INSIGHTS_QUERIES = 30
+# PutMetricData accepts at most 1,000 MetricDatum items and a 1 MB payload per request.
+_MAX_PUT_METRIC_ITEMS = 1000
+_MAX_PUT_METRIC_BYTES = 1_000_000
+# GetLogEvents returns at most 10,000 events per call.
+_MAX_LOG_EVENTS_PAGE = 10_000
+# Pages each filter shard may read ahead of the consumer.
+_SHARD_BUFFER_PAGES = 8
+# DescribeLogStreams updates lastEventTimestamp eventually, typically within an hour.
+_STREAM_LAST_EVENT_LAG_MS = 3600 * 1000
+_INSIGHTS_FAILED_STATUSES = frozenset({"Failed", "Cancelled", "Timeout", "Unknown"})
+# Insights commands whose partial results are revised until the query completes.
+_INSIGHTS_REVISING_RE = re.compile(r"(?:^|\|)\s*(?:stats|sort|dedup|pattern|diff)\b", re.IGNORECASE)
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Expression functions that read every query in the request without naming them.
+_REQUEST_WIDE_RE = re.compile(r"\b(?:METRICS|SEARCH)\s*\(")
+
+
+@dataclass(slots=True)
+class MetricDataResult:
+    """One GetMetricData series: ascending timestamps and their values."""
+
+    id: str
+    label: str
+    timestamps: np.ndarray  # datetime64[s]
+    values: np.ndarray  # float64
+    status_code: str
+    messages: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class LogStreamPosition:
+    """How far a tail has read one log stream."""
+
+    last_timestamp: int = 0
+    seen_event_ids: set[str] = field(default_factory=set)
+    forward_token: str | None = None
+
+
+@dataclass(slots=True)
+class LogTailCursor:
+    """
+    Resumable position of a :meth:`CloudWatchClient.tail` over a log group.
+
+    Each stream records its last event timestamp (milliseconds) together with
+    the IDs of the events already delivered at that timestamp, or the
+    ``nextForwardToken`` when a single stream is tailed through GetLogEvents.
+    """
+
+    log_group_name: str
+    start_time: int
+    streams: dict[str, LogStreamPosition] = field(default_factory=dict)
+
+    def is_new(self, event: dict[str, Any]) -> bool:
+        """Return True if ``event`` has not been delivered yet."""
+        position = self.streams.get(event.get("logStreamName", ""))
+        timestamp = event.get("timestamp", 0)
+        if position is None:
+            return bool(timestamp >= self.start_time)
+        if timestamp != position.last_timestamp:
+            return bool(timestamp > position.last_timestamp)
+        return event.get("eventId") not in position.seen_event_ids
+
+    def advance(self, event: dict[str, Any]) -> None:
+        """Record ``event`` as delivered."""
+        position = self.streams.setdefault(event.get("logStreamName", ""), LogStreamPosition())
+        timestamp = event.get("timestamp", 0)
+        if timestamp > position.last_timestamp:
+            position.last_timestamp = timestamp
+            position.seen_event_ids.clear()
+        if event.get("eventId"):
+            position.seen_event_ids.add(event["eventId"])
+
+    def latest_timestamp(self) -> int:
+        """Return the newest timestamp seen on any stream, or ``start_time``."""
+        return max((p.last_timestamp for p in self.streams.values()), default=self.start_time)
+
+    def prune(self, before: int) -> None:
+        """Forget streams without events at or after ``before`` milliseconds."""
+        for name in [n for n, p in self.streams.items() if p.last_timestamp < before and not p.forward_token]:
+            del self.streams[name]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "log_group_name": self.log_group_name,
+            "start_time": self.start_time,
+            "streams": {
+                name: {
+                    "last_timestamp": p.last_timestamp,
+                    "seen_event_ids": sorted(p.seen_event_ids),
+                    "forward_token": p.forward_token,
+                }
+                for name, p in self.streams.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LogTailCursor:
+        return cls(
+            log_group_name=data["log_group_name"],
+            start_time=int(data["start_time"]),
+            streams={
+                name: LogStreamPosition(
+                    last_timestamp=int(p.get("last_timestamp", 0)),
+                    seen_event_ids=set(p.get("seen_event_ids", [])),
+                    forward_token=p.get("forward_token"),
+                )
+                for name, p in data.get("streams", {}).items()
+            },
+        )
+
+    def save(self, path: Path | str) -> None:
+        """Write the cursor to ``path`` as JSON, replacing the file atomically."""
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(self.to_dict(), fh)
+            os.replace(tmp, target)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path | str) -> LogTailCursor:
+        """Read a cursor written by :meth:`save`."""
+        with Path(path).expanduser().open() as fh:
+            return cls.from_dict(json.load(fh))
+
+
+def metric_query(
+    query_id: str,
+    namespace: str,
+    metric_name: str,
+    dimensions: list[dict[str, str]] | None = None,
+    stat: str = "Average",
+    period: int = 300,
+    label: str | None = None,
+    return_data: bool = True,
+) -> dict[str, Any]:
+    """Build a ``MetricStat`` MetricDataQuery dict for :meth:`CloudWatchClient.get_metric_data`."""
+    query: dict[str, Any] = {
+        "Id": query_id,
+        "MetricStat": {
+            "Metric": {
+                "Namespace": namespace,
+                "MetricName": metric_name,
+                "Dimensions": dimensions or [],
+            },
+            "Period": period,
+            "Stat": stat,
+        },
+        "ReturnData": return_data,
+    }
+    if label:
+        query["Label"] = label
+    return query
+
+
+def _split_time_range(
+    start_time: datetime, end_time: datetime, max_span_seconds: int
+) -> list[tuple[datetime, datetime]]:
+    """Split ``[start_time, end_time)`` into consecutive windows of at most ``max_span_seconds``."""
+    span = timedelta(seconds=max_span_seconds)
+    windows: list[tuple[datetime, datetime]] = []
+    cursor = start_time
+    while cursor < end_time:
+        window_end = min(cursor + span, end_time)
+        windows.append((cursor, window_end))
+        cursor = window_end
+    return windows or [(start_time, end_time)]
+
+
+def _datum_size(datum: dict[str, Any]) -> int:
+    """Upper bound for a MetricDatum's share of the request payload."""
+    return len(json.dumps(datum, default=str)) + 1
+
+
+def _batch_metric_data(
+    metric_data: list[dict[str, Any]],
+    max_items: int = _MAX_PUT_METRIC_ITEMS,
+    max_bytes: int = _MAX_PUT_METRIC_BYTES,
+) -> list[list[dict[str, Any]]]:
+    """Split MetricDatum items into PutMetricData requests under the item and size limits."""
+    batches: list[list[dict[str, Any]]] = []
+    batch: list[dict[str, Any]] = []
+    size = 0
+    for datum in metric_data:
+        datum_size = _datum_size(datum)
+        if batch and (len(batch) >= max_items or size + datum_size > max_bytes):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(datum)
+        size += datum_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _to_millis(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _from_millis(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, tz=UTC)
+
+
+def _shard_millis(
+    start_ms: int | None, end_ms: int | None, shards: int
+) -> list[tuple[int | None, int | None]]:
+    """
+    Cut the inclusive ``[start_ms, end_ms]`` range into ``shards`` disjoint slices.
+
+    FilterLogEvents treats both bounds as inclusive, so each slice ends one
+    millisecond before the next one starts.
+    """
+    if shards <= 1 or start_ms is None or end_ms is None or end_ms <= start_ms:
+        return [(start_ms, end_ms)]
+    shards = min(shards, end_ms - start_ms + 1)
+    bounds = [start_ms + (end_ms - start_ms + 1) * i // shards for i in range(shards + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(shards)]
+
+
+def _event_order(event: dict[str, Any]) -> tuple[int, str]:
+    return event.get("timestamp", 0), event.get("eventId", "")
+
+
+def _dedupe_events(events: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Drop repeated ``eventId`` values from a timestamp-ordered event stream."""
+    current: int | None = None
+    seen: set[str] = set()
+    for event in events:
+        timestamp = event.get("timestamp")
+        if timestamp != current:
+            current = timestamp
+            seen.clear()
+        event_id = event.get("eventId")
+        if event_id is not None:
+            if event_id in seen:
+                continue
+            seen.add(event_id)
+        yield event
+
+
+def _insights_row(fields: list[dict[str, str]]) -> dict[str, str]:
+    return {f["field"]: f["value"] for f in fields if "field" in f}
+
+
+def _pack_metric_queries(
+    queries: list[dict[str, Any]], limit: int = _MAX_METRIC_DATA_QUERIES
+) -> list[list[dict[str, Any]]]:
+    """
+    Split queries into request-sized batches, keeping metric math with its inputs.
+
+    Queries referenced by an ``Expression`` must travel in the same request, so
+    connected queries form one group and groups are packed first-fit-decreasing.
+    An expression using ``METRICS()`` or ``SEARCH()`` depends on the whole
+    request, so then all queries are sent together or a ValueError is raised.
+    """
+    ids = [q["Id"] for q in queries]
+    if len(set(ids)) != len(ids):
+        raise ValueError("MetricDataQuery Ids must be unique")
+    if any(_REQUEST_WIDE_RE.search(q.get("Expression") or "") for q in queries):
+        if len(queries) > limit:
+            raise ValueError(
+                f"METRICS()/SEARCH() expressions need all {len(queries)} queries in one "
+                f"request, which exceeds the {limit}-query limit"
+            )
+        return [list(queries)]
+    parent = {query_id: query_id for query_id in ids}
+
+    def _find(query_id: str) -> str:
+        while parent[query_id] != query_id:
+            parent[query_id] = parent[parent[query_id]]
+            query_id = parent[query_id]
+        return query_id
+
+    for query in queries:
+        expression = query.get("Expression")
+        if not expression:
+            continue
+        for token in _IDENTIFIER_RE.findall(expression):
+            if token in parent and token != query["Id"]:
+                parent[_find(token)] = _find(query["Id"])
+
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for query in queries:
+        groups.setdefault(_find(query["Id"]), []).append(query)
+
+    batches: list[list[dict[str, Any]]] = []
+    for group in sorted(groups.values(), key=len, reverse=True):
+        if len(group) > limit:
+            raise ValueError(
+                f"{len(group)} inter-dependent metric queries exceed the {limit}-query request limit"
+            )
+        target = next((b for b in batches if len(b) + len(group) <= limit), None)
+        if target is None:
+            batches.append(list(group))
+        else:
+            target.extend(group)
+    return batches
 
 
 class CloudWatchClient(AWSBaseClient):
@@ -34,14 +364,45 @@ class CloudWatchClient(AWSBaseClient):
         end_time: datetime,
         period: int = 300,
         statistics: list[str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> list[dict[str, Any]]:
         """
         Return datapoints for a CloudWatch metric.
 
         ``period`` is in seconds (default 5 min). ``statistics`` defaults to ["Average"].
+        Ranges that would exceed the 1,440-datapoint request limit are split into
+        windows that are fetched concurrently and merged into one sorted,
+        de-duplicated series.
         """
         if statistics is None:
             statistics = ["Average"]
+        windows = _split_time_range(start_time, end_time, period * _MAX_STATISTICS_DATAPOINTS)
+        chunks = fan_out(
+            lambda window: self._get_metric_statistics_window(
+                namespace, metric_name, dimensions, window[0], window[1], period, statistics
+            ),
+            windows,
+            max_workers=max_workers,
+        )
+        merged: list[dict[str, Any]] = []
+        for chunk in chunks:
+            chunk.sort(key=lambda d: d["Timestamp"])
+            for datapoint in chunk:
+                if merged and datapoint["Timestamp"] <= merged[-1]["Timestamp"]:
+                    continue
+                merged.append(datapoint)
+        return merged
+
+    def _get_metric_statistics_window(
+        self,
+        namespace: str,
+        metric_name: str,
+        dimensions: list[dict[str, str]],
+        start_time: datetime,
+        end_time: datetime,
+        period: int,
+        statistics: list[str],
+    ) -> list[dict[str, Any]]:
         try:
             resp = self._cw.get_metric_statistics(
                 Namespace=namespace,
@@ -54,7 +415,145 @@ class CloudWatchClient(AWSBaseClient):
             )
         except ClientError as exc:
             raise self._wrap_client_error(exc, "CloudWatch get_metric_statistics failed") from exc
-        return sorted(resp.get("Datapoints", []), key=lambda d: d["Timestamp"])
+        datapoints: list[dict[str, Any]] = resp.get("Datapoints", [])
+        return datapoints
+
+    def get_metric_series(
+        self,
+        store: TimeSeriesStore,
+        namespace: str,
+        metric_name: str,
+        dimensions: list[dict[str, str]],
+        start_time: datetime,
+        end_time: datetime,
+        period: int = 300,
+        statistic: str = "Average",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return one statistic as ``(timestamps, values)`` arrays, read through ``store``.
+
+        Only the parts of the window that ``store`` has not seen yet are fetched
+        with :meth:`get_metric_statistics`, widened to whole ``period`` buckets;
+        the rest is read from disk. Series are stored per account and region,
+        so clients for different accounts never share cached data.
+        """
+        key = "cloudwatch:" + json.dumps(
+            [
+                self._region,
+                self.account_id,
+                namespace,
+                metric_name,
+                sorted((d["Name"], d["Value"]) for d in dimensions),
+                period,
+                statistic,
+            ]
+        )
+
+        def _fetch(start: datetime, end: datetime) -> tuple[np.ndarray, list[float]]:
+            points = self.get_metric_statistics(
+                namespace, metric_name, dimensions, start, end, period, [statistic]
+            )
+            timestamps = np.array([int(p["Timestamp"].timestamp()) for p in points], dtype="int64")
+            return timestamps, [p[statistic] for p in points]
+
+        return store.get_or_fetch(key, start_time, end_time, _fetch, align=period)
+
+    def get_metric_data(
+        self,
+        queries: Iterable[dict[str, Any]],
+        start_time: datetime,
+        end_time: datetime,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, MetricDataResult]:
+        """
+        Fetch many metric series through GetMetricData and return NumPy arrays.
+
+        ``queries`` are MetricDataQuery dicts (see :func:`metric_query`), including
+        metric math ``Expression`` queries. They are packed into requests of up to
+        500 queries (an expression always shares a request with the queries it
+        references; ``METRICS()``/``SEARCH()`` keep every query in one request),
+        requests run concurrently, and every request is paginated
+        through ``NextToken``. Returns ``{query_id: MetricDataResult}`` for each
+        query with ``ReturnData`` enabled.
+        """
+        batches = _pack_metric_queries(list(queries))
+        results: dict[str, MetricDataResult] = {}
+        for batch_results in fan_out(
+            lambda batch: self._get_metric_data_batch(batch, start_time, end_time),
+            batches,
+            max_workers=max_workers,
+        ):
+            results.update(batch_results)
+        return results
+
+    def _get_metric_data_batch(
+        self, queries: list[dict[str, Any]], start_time: datetime, end_time: datetime
+    ) -> dict[str, MetricDataResult]:
+        series: dict[str, dict[str, Any]] = {}
+        try:
+            for page in self._iter_pages(
+                self._cw,
+                "get_metric_data",
+                prefetch_pages=False,
+                MetricDataQueries=queries,
+                StartTime=start_time,
+                EndTime=end_time,
+                ScanBy="TimestampAscending",
+            ):
+                for result in page.get("MetricDataResults", []):
+                    entry = series.setdefault(
+                        result["Id"],
+                        {
+                            "label": result.get("Label", result["Id"]),
+                            "ts": [],
+                            "values": [],
+                            "messages": [],
+                        },
+                    )
+                    entry["ts"].extend(int(ts.timestamp()) for ts in result.get("Timestamps", []))
+                    entry["values"].extend(result.get("Values", []))
+                    entry["messages"].extend(result.get("Messages", []))
+                    entry["status"] = result.get("StatusCode", "Complete")
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "CloudWatch get_metric_data failed") from exc
+        return {
+            query_id: MetricDataResult(
+                id=query_id,
+                label=entry["label"],
+                timestamps=np.asarray(entry["ts"], dtype="int64").astype("datetime64[s]"),
+                values=np.asarray(entry["values"], dtype="float64"),
+                status_code=entry["status"],
+                messages=entry["messages"],
+            )
+            for query_id, entry in series.items()
+        }
+
+    def put_metric_data(
+        self,
+        namespace: str,
+        metric_data: Iterable[dict[str, Any]],
+        max_workers: int = 4,
+    ) -> int:
+        """
+        Publish MetricDatum items, split into as few PutMetricData requests as the limits allow.
+
+        Requests hold up to 1,000 items and stay under the 1 MB payload limit;
+        botocore gzips request bodies larger than 10 KB. Returns the number of
+        requests sent.
+        """
+        batches = _batch_metric_data(list(metric_data))
+        fan_out(
+            lambda batch: self._put_metric_data_batch(namespace, batch),
+            batches,
+            max_workers=max_workers,
+        )
+        return len(batches)
+
+    def _put_metric_data_batch(self, namespace: str, batch: list[dict[str, Any]]) -> None:
+        try:
+            self._cw.put_metric_data(Namespace=namespace, MetricData=batch)
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "CloudWatch put_metric_data failed") from exc
 
     def list_metrics(
         self,
@@ -62,35 +561,60 @@ class CloudWatchClient(AWSBaseClient):
         metric_name: str | None = None,
     ) -> list[dict[str, Any]]:
         """List CloudWatch metrics, optionally filtered by namespace and/or name."""
+        return list(self.iter_metrics(namespace, metric_name, prefetch=False))
+
+    def iter_metrics(
+        self,
+        namespace: str | None = None,
+        metric_name: str | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        recently_active: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield CloudWatch metrics page by page.
+
+        Stops paginating after ``max_items`` metrics; otherwise, with ``prefetch``,
+        the next page is fetched while the caller handles the current one. Pass
+        ``recently_active="PT3H"`` to list only metrics with data in the last
+        three hours.
+        """
         kwargs: dict[str, Any] = {}
         if namespace:
             kwargs["Namespace"] = namespace
         if metric_name:
             kwargs["MetricName"] = metric_name
-        metrics: list[dict[str, Any]] = []
+        if recently_active:
+            kwargs["RecentlyActive"] = recently_active
+        pages = self._iter_pages(self._cw, "list_metrics", prefetch and max_items is None, **kwargs)
         try:
-            paginator = self._cw.get_paginator("list_metrics")
-            for page in paginator.paginate(**kwargs):
-                metrics.extend(page.get("Metrics", []))
+            yield from islice((m for page in pages for m in page.get("Metrics", [])), max_items)
         except ClientError as exc:
             raise self._wrap_client_error(exc, "CloudWatch list_metrics failed") from exc
-        return metrics
 
     # ── Logs ──────────────────────────────────────────────────────────────────
 
     def list_log_groups(self, prefix: str | None = None) -> list[dict[str, Any]]:
         """List CloudWatch Log groups, optionally filtered by name prefix."""
+        return list(self.iter_log_groups(prefix, prefetch=False))
+
+    def iter_log_groups(
+        self,
+        prefix: str | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield CloudWatch Log groups page by page, stopping after ``max_items``."""
         kwargs: dict[str, Any] = {}
         if prefix:
             kwargs["logGroupNamePrefix"] = prefix
-        groups: list[dict[str, Any]] = []
+        pages = self._iter_pages(
+            self._logs, "describe_log_groups", prefetch and max_items is None, **kwargs
+        )
         try:
-            paginator = self._logs.get_paginator("describe_log_groups")
-            for page in paginator.paginate(**kwargs):
-                groups.extend(page.get("logGroups", []))
+            yield from islice((g for page in pages for g in page.get("logGroups", [])), max_items)
         except ClientError as exc:
             raise self._wrap_client_error(exc, "CloudWatch Logs describe_log_groups failed") from exc
-        return groups
 
     def get_log_events(
         self,
@@ -100,25 +624,123 @@ class CloudWatchClient(AWSBaseClient):
         end_time: datetime | None = None,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
-        """Return events from a specific log stream."""
-        kwargs: dict[str, Any] = {
-            "logGroupName": log_group_name,
-            "logStreamName": log_stream_name,
-            "limit": limit,
-            "startFromHead": True,
-        }
-        if start_time:
-            kwargs["startTime"] = int(start_time.timestamp() * 1000)
-        if end_time:
-            kwargs["endTime"] = int(end_time.timestamp() * 1000)
+        """
+        Return events from a specific log stream.
+
+        Follows ``nextForwardToken`` until ``limit`` events have been collected.
+        """
+        pages = self._iter_stream_pages(
+            log_group_name,
+            log_stream_name,
+            start_time=_to_millis(start_time) if start_time else None,
+            end_time=_to_millis(end_time) if end_time else None,
+            page_size=min(limit, _MAX_LOG_EVENTS_PAGE),
+        )
+        return list(islice((e for events, _token in pages for e in events), limit))
+
+    def iter_active_log_streams(
+        self,
+        log_group_name: str,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        max_items: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield the streams of a log group that may hold events in a time window.
+
+        Streams are listed most recently written first, and listing stops at
+        the first stream whose last event is older than ``start_time`` minus
+        the hour by which ``lastEventTimestamp`` may lag behind.
+        """
+        start_ms = _to_millis(start_time)
+        end_ms = _to_millis(end_time) if end_time else None
+        pages = self._iter_pages(
+            self._logs,
+            "describe_log_streams",
+            prefetch_pages=max_items is None,
+            logGroupName=log_group_name,
+            orderBy="LastEventTime",
+            descending=True,
+        )
+
+        def _active() -> Iterator[dict[str, Any]]:
+            for page in pages:
+                for stream in page.get("logStreams", []):
+                    last = stream.get("lastEventTimestamp")
+                    if last is not None and last < start_ms - _STREAM_LAST_EVENT_LAG_MS:
+                        return
+                    first = stream.get("firstEventTimestamp")
+                    if end_ms is not None and first is not None and first > end_ms:
+                        continue
+                    yield stream
+
         try:
-            resp = self._logs.get_log_events(**kwargs)
+            yield from islice(_active(), max_items)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code == "ResourceNotFoundException":
-                raise ResourceNotFoundError("CloudWatch Log Stream", log_stream_name) from exc
-            raise self._wrap_client_error(exc, "CloudWatch Logs get_log_events failed") from exc
-        return resp.get("events", [])
+                raise ResourceNotFoundError("CloudWatch Log Group", log_group_name) from exc
+            raise self._wrap_client_error(exc, "CloudWatch Logs describe_log_streams failed") from exc
+
+    def iter_merged_log_events(
+        self,
+        log_group_name: str,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        log_stream_names: Iterable[str] | None = None,
+        max_streams: int | None = None,
+        page_size: int = 1000,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Read many log streams at once and yield their events in timestamp order.
+
+        Streams default to those active in the window (see
+        :meth:`iter_active_log_streams`), capped at ``max_streams``. The first
+        page of every stream is requested at once on a pool of ``max_workers``
+        threads; after that each stream is paged forward through GetLogEvents
+        with its next page prefetched on the same pool, and the streams are
+        combined by a heap merge, so memory stays at about two pages of
+        ``page_size`` events per stream. Every event carries its
+        ``logStreamName``.
+        """
+        if log_stream_names is None:
+            names = [
+                s["logStreamName"]
+                for s in self.iter_active_log_streams(log_group_name, start_time, end_time, max_streams)
+            ]
+        else:
+            names = list(islice(dict.fromkeys(log_stream_names), max_streams))
+        if not names:
+            return
+        start_ms = _to_millis(start_time)
+        end_ms = _to_millis(end_time) if end_time else None
+        page_iters = [
+            self._iter_stream_pages(log_group_name, name, start_ms, end_ms, page_size=page_size)
+            for name in names
+        ]
+        first_pages = fan_out(lambda pages: next(pages, None), page_iters, max_workers=max_workers)
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names))))
+        try:
+            streams = [
+                self._iter_stream_events(name, first, pages, executor)
+                for name, first, pages in zip(names, first_pages, page_iters, strict=True)
+                if first is not None
+            ]
+            yield from heapq.merge(*streams, key=lambda e: (e["timestamp"], e["logStreamName"]))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _iter_stream_events(
+        log_stream_name: str,
+        first_page: tuple[list[dict[str, Any]], str],
+        pages: Iterator[tuple[list[dict[str, Any]], str]],
+        executor: ThreadPoolExecutor,
+    ) -> Iterator[dict[str, Any]]:
+        for events, _token in prefetch(chain([first_page], pages), executor):
+            for event in events:
+                yield dict(event, logStreamName=log_stream_name)
 
     def filter_log_events(
         self,
@@ -128,21 +750,336 @@ class CloudWatchClient(AWSBaseClient):
         end_time: datetime | None = None,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
-        """Search across all log streams in a log group using a filter pattern."""
+        """
+        Search across all log streams in a log group using a filter pattern.
+
+        Follows ``nextToken`` until ``limit`` matching events have been
+        collected; ``limit`` is also sent as the page size.
+        """
+        return list(
+            self.iter_filter_log_events(
+                log_group_name, filter_pattern, start_time, end_time, max_items=limit
+            )
+        )
+
+    def iter_filter_log_events(
+        self,
+        log_group_name: str,
+        filter_pattern: str = "",
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        shards: int = 1,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_items: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream every event matching ``filter_pattern``, following all pages.
+
+        With ``shards`` > 1 the ``[start_time, end_time]`` range is cut into that
+        many equal slices (``end_time`` defaults to now). Every slice is paged
+        through in full at the same time on up to ``max_workers`` threads, each
+        buffering a few pages ahead, and the slices are yielded in time order
+        with duplicate ``eventId`` values dropped, so the output matches a
+        single sequential search. With ``max_items`` the page size is capped at
+        that many events and a single search does not prefetch.
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if shards > 1 and start_time is None:
+            raise ValueError("start_time is required when shards > 1")
+        start_ms = _to_millis(start_time) if start_time else None
+        end_ms = _to_millis(end_time) if end_time else None
+        if shards > 1 and end_ms is None:
+            end_ms = _to_millis(datetime.now(UTC))
+        base: dict[str, Any] = {"logGroupName": log_group_name, "filterPattern": filter_pattern}
+        if max_items is not None:
+            base["limit"] = max(1, min(max_items, _MAX_LOG_EVENTS_PAGE))
+        shard_pages = []
+        for shard_start, shard_end in _shard_millis(start_ms, end_ms, shards):
+            kwargs = dict(base)
+            if shard_start is not None:
+                kwargs["startTime"] = shard_start
+            if shard_end is not None:
+                kwargs["endTime"] = shard_end
+            shard_pages.append(self._iter_filtered_event_pages(kwargs))
+        if len(shard_pages) == 1:
+            pages = prefetch(shard_pages[0]) if max_items is None else shard_pages[0]
+        else:
+            pages = chain_concurrently(
+                shard_pages, max_workers=max_workers, buffer_size=_SHARD_BUFFER_PAGES
+            )
+        try:
+            yield from islice(_dedupe_events(chain.from_iterable(pages)), max_items)
+        except ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code", "")
+            if code == "ResourceNotFoundException":
+                raise ResourceNotFoundError("CloudWatch Log Group", log_group_name) from exc
+            raise self._wrap_client_error(exc, "CloudWatch Logs filter_log_events failed") from exc
+
+    def _iter_filtered_event_pages(self, kwargs: dict[str, Any]) -> Iterator[list[dict[str, Any]]]:
+        pages = self._iter_pages(self._logs, "filter_log_events", prefetch_pages=False, **kwargs)
+        for page in pages:
+            yield sorted(page.get("events", []), key=_event_order)
+
+    def tail(
+        self,
+        log_group_name: str,
+        filter_pattern: str = "",
+        log_stream_name: str | None = None,
+        cursor: LogTailCursor | None = None,
+        cursor_path: Path | str | None = None,
+        start_time: datetime | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        lookback: float = 60.0,
+        max_polls: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Follow a log group and yield each new event once.
+
+        The group is searched with FilterLogEvents from shortly before the
+        newest event seen (``lookback`` seconds, to catch late-ingested events)
+        and every event is checked against the per-stream :class:`LogTailCursor`.
+        With ``log_stream_name`` the stream is read through GetLogEvents and
+        the cursor keeps its ``nextForwardToken`` instead; GetLogEvents cannot
+        filter, so combining it with ``filter_pattern`` raises ValueError.
+
+        The poll interval starts at ``min_interval``, grows by half while polls
+        come back empty (up to ``max_interval``) and resets after new events.
+        Pass ``cursor`` or ``cursor_path`` to resume an earlier tail; with
+        ``cursor_path`` the cursor is loaded from that file if it exists and
+        saved once every event of a poll has been consumed. An event is
+        recorded in the cursor only after the caller has taken it, so a tail
+        that stops part-way through a poll delivers the rest again when
+        resumed (at-least-once). Without a cursor the tail
+        starts at ``start_time`` (default: now). ``max_polls`` stops the tail
+        after that many polls.
+        """
+        if log_stream_name and filter_pattern:
+            raise ValueError("filter_pattern cannot be combined with log_stream_name")
+        if cursor is None and cursor_path is not None and Path(cursor_path).expanduser().exists():
+            cursor = LogTailCursor.load(cursor_path)
+        if cursor is None:
+            cursor = LogTailCursor(log_group_name, _to_millis(start_time or datetime.now(UTC)))
+        elif cursor.log_group_name != log_group_name:
+            raise ValueError(
+                f"cursor belongs to log group {cursor.log_group_name!r}, not {log_group_name!r}"
+            )
+        lookback_ms = int(lookback * 1000)
+        interval = min_interval
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if polls:
+                time.sleep(interval)
+            polls += 1
+            forward_token = None
+            if log_stream_name:
+                events, forward_token = self._poll_stream(cursor, log_group_name, log_stream_name)
+            else:
+                since = max(cursor.start_time, cursor.latest_timestamp() - lookback_ms)
+                events = [
+                    event
+                    for event in self.iter_filter_log_events(
+                        log_group_name, filter_pattern, start_time=_from_millis(since)
+                    )
+                    if cursor.is_new(event)
+                ]
+                cursor.prune(since)
+            for event in events:
+                yield event
+                cursor.advance(event)
+            if log_stream_name and forward_token:
+                position = cursor.streams.setdefault(log_stream_name, LogStreamPosition())
+                position.forward_token = forward_token
+            if events and cursor_path is not None:
+                cursor.save(cursor_path)
+            interval = min_interval if events else min(interval * 1.5, max_interval)
+
+    def _poll_stream(
+        self, cursor: LogTailCursor, log_group_name: str, log_stream_name: str
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Read a stream from the cursor's token; the cursor itself is left untouched."""
+        position = cursor.streams.get(log_stream_name)
+        forward_token = position.forward_token if position else None
+        events: list[dict[str, Any]] = []
+        for page_events, token in self._iter_stream_pages(
+            log_group_name,
+            log_stream_name,
+            start_time=None if forward_token else cursor.start_time,
+            next_token=forward_token,
+        ):
+            events.extend(dict(e, logStreamName=log_stream_name) for e in page_events)
+            forward_token = token
+        return events, forward_token
+
+    def _iter_stream_pages(
+        self,
+        log_group_name: str,
+        log_stream_name: str,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        next_token: str | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[tuple[list[dict[str, Any]], str]]:
+        """
+        Page forward through one stream with GetLogEvents.
+
+        Yields ``(events, next_forward_token)`` per page and stops once the
+        service hands back the token it was given, which marks the end of the
+        stream as it stands now.
+        """
         kwargs: dict[str, Any] = {
             "logGroupName": log_group_name,
-            "filterPattern": filter_pattern,
-            "limit": limit,
+            "logStreamName": log_stream_name,
+            "startFromHead": True,
+        }
+        if start_time is not None:
+            kwargs["startTime"] = start_time
+        if end_time is not None:
+            kwargs["endTime"] = end_time
+        if page_size is not None:
+            kwargs["limit"] = page_size
+        while True:
+            if next_token:
+                kwargs["nextToken"] = next_token
+            try:
+                resp = self._logs.get_log_events(**kwargs)
+            except ClientError as exc:
+                code = exc.response.get("Error", {}).get("Code", "")
+                if code == "ResourceNotFoundException":
+                    raise ResourceNotFoundError("CloudWatch Log Stream", log_stream_name) from exc
+                raise self._wrap_client_error(exc, "CloudWatch Logs get_log_events failed") from exc
+            token = resp.get("nextForwardToken")
+            events = resp.get("events", [])
+            if events or token != next_token:
+                yield events, token
+            if not token or token == next_token:
+                return
+            next_token = token
+
+    # ── Logs Insights ─────────────────────────────────────────────────────────
+
+    def run_insights_query(
+        self,
+        query_string: str,
+        log_group_names: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        limit: int | None = None,
+        max_concurrent_queries: int = _MAX_CONCURRENT_INSIGHTS_QUERIES,
+        partial_results: bool = False,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        timeout: float = 900,
+    ) -> Iterator[dict[str, str]]:
+        """
+        Run a Logs Insights query over any number of log groups and stream its rows.
+
+        Log groups are split into queries of up to 50 groups each. Queries wait
+        in a local queue so no more than ``max_concurrent_queries`` run at once,
+        and a start rejected by the account-level limit is retried later. All
+        running queries are polled in one loop whose interval starts at
+        ``poll_interval`` and doubles (up to ``max_poll_interval``) while no
+        query returns new rows or finishes.
+
+        Rows are yielded as ``{field: value}`` dicts once their query is
+        complete. With ``partial_results=True`` the rows of queries that
+        neither aggregate nor sort are yielded as soon as they appear;
+        ``stats``, ``sort``, ``dedup``, ``pattern`` and ``diff`` queries revise
+        their partial rows, so theirs still wait for completion. A query that fails, or a run that exceeds
+        ``timeout`` seconds, raises AWSAPIError; queries still running when the
+        generator is closed are stopped.
+        """
+        if max_concurrent_queries < 1:
+            raise ValueError("max_concurrent_queries must be at least 1")
+        groups = list(dict.fromkeys(log_group_names))
+        if not groups:
+            raise ValueError("at least one log group is required")
+        queue = deque(
+            groups[i : i + _MAX_INSIGHTS_LOG_GROUPS]
+            for i in range(0, len(groups), _MAX_INSIGHTS_LOG_GROUPS)
+        )
+        stream_partial = partial_results and not _INSIGHTS_REVISING_RE.search(query_string)
+        running: dict[str, int] = {}
+        deadline = time.monotonic() + timeout
+        delay = poll_interval
+        try:
+            while queue or running:
+                while queue and len(running) < max_concurrent_queries:
+                    query_id = self._start_insights_query(
+                        query_string, queue[0], start_time, end_time, limit
+                    )
+                    if query_id is None:
+                        break
+                    queue.popleft()
+                    running[query_id] = 0
+                time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                progressed = False
+                for query_id in list(running):
+                    resp = self._get_insights_results(query_id)
+                    status = resp.get("status", "Unknown")
+                    if status in _INSIGHTS_FAILED_STATUSES:
+                        del running[query_id]
+                        raise AWSAPIError(
+                            f"CloudWatch Logs Insights query {query_id} ended with status {status}",
+                            details={"query_id": query_id, "status": status},
+                        )
+                    complete = status == "Complete"
+                    rows = resp.get("results", [])
+                    yielded = running[query_id]
+                    if (stream_partial or complete) and len(rows) > yielded:
+                        running[query_id] = len(rows)
+                        progressed = True
+                        for row in rows[yielded:]:
+                            yield _insights_row(row)
+                    if complete:
+                        del running[query_id]
+                        progressed = True
+                delay = poll_interval if progressed else min(delay * 2, max_poll_interval)
+                if (queue or running) and time.monotonic() >= deadline:
+                    raise AWSAPIError(
+                        f"CloudWatch Logs Insights queries did not finish within {timeout}s",
+                        details={"running_queries": list(running), "queued_queries": len(queue)},
+                    )
+        finally:
+            for query_id in running:
+                try:
+                    self._logs.stop_query(queryId=query_id)
+                except ClientError:
+                    pass
+
+    def _start_insights_query(
+        self,
+        query_string: str,
+        log_group_names: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        limit: int | None,
+    ) -> str | None:
+        """Start one query; returns None when the concurrent-query limit is reached."""
+        kwargs: dict[str, Any] = {
+            "logGroupNames": log_group_names,
+            "startTime": int(start_time.timestamp()),
+            "endTime": int(end_time.timestamp()),
+            "queryString": query_string,
         }
-        if start_time:
-            kwargs["startTime"] = int(start_time.timestamp() * 1000)
-        if end_time:
-            kwargs["endTime"] = int(end_time.timestamp() * 1000)
+        if limit is not None:
+            kwargs["limit"] = limit
         try:
-            resp = self._logs.filter_log_events(**kwargs)
+            resp = self._logs.start_query(**kwargs)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
+            if code == "LimitExceededException":
+                return None
             if code == "ResourceNotFoundException":
-                raise ResourceNotFoundError("CloudWatch Log Group", log_group_name) from exc
-            raise self._wrap_client_error(exc, "CloudWatch Logs filter_log_events failed") from exc
-        return resp.get("events", [])
+                raise ResourceNotFoundError("CloudWatch Log Group", ", ".join(log_group_names)) from exc
+            raise self._wrap_client_error(exc, "CloudWatch Logs start_query failed") from exc
+        query_id: str = resp["queryId"]
+        return query_id
+
+    def _get_insights_results(self, query_id: str) -> dict[str, Any]:
+        try:
+            resp: dict[str, Any] = self._logs.get_query_results(queryId=query_id)
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "CloudWatch Logs get_query_results failed") from exc
+        return resp
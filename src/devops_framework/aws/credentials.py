@@ -0,0 +1,189 @@
+"""STS AssumeRole credential cache with optional on-disk persistence."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import boto3
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+from botocore.exceptions import BotoCoreError, ClientError
+
+from devops_framework.core.exceptions import AWSAuthError
+
+# botocore starts refreshing 15 minutes before expiry; hand out nothing fresher.
+_REFRESH_MARGIN = timedelta(minutes=15)
+_DEFAULT_DURATION = 3600
+
+
+class AssumeRoleCredentialCache:
+    """
+    Cache of temporary credentials returned by ``sts:AssumeRole``.
+
+    Credentials are kept in memory and reused until they come within
+    ``refresh_margin`` of expiry. When ``cache_dir`` is set they are also
+    written there as JSON (mode 0600), so separate CLI processes share one
+    AssumeRole call per role. Concurrent requests for the same role in one
+    process wait on a single STS call.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        refresh_margin: timedelta = _REFRESH_MARGIN,
+        duration_seconds: int = _DEFAULT_DURATION,
+    ) -> None:
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._refresh_margin = refresh_margin
+        self._duration = duration_seconds
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._entries: dict[str, dict[str, str]] = {}
+
+    @property
+    def cache_dir(self) -> Path | None:
+        return self._cache_dir
+
+    def get(
+        self,
+        role_arn: str,
+        sts_client: Any,
+        session_name: str = "devops-framework",
+        source_profile: str | None = None,
+    ) -> dict[str, str]:
+        """
+        Return credential metadata for ``role_arn``, assuming the role if needed.
+
+        ``sts_client`` is an STS client holding the source credentials and
+        ``source_profile`` names them, so different sources never share entries.
+        The returned dict has the ``access_key``/``secret_key``/``token``/
+        ``expiry_time`` keys expected by botocore's ``RefreshableCredentials``.
+        """
+        key = self._cache_key(role_arn, session_name, source_profile)
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None or not self._is_fresh(entry):
+                entry = self._load(key)
+                if entry is None or not self._is_fresh(entry):
+                    entry = self._assume(role_arn, sts_client, session_name)
+                    self._store(key, entry)
+                self._entries[key] = entry
+            return entry
+
+    def clear(self) -> None:
+        """Forget all in-memory credentials (on-disk files are left in place)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _cache_key(role_arn: str, session_name: str, profile: str | None) -> str:
+        raw = f"{role_arn}|{session_name}|{profile or ''}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _is_fresh(self, entry: dict[str, str]) -> bool:
+        expiry = datetime.fromisoformat(entry["expiry_time"])
+        return expiry - datetime.now(UTC) > self._refresh_margin
+
+    def _assume(self, role_arn: str, sts_client: Any, session_name: str) -> dict[str, str]:
+        try:
+            resp = sts_client.assume_role(
+                RoleArn=role_arn,
+                RoleSessionName=session_name,
+                DurationSeconds=self._duration,
+            )
+        except ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code", "Unknown")
+            raise AWSAuthError(
+                f"Failed to assume role {role_arn}: [{code}] {exc}",
+                details={"role_arn": role_arn, "error_code": code},
+            ) from exc
+        except BotoCoreError as exc:
+            raise AWSAuthError(f"Failed to assume role {role_arn}: {exc}") from exc
+        creds = resp["Credentials"]
+        return {
+            "access_key": creds["AccessKeyId"],
+            "secret_key": creds["SecretAccessKey"],
+            "token": creds["SessionToken"],
+            "expiry_time": creds["Expiration"].astimezone(UTC).isoformat(),
+        }
+
+    def _load(self, key: str) -> dict[str, str] | None:
+        if self._cache_dir is None:
+            return None
+        try:
+            with (self._cache_dir / f"{key}.json").open() as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or "expiry_time" not in data:
+            return None
+        return data
+
+    def _store(self, key: str, entry: dict[str, str]) -> None:
+        if self._cache_dir is None:
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(entry, fh)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self._cache_dir / f"{key}.json")
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+
+_CACHES: dict[Path | None, AssumeRoleCredentialCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_credential_cache(cache_dir: Path | str | None = None) -> AssumeRoleCredentialCache:
+    """Return the process-wide credential cache for ``cache_dir`` (None = memory only)."""
+    path = Path(cache_dir).expanduser() if cache_dir else None
+    with _CACHES_LOCK:
+        cache = _CACHES.get(path)
+        if cache is None:
+            cache = _CACHES[path] = AssumeRoleCredentialCache(path)
+        return cache
+
+
+def assume_role_session(
+    role_arn: str,
+    region: str,
+    sts_client: Any,
+    cache: AssumeRoleCredentialCache,
+    session_name: str = "devops-framework",
+    source_profile: str | None = None,
+) -> boto3.Session:
+    """
+    Build a boto3 session whose credentials come from assuming ``role_arn``.
+
+    The credentials refresh themselves through ``cache`` shortly before they
+    expire, so long-lived pooled clients never see an expired token.
+    """
+
+    def _refresh() -> dict[str, Any]:
+        return dict(cache.get(role_arn, sts_client, session_name, source_profile))
+
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=_refresh(),
+        refresh_using=_refresh,
+        method="assume-role",
+    )
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = credentials
+    return boto3.Session(botocore_session=botocore_session, region_name=region)
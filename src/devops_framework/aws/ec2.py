@@ -2,18 +2,44 @@
 
 from __future__ import annotations
 
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
 from functools import cached_property
+from itertools import islice
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from devops_framework.aws.base import AWSBaseClient
+from devops_framework.aws.records import EC2InstanceRecord, project_columns
+from devops_framework.core.concurrency import DEFAULT_MAX_WORKERS, BatchLoader, fan_out
 from devops_framework.core.exceptions import AWSAPIError, ResourceNotFoundError
 
+# DescribeInstanceStatus accepts at most 100 instance IDs per request.
+_STATUS_BATCH_SIZE = 100
+_STATE_CHANGE_BATCH_SIZE = 100
+_DESCRIBE_BATCH_SIZE = 1000
+_MISSING_ID_CODES = frozenset({"InvalidInstanceID.NotFound", "InvalidInstanceID.Malformed"})
+# StopInstances/StartInstances reject the whole call when one instance is in the wrong state.
+_STATE_CHANGE_DROP_CODES = _MISSING_ID_CODES | {"IncorrectInstanceState"}
+_FINAL_STATES = frozenset({"terminated", "shutting-down"})
+
+
+def _chunks(ids: list[str], size: int) -> list[list[str]]:
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+
+def _ids_in_message(message: str, ids: Iterable[str]) -> set[str]:
+    """Return the IDs from ``ids`` that an EC2 error message names, quoted or not."""
+    return {i for i in ids if re.search(rf"(?<![\w-]){re.escape(i)}(?![\w-])", message)}
+
 
 class EC2Client(AWSBaseClient):
     """Client for EC2 operations."""
 
+    _instance_loader: BatchLoader[str, dict[str, Any]] | None = None
+
     @cached_property
     def _ec2(self) -> Any:
         return self._boto_client("ec2")
@@ -28,32 +54,130 @@ class EC2Client(AWSBaseClient):
 
         Returns a flat list of instance dicts (not reservation wrappers).
         """
+        return list(self.iter_instances(filters, instance_ids, prefetch=False))
+
+    def iter_instances(
+        self,
+        filters: list[dict[str, Any]] | None = None,
+        instance_ids: list[str] | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        parse_timestamps: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield EC2 instances page by page.
+
+        Pagination stops once ``max_items`` instances have been yielded; otherwise,
+        with ``prefetch``, the next page is fetched while the caller handles the current one.
+        ``parse_timestamps=False`` leaves timestamps such as ``LaunchTime`` as strings.
+        """
         kwargs: dict[str, Any] = {}
         if filters:
             kwargs["Filters"] = filters
         if instance_ids:
             kwargs["InstanceIds"] = instance_ids
 
-        instances: list[dict[str, Any]] = []
+        ec2 = self._ec2 if parse_timestamps else self._boto_client("ec2", parse_timestamps=False)
+        pages = self._iter_pages(
+            ec2, "describe_instances", prefetch and max_items is None, **kwargs
+        )
+        instances = (
+            instance
+            for page in pages
+            for reservation in page.get("Reservations", [])
+            for instance in reservation.get("Instances", [])
+        )
         try:
-            paginator = self._ec2.get_paginator("describe_instances")
-            for page in paginator.paginate(**kwargs):
-                for reservation in page.get("Reservations", []):
-                    instances.extend(reservation.get("Instances", []))
+            yield from islice(instances, max_items)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code == "InvalidInstanceID.NotFound":
-                return []
+                return
             raise self._wrap_client_error(exc, "EC2 describe_instances failed") from exc
-        return instances
+
+    def list_instance_records(
+        self,
+        filters: list[dict[str, Any]] | None = None,
+        instance_ids: list[str] | None = None,
+        parse_timestamps: bool = True,
+    ) -> list[EC2InstanceRecord]:
+        """List instances as compact slotted records instead of full API dicts."""
+        return [
+            EC2InstanceRecord.from_api(inst)
+            for inst in self.iter_instances(
+                filters, instance_ids, prefetch=False, parse_timestamps=parse_timestamps
+            )
+        ]
+
+    def list_instance_columns(
+        self,
+        fields: list[str],
+        filters: list[dict[str, Any]] | None = None,
+        instance_ids: list[str] | None = None,
+        parse_timestamps: bool = True,
+    ) -> dict[str, list[Any]]:
+        """
+        List instances as column lists holding only ``fields``.
+
+        Fields are dotted paths such as ``"State.Name"`` or ``"tag:Name"``.
+        """
+        return project_columns(
+            self.iter_instances(filters, instance_ids, parse_timestamps=parse_timestamps), fields
+        )
 
     def get_instance(self, instance_id: str) -> dict[str, Any]:
         """Return a single instance dict or raise ResourceNotFoundError."""
+        if self._instance_loader is not None:
+            instance = self._instance_loader.load(instance_id)
+            if instance is None:
+                raise ResourceNotFoundError("EC2 Instance", instance_id)
+            return instance
         results = self.list_instances(instance_ids=[instance_id])
         if not results:
             raise ResourceNotFoundError("EC2 Instance", instance_id)
         return results[0]
 
+    def enable_coalescing(self, window: float = 0.005, max_batch_size: int = 100) -> None:
+        """
+        Batch concurrent :meth:`get_instance` calls into shared describe calls.
+
+        Lookups made within ``window`` seconds of each other, from any thread and
+        any EC2Client with the same region and credentials, are sent as one
+        ``describe_instances`` call of up to ``max_batch_size`` IDs. Concurrent
+        lookups of the same ID share one result.
+        """
+        self._instance_loader = self._shared_loader(
+            "get_instance", self._describe_instances_by_id, window, max_batch_size
+        )
+
+    def disable_coalescing(self) -> None:
+        """Send every :meth:`get_instance` call on its own again."""
+        self._instance_loader = None
+
+    def _describe_instances_by_id(self, instance_ids: list[str]) -> dict[str, dict[str, Any]]:
+        instances, _ = self._describe_instance_batch(instance_ids)
+        return {inst["InstanceId"]: inst for inst in instances or []}
+
+    def _describe_instance_batch(
+        self, instance_ids: list[str]
+    ) -> tuple[list[dict[str, Any]] | None, set[str]]:
+        """Describe ``instance_ids``, returning the instances found and the IDs that were not."""
+
+        def _describe(ids: list[str]) -> list[dict[str, Any]]:
+            return [
+                instance
+                for page in self._iter_pages(
+                    self._ec2, "describe_instances", prefetch_pages=False, InstanceIds=ids
+                )
+                for reservation in page.get("Reservations", [])
+                for instance in reservation.get("Instances", [])
+            ]
+
+        instances, missing = self._call_dropping_missing(
+            _describe, instance_ids, "describe_instances"
+        )
+        return instances, set(missing)
+
     def list_running_instances(self) -> list[dict[str, Any]]:
         """Return all instances in the 'running' state."""
         return self.list_instances(filters=[{"Name": "instance-state-name", "Values": ["running"]}])
@@ -72,6 +196,84 @@ class EC2Client(AWSBaseClient):
             raise ResourceNotFoundError("EC2 Instance", instance_id)
         return statuses[0]
 
+    def get_instance_statuses(
+        self,
+        instance_ids: Iterable[str],
+        include_all_instances: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Return status checks for many instances, keyed by instance ID.
+
+        IDs are de-duplicated, split into chunks of 100 (the API maximum) and the
+        chunks are fetched concurrently with full pagination. Instance IDs that do
+        not exist are left out of the result instead of failing their chunk.
+        """
+        ids = list(dict.fromkeys(instance_ids))
+        chunks = _chunks(ids, _STATUS_BATCH_SIZE)
+        statuses: dict[str, dict[str, Any]] = {}
+        for chunk_statuses in fan_out(
+            lambda chunk: self._describe_statuses(chunk, include_all_instances),
+            chunks,
+            max_workers=max_workers,
+        ):
+            for status in chunk_statuses:
+                statuses[status["InstanceId"]] = status
+        return statuses
+
+    def _describe_statuses(
+        self, instance_ids: list[str], include_all_instances: bool
+    ) -> list[dict[str, Any]]:
+        def _describe(ids: list[str]) -> list[dict[str, Any]]:
+            statuses: list[dict[str, Any]] = []
+            for page in self._iter_pages(
+                self._ec2,
+                "describe_instance_status",
+                prefetch_pages=False,
+                InstanceIds=ids,
+                IncludeAllInstances=include_all_instances,
+            ):
+                statuses.extend(page.get("InstanceStatuses", []))
+            return statuses
+
+        statuses, _ = self._call_dropping_missing(
+            _describe, instance_ids, "describe_instance_status"
+        )
+        return statuses or []
+
+    def _call_dropping_missing[T](
+        self,
+        call: Callable[[list[str]], T],
+        instance_ids: list[str],
+        operation: str,
+        drop_codes: frozenset[str] = _MISSING_ID_CODES,
+    ) -> tuple[T | None, dict[str, str]]:
+        """
+        Call ``call(ids)``, retrying without any IDs the API rejects individually.
+
+        IDs named in an error whose code is in ``drop_codes`` (by default: not
+        found or malformed) are dropped and the call is retried with the rest.
+        A single ID rejected with such a code is dropped even when the error
+        message does not name it. Returns the call result (None if every ID
+        was dropped) and the dropped IDs mapped to their error code.
+        """
+        pending = list(instance_ids)
+        dropped: dict[str, str] = {}
+        while pending:
+            try:
+                return call(pending), dropped
+            except ClientError as exc:
+                error = exc.response.get("Error", {})
+                code = error.get("Code", "")
+                reported = _ids_in_message(error.get("Message", ""), pending)
+                if code in drop_codes and len(pending) == 1:
+                    reported = set(pending)
+                if code not in drop_codes or not reported:
+                    raise self._wrap_client_error(exc, f"EC2 {operation} failed") from exc
+                dropped.update(dict.fromkeys(reported, code))
+                pending = [i for i in pending if i not in reported]
+        return None, dropped
+
     def stop_instance(self, instance_id: str) -> dict[str, Any]:
         """Stop an EC2 instance. Returns the StoppingInstances response."""
         try:
@@ -93,3 +295,158 @@ class EC2Client(AWSBaseClient):
         if not starting:
             raise AWSAPIError(f"start_instances returned empty response for {instance_id}")
         return starting[0]
+
+    def stop_instances(
+        self,
+        instance_ids: Iterable[str] | None = None,
+        filters: list[dict[str, Any]] | None = None,
+        wait: bool = True,
+        timeout: float = 600,
+        poll_interval: float = 15,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Stop a fleet of instances and optionally wait until they are ``stopped``.
+
+        See :meth:`start_instances` for the arguments and the report format.
+        """
+        return self._change_fleet_state(
+            "stop_instances",
+            "StoppingInstances",
+            target_state="stopped",
+            instance_ids=instance_ids,
+            filters=filters,
+            wait=wait,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_workers=max_workers,
+        )
+
+    def start_instances(
+        self,
+        instance_ids: Iterable[str] | None = None,
+        filters: list[dict[str, Any]] | None = None,
+        wait: bool = True,
+        timeout: float = 600,
+        poll_interval: float = 15,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Start a fleet of instances and optionally wait until they are ``running``.
+
+        Instances are selected by ``instance_ids`` and/or ``filters``. API calls
+        are batched 100 IDs at a time and sent concurrently. With ``wait`` the
+        whole fleet is tracked with one batched ``describe_instances`` sweep every
+        ``poll_interval`` seconds until every instance settles or ``timeout``
+        expires.
+
+        Returns a per-instance report: ``{instance_id: {"InstanceId",
+        "PreviousState", "CurrentState", "Completed", "Error"}}``.
+        """
+        return self._change_fleet_state(
+            "start_instances",
+            "StartingInstances",
+            target_state="running",
+            instance_ids=instance_ids,
+            filters=filters,
+            wait=wait,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_workers=max_workers,
+        )
+
+    def _change_fleet_state(
+        self,
+        operation: str,
+        result_key: str,
+        target_state: str,
+        instance_ids: Iterable[str] | None,
+        filters: list[dict[str, Any]] | None,
+        wait: bool,
+        timeout: float,
+        poll_interval: float,
+        max_workers: int,
+    ) -> dict[str, dict[str, Any]]:
+        ids = list(dict.fromkeys(instance_ids or []))
+        if filters:
+            # Terminated instances stay visible for a while but can never change state.
+            ids = [
+                inst["InstanceId"]
+                for inst in self.iter_instances(filters=filters, instance_ids=ids or None)
+                if inst.get("State", {}).get("Name") not in _FINAL_STATES
+            ]
+        report: dict[str, dict[str, Any]] = {
+            i: {
+                "InstanceId": i,
+                "PreviousState": None,
+                "CurrentState": None,
+                "Completed": False,
+                "Error": None,
+            }
+            for i in ids
+        }
+
+        def _change(chunk: list[str]) -> tuple[list[dict[str, Any]] | None, dict[str, str]]:
+            call = getattr(self._ec2, operation)
+            return self._call_dropping_missing(
+                lambda batch: call(InstanceIds=batch).get(result_key, []),
+                chunk,
+                operation,
+                drop_codes=_STATE_CHANGE_DROP_CODES,
+            )
+
+        chunks = _chunks(ids, _STATE_CHANGE_BATCH_SIZE)
+        outcomes = fan_out(_change, chunks, max_workers, return_exceptions=True)
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                for i in chunk:
+                    report[i]["Error"] = str(outcome)
+                continue
+            changes, dropped = outcome
+            for i, code in dropped.items():
+                report[i]["Error"] = (
+                    "instance not found"
+                    if code in _MISSING_ID_CODES
+                    else f"instance is not in a state that allows {operation}"
+                )
+            for change in changes or []:
+                entry = report[change["InstanceId"]]
+                entry["PreviousState"] = change.get("PreviousState", {}).get("Name")
+                entry["CurrentState"] = change.get("CurrentState", {}).get("Name")
+                entry["Completed"] = entry["CurrentState"] == target_state
+
+        if wait:
+            self._wait_for_fleet(report, target_state, timeout, poll_interval, max_workers)
+        return report
+
+    def _wait_for_fleet(
+        self,
+        report: dict[str, dict[str, Any]],
+        target_state: str,
+        timeout: float,
+        poll_interval: float,
+        max_workers: int,
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        pending = [
+            i for i, entry in report.items() if not entry["Completed"] and not entry["Error"]
+        ]
+        # IDs not visible yet (eventual consistency) stay pending and are retried on every poll.
+        not_found: set[str] = set()
+        while pending and time.monotonic() < deadline:
+            time.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+            chunks = _chunks(pending, _DESCRIBE_BATCH_SIZE)
+            not_found = set()
+            for instances, missing in fan_out(
+                self._describe_instance_batch, chunks, max_workers=max_workers
+            ):
+                not_found |= missing
+                for inst in instances or []:
+                    entry = report[inst["InstanceId"]]
+                    state = entry["CurrentState"] = inst.get("State", {}).get("Name")
+                    entry["Completed"] = state == target_state
+                    if state in _FINAL_STATES and not entry["Completed"]:
+                        entry["Error"] = f"instance entered {state} state"
+            pending = [i for i in pending if not report[i]["Completed"] and not report[i]["Error"]]
+        for i in not_found.intersection(pending):
+            report[i]["Error"] = "instance not found"
@@ -0,0 +1,212 @@
+"""Parse RDS Enhanced Monitoring (``RDSOSMetrics``) log events into NumPy series."""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.core.concurrency import DEFAULT_MAX_WORKERS
+from devops_framework.core.logging import get_logger
+
+OS_METRICS_LOG_GROUP = "RDSOSMetrics"
+
+_CPU_FIELDS = ("total", "user", "system", "wait", "idle", "steal", "irq", "nice", "guest")
+_MEMORY_FIELDS = ("total", "free", "active", "inactive", "cached", "buffers", "dirty", "writeback")
+# Disk rates are summed over devices; utilisation, latency and queue length take the busiest device.
+_DISK_SUM_FIELDS = ("readIOsPS", "writeIOsPS", "readKbPS", "writeKbPS", "tps")
+_DISK_MAX_FIELDS = ("util", "await", "avgQueueLen")
+
+_logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class OSMetricsSeries:
+    """
+    Enhanced Monitoring samples of one DB instance as NumPy arrays.
+
+    Every array is aligned with ``timestamps``. ``cpu``, ``memory`` and
+    ``disk_io`` map Enhanced Monitoring field names to float64 arrays (NaN
+    where a sample lacks the field). ``processes`` maps process names to their
+    ``cpuUsedPc``, NaN in samples where the process was not among the top
+    processes by CPU.
+    """
+
+    resource_id: str
+    instance_id: str
+    engine: str
+    timestamps: np.ndarray  # datetime64[s]
+    cpu: dict[str, np.ndarray] = field(default_factory=dict)
+    memory: dict[str, np.ndarray] = field(default_factory=dict)
+    disk_io: dict[str, np.ndarray] = field(default_factory=dict)
+    processes: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class _SeriesBuilder:
+    """Append-only column buffers for one instance; no JSON document is kept."""
+
+    __slots__ = (
+        "resource_id",
+        "instance_id",
+        "engine",
+        "timestamps",
+        "columns",
+        "processes",
+        "size",
+    )
+
+    def __init__(self, resource_id: str) -> None:
+        self.resource_id = resource_id
+        self.instance_id = ""
+        self.engine = ""
+        self.timestamps = array("q")
+        self.columns: dict[str, array[float]] = {
+            name: array("d")
+            for name in (
+                *(f"cpu.{f}" for f in _CPU_FIELDS),
+                *(f"memory.{f}" for f in _MEMORY_FIELDS),
+                *(f"disk.{f}" for f in (*_DISK_SUM_FIELDS, *_DISK_MAX_FIELDS)),
+            )
+        }
+        self.processes: dict[str, array[float]] = {}
+        self.size = 0
+
+    def add(self, timestamp: int, doc: Mapping[str, Any], top_processes: int) -> None:
+        self.instance_id = doc.get("instanceID", self.instance_id)
+        self.engine = doc.get("engine", self.engine)
+        self.timestamps.append(timestamp)
+        cpu = doc.get("cpuUtilization") or {}
+        for name in _CPU_FIELDS:
+            self.columns[f"cpu.{name}"].append(_number(cpu.get(name)))
+        memory = doc.get("memory") or {}
+        for name in _MEMORY_FIELDS:
+            self.columns[f"memory.{name}"].append(_number(memory.get(name)))
+        devices = doc.get("diskIO") or []
+        for name in _DISK_SUM_FIELDS:
+            values = [v for v in (_number(d.get(name)) for d in devices) if not math.isnan(v)]
+            self.columns[f"disk.{name}"].append(math.fsum(values) if values else math.nan)
+        for name in _DISK_MAX_FIELDS:
+            values = [v for v in (_number(d.get(name)) for d in devices) if not math.isnan(v)]
+            self.columns[f"disk.{name}"].append(max(values) if values else math.nan)
+
+        by_name: dict[str, float] = {}
+        for process in doc.get("processList") or []:
+            used = _number(process.get("cpuUsedPc"))
+            if not math.isnan(used):
+                name = process.get("name", "")
+                by_name[name] = by_name.get(name, 0.0) + used
+        top = sorted(by_name.items(), key=lambda item: item[1], reverse=True)[:top_processes]
+        for name, used in top:
+            column = self.processes.get(name)
+            if column is None:
+                column = self.processes[name] = array("d", [math.nan]) * self.size
+            column.append(used)
+        self.size += 1
+        for column in self.processes.values():
+            if len(column) < self.size:
+                column.append(math.nan)
+
+    def build(self) -> OSMetricsSeries:
+        def _group(prefix: str) -> dict[str, np.ndarray]:
+            return {
+                name[len(prefix) :]: np.array(values, dtype="float64")
+                for name, values in self.columns.items()
+                if name.startswith(prefix)
+            }
+
+        return OSMetricsSeries(
+            resource_id=self.resource_id,
+            instance_id=self.instance_id,
+            engine=self.engine,
+            timestamps=np.asarray(self.timestamps, dtype="int64").astype("datetime64[s]"),
+            cpu=_group("cpu."),
+            memory=_group("memory."),
+            disk_io=_group("disk."),
+            processes={
+                name: np.array(values, dtype="float64") for name, values in self.processes.items()
+            },
+        )
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def parse_os_metrics(
+    events: Iterable[Mapping[str, Any]], top_processes: int = 5
+) -> dict[str, OSMetricsSeries]:
+    """
+    Turn ``RDSOSMetrics`` log events into one :class:`OSMetricsSeries` per instance.
+
+    ``events`` are CloudWatch Logs events whose ``message`` is an Enhanced
+    Monitoring JSON document; they are consumed one at a time and only the
+    extracted numbers are kept. Series are keyed by the instance's
+    ``DbiResourceId`` (the log stream name). For each sample the
+    ``top_processes`` process names with the highest summed ``cpuUsedPc`` are
+    recorded. Messages that are not valid JSON are skipped.
+    """
+    builders: dict[str, _SeriesBuilder] = {}
+    for event in events:
+        try:
+            doc = json.loads(event["message"])
+        except (KeyError, TypeError, ValueError):
+            _logger.debug(
+                "Skipping malformed RDSOSMetrics event", extra={"event_id": event.get("eventId")}
+            )
+            continue
+        resource_id = doc.get("instanceResourceID") or event.get("logStreamName", "")
+        builder = builders.get(resource_id)
+        if builder is None:
+            builder = builders[resource_id] = _SeriesBuilder(resource_id)
+        builder.add(int(event["timestamp"]) // 1000, doc, top_processes)
+    return {resource_id: builder.build() for resource_id, builder in builders.items()}
+
+
+def get_os_metrics(
+    client: CloudWatchClient,
+    resource_ids: Iterable[str] | None,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    top_processes: int = 5,
+    log_group_name: str = OS_METRICS_LOG_GROUP,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[str, OSMetricsSeries]:
+    """
+    Fetch and parse Enhanced Monitoring samples for many DB instances at once.
+
+    ``resource_ids`` are ``DbiResourceId`` values (see
+    :meth:`RDSClient.list_instances`), which name the instances' streams in
+    ``log_group_name``; None reads every instance with samples in the window.
+    The streams are read concurrently through
+    :meth:`CloudWatchClient.iter_merged_log_events` and parsed as the pages
+    arrive, so memory holds a couple of pages per stream plus the parsed
+    arrays. Instances without samples in the window are left out.
+    """
+    active = [
+        stream["logStreamName"]
+        for stream in client.iter_active_log_streams(log_group_name, start_time, end_time)
+    ]
+    if resource_ids is not None:
+        wanted = set(resource_ids)
+        active = [name for name in active if name in wanted]
+    events = client.iter_merged_log_events(
+        log_group_name,
+        start_time,
+        end_time,
+        log_stream_names=active,
+        max_workers=max_workers,
+    )
+    return parse_os_metrics(events, top_processes=top_processes)
@@ -4,14 +4,64 @@ from __future__ import annotations
 
 import base64
 import json
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from functools import cached_property
+from itertools import islice
 from typing import Any
 
+import numpy as np
 from botocore.exceptions import ClientError
 
 from devops_framework.aws.base import AWSBaseClient
+from devops_framework.aws.records import LambdaFunctionRecord, project_columns
+from devops_framework.core.concurrency import DEFAULT_MAX_WORKERS, AdaptiveLimiter, fan_out
 from devops_framework.core.exceptions import AWSAPIError, ResourceNotFoundError
 
+_THROTTLE_CODES = frozenset({"TooManyRequestsException", "ThrottlingException"})
+_REPORT_FIELDS = {
+    "Duration": "duration_ms",
+    "Billed Duration": "billed_duration_ms",
+    "Memory Size": "memory_size_mb",
+    "Max Memory Used": "max_memory_used_mb",
+    "Init Duration": "init_duration_ms",
+    "Restore Duration": "restore_duration_ms",
+    "Billed Restore Duration": "billed_restore_duration_ms",
+}
+# Fields are tab-separated; anchoring on the tab keeps "Duration" from matching inside
+# SnapStart's "Restore Duration" and "Billed Restore Duration".
+_REPORT_RE = re.compile(rf"(?:^|\t)({'|'.join(map(re.escape, _REPORT_FIELDS))}): ([\d.]+)")
+_PERCENTILES = (50, 90, 99)
+
+
+def parse_report_line(log: str) -> dict[str, float] | None:
+    """
+    Parse the ``REPORT`` line of a Lambda execution log tail.
+
+    Returns ``duration_ms``, ``billed_duration_ms``, ``memory_size_mb`` and
+    ``max_memory_used_mb``, plus ``init_duration_ms`` for cold starts and
+    ``restore_duration_ms``/``billed_restore_duration_ms`` for SnapStart
+    restores, or None when the log holds no REPORT line.
+    """
+    for line in reversed(log.splitlines()):
+        if line.startswith("REPORT "):
+            return {_REPORT_FIELDS[name]: float(value) for name, value in _REPORT_RE.findall(line)}
+    return None
+
+
+def _summary(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    data = np.asarray(values, dtype="float64")
+    summary = {f"p{p}": float(v) for p, v in zip(_PERCENTILES, np.percentile(data, _PERCENTILES))}
+    summary["mean"] = float(data.mean())
+    summary["max"] = float(data.max())
+    return summary
+
 
 class LambdaClient(AWSBaseClient):
     """Client for AWS Lambda operations."""
@@ -20,16 +70,102 @@ class LambdaClient(AWSBaseClient):
     def _lambda(self) -> Any:
         return self._boto_client("lambda")
 
+    @cached_property
+    def _enrichment_cache(self) -> dict[str, tuple[tuple[str | None, str | None], dict[str, Any]]]:
+        return {}
+
     def list_functions(self) -> list[dict[str, Any]]:
         """Return all Lambda functions in the configured region."""
-        functions: list[dict[str, Any]] = []
+        return list(self.iter_functions(prefetch=False))
+
+    def iter_functions(
+        self, max_items: int | None = None, prefetch: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Yield Lambda functions page by page, stopping after ``max_items``."""
+        pages = self._iter_pages(self._lambda, "list_functions", prefetch and max_items is None)
         try:
-            paginator = self._lambda.get_paginator("list_functions")
-            for page in paginator.paginate():
-                functions.extend(page.get("Functions", []))
+            yield from islice((fn for page in pages for fn in page.get("Functions", [])), max_items)
         except ClientError as exc:
             raise self._wrap_client_error(exc, "Lambda list_functions failed") from exc
-        return functions
+
+    def list_function_records(self) -> list[LambdaFunctionRecord]:
+        """List functions as compact slotted records instead of full API dicts."""
+        return [LambdaFunctionRecord.from_api(fn) for fn in self.iter_functions(prefetch=False)]
+
+    def list_function_columns(self, fields: list[str]) -> dict[str, list[Any]]:
+        """List functions as column lists holding only ``fields`` (dotted paths)."""
+        return project_columns(self.iter_functions(), fields)
+
+    def list_functions_enriched(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        force: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Return every function's configuration with its tags, reserved concurrency and aliases.
+
+        Details come from one ``get_function`` and one ``list_aliases`` call per
+        function, run concurrently on ``max_workers`` threads. Results are cached
+        on this client keyed by ``CodeSha256`` and ``RevisionId``, so a later
+        call only fetches functions whose code or configuration changed; pass
+        ``force`` to refetch everything (tags, concurrency and aliases can change
+        without a new revision). Each item adds ``Tags``,
+        ``ReservedConcurrentExecutions`` and ``Aliases`` to the summary, or
+        ``EnrichmentError`` if its details could not be fetched.
+        """
+        functions = list(self.iter_functions())
+        cache = self._enrichment_cache
+        stale = [
+            fn
+            for fn in functions
+            if force
+            or cache.get(fn["FunctionArn"], ((None, None), {}))[0]
+            != (fn.get("CodeSha256"), fn.get("RevisionId"))
+        ]
+        details = fan_out(
+            self._function_details, stale, max_workers=max_workers, return_exceptions=True
+        )
+        deleted: set[str] = set()
+        for fn, detail in zip(stale, details):
+            arn = fn["FunctionArn"]
+            if isinstance(detail, ResourceNotFoundError):
+                deleted.add(arn)
+                continue
+            if isinstance(detail, Exception):
+                detail = {"EnrichmentError": str(detail)}
+            else:
+                cache[arn] = ((fn.get("CodeSha256"), fn.get("RevisionId")), detail)
+            fn.update(detail)
+        stale_arns = {fn["FunctionArn"] for fn in stale}
+        merged = []
+        for fn in functions:
+            arn = fn["FunctionArn"]
+            if arn in deleted:
+                continue
+            if arn not in stale_arns:
+                fn.update(cache[arn][1])
+            merged.append(fn)
+        live = {fn["FunctionArn"] for fn in merged}
+        for arn in [a for a in cache if a not in live]:
+            del cache[arn]
+        return merged
+
+    def _function_details(self, function: dict[str, Any]) -> dict[str, Any]:
+        name = function["FunctionName"]
+        resp = self.get_function(name)
+        try:
+            pages = self._iter_pages(
+                self._lambda, "list_aliases", prefetch_pages=False, FunctionName=name
+            )
+            aliases = [alias for page in pages for alias in page.get("Aliases", [])]
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, f"Lambda list_aliases({name})") from exc
+        concurrency = resp.get("Concurrency", {})
+        return {
+            "Tags": resp.get("Tags", {}),
+            "ReservedConcurrentExecutions": concurrency.get("ReservedConcurrentExecutions"),
+            "Aliases": aliases,
+        }
 
     def get_function(self, function_name: str) -> dict[str, Any]:
         """Return the configuration + code location for a Lambda function."""
@@ -46,16 +182,21 @@ class LambdaClient(AWSBaseClient):
         function_name: str,
         payload: dict[str, Any] | None = None,
         invocation_type: str = "RequestResponse",
+        log_type: str = "None",
     ) -> dict[str, Any]:
         """
         Invoke a Lambda function and return the parsed response.
 
         ``invocation_type`` is one of ``RequestResponse`` (sync) or ``Event`` (async).
+        ``log_type="Tail"`` returns the last 4 KB of the execution log, decoded,
+        as ``LogResult`` (synchronous invocations only).
         """
         kwargs: dict[str, Any] = {
             "FunctionName": function_name,
             "InvocationType": invocation_type,
         }
+        if log_type != "None":
+            kwargs["LogType"] = log_type
         if payload is not None:
             kwargs["Payload"] = json.dumps(payload).encode()
 
@@ -90,6 +231,167 @@ class LambdaClient(AWSBaseClient):
 
         return result
 
+    def invoke_many(
+        self,
+        function_name: str,
+        payloads: Iterable[dict[str, Any] | None],
+        invocation_type: str = "RequestResponse",
+        max_concurrency: int = 50,
+        ordered: bool = True,
+        max_retries: int = 8,
+        return_exceptions: bool = False,
+    ) -> Iterator[tuple[int, dict[str, Any] | Exception]]:
+        """
+        Invoke a function once per payload with bounded, throttle-aware concurrency.
+
+        Yields ``(index, result)`` pairs, where ``index`` is the payload's
+        position and ``result`` is what :meth:`invoke` returns. With ``ordered``
+        results come in input order, otherwise as soon as each finishes.
+        ``payloads`` is consumed lazily, so it can be a generator over a large
+        backfill.
+
+        Up to ``max_concurrency`` invocations run at once. When Lambda answers
+        ``TooManyRequestsException`` the allowed concurrency is halved and the
+        invocation is retried with jittered backoff (up to ``max_retries``
+        times); it grows back by one per round of successful calls. A failing
+        invocation raises, or with ``return_exceptions`` is yielded as its
+        exception.
+        """
+        limiter = AdaptiveLimiter(max_concurrency)
+        window = max_concurrency * 2
+        items = enumerate(payloads)
+        pending: deque[tuple[int, Future[dict[str, Any]]]] = deque()
+
+        def _submit(executor: ThreadPoolExecutor) -> None:
+            for index, payload in islice(items, window - len(pending)):
+                future = executor.submit(
+                    self._invoke_throttled,
+                    function_name,
+                    payload,
+                    invocation_type,
+                    limiter,
+                    max_retries,
+                )
+                pending.append((index, future))
+
+        def _outcome(
+            index: int, future: Future[dict[str, Any]]
+        ) -> tuple[int, dict[str, Any] | Exception]:
+            exc = future.exception()
+            if exc is None:
+                return index, future.result()
+            if return_exceptions and isinstance(exc, Exception):
+                return index, exc
+            raise exc
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            _submit(executor)
+            while pending:
+                if ordered:
+                    wait([pending[0][1]])
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                    done = [entry for entry in pending if entry[1] in finished]
+                    for entry in done:
+                        pending.remove(entry)
+                _submit(executor)
+                for index, future in done:
+                    yield _outcome(index, future)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _invoke_throttled(
+        self,
+        function_name: str,
+        payload: dict[str, Any] | None,
+        invocation_type: str,
+        limiter: AdaptiveLimiter,
+        max_retries: int,
+    ) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                result = self.invoke(function_name, payload, invocation_type)
+            except Exception as exc:
+                throttled = (
+                    isinstance(exc, AWSAPIError)
+                    and exc.details.get("error_code") in _THROTTLE_CODES
+                )
+                limiter.release(throttled=throttled)
+                if not throttled or attempt >= max_retries:
+                    raise
+            else:
+                limiter.release()
+                return result
+            time.sleep(random.uniform(0, min(20.0, 0.1 * 2**attempt)))
+            attempt += 1
+
+    def benchmark(
+        self,
+        function_name: str,
+        payload: dict[str, Any] | None = None,
+        invocations: int = 100,
+        concurrency: int = 10,
+    ) -> dict[str, Any]:
+        """
+        Invoke a function ``invocations`` times and summarise its latency.
+
+        Calls run ``concurrency`` at a time with ``LogType=Tail``, and the
+        ``REPORT`` line of each log tail supplies the server-side figures.
+        Returns p50/p90/p99/mean/max summaries for ``client_ms`` (round trip
+        seen by the caller), ``duration_ms``, ``billed_duration_ms`` and
+        ``init_duration_ms`` (cold starts only), the peak
+        ``max_memory_used_mb``, the ``cold_starts`` count and
+        ``cold_start_ratio``, and the number of ``errors``.
+        """
+        if invocations < 1:
+            raise ValueError("invocations must be at least 1")
+
+        def _timed(_: int) -> tuple[float, dict[str, Any]]:
+            started = time.perf_counter()
+            result = self.invoke(function_name, payload, log_type="Tail")
+            return (time.perf_counter() - started) * 1000, result
+
+        outcomes = fan_out(
+            _timed, range(invocations), max_workers=concurrency, return_exceptions=True
+        )
+        client_ms: list[float] = []
+        reports: list[dict[str, float]] = []
+        errors = 0
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                errors += 1
+                continue
+            elapsed, result = outcome
+            client_ms.append(elapsed)
+            report = parse_report_line(result.get("LogResult") or "")
+            if report:
+                reports.append(report)
+        cold = [r["init_duration_ms"] for r in reports if "init_duration_ms" in r]
+        memory = [r["max_memory_used_mb"] for r in reports if "max_memory_used_mb" in r]
+        return {
+            "function_name": function_name,
+            "invocations": invocations,
+            "concurrency": concurrency,
+            "errors": errors,
+            "reports": len(reports),
+            "cold_starts": len(cold),
+            "cold_start_ratio": len(cold) / len(reports) if reports else None,
+            "client_ms": _summary(client_ms),
+            "duration_ms": _summary([r["duration_ms"] for r in reports if "duration_ms" in r]),
+            "billed_duration_ms": _summary(
+                [r["billed_duration_ms"] for r in reports if "billed_duration_ms" in r]
+            ),
+            "init_duration_ms": _summary(cold),
+            "max_memory_used_mb": max(memory) if memory else None,
+            "memory_size_mb": reports[0].get("memory_size_mb") if reports else None,
+        }
+
     def get_function_configuration(self, function_name: str) -> dict[str, Any]:
         """Return only the configuration (not code) for a Lambda function."""
         try:
@@ -0,0 +1,219 @@
+"""Locally indexed catalog of CloudWatch metrics."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.core.concurrency import DEFAULT_MAX_WORKERS, fan_out
+
+# ListMetrics RecentlyActive only accepts PT3H: metrics with data in the last three hours.
+_RECENTLY_ACTIVE = "PT3H"
+_RECENTLY_ACTIVE_SECONDS = 3 * 3600
+# Leave room for publishing delay so no metric falls between two refreshes.
+_INCREMENTAL_MARGIN_SECONDS = 15 * 60
+
+MetricKey = tuple[str, str, frozenset[tuple[str, str]]]
+
+
+def _metric_key(metric: Mapping[str, Any]) -> MetricKey:
+    return (
+        metric.get("Namespace", ""),
+        metric.get("MetricName", ""),
+        frozenset((d["Name"], d["Value"]) for d in metric.get("Dimensions", [])),
+    )
+
+
+class MetricCatalog:
+    """
+    In-memory catalog of ``list_metrics`` results with an inverted index.
+
+    Metrics are indexed by namespace, metric name, dimension name and
+    dimension name/value pair, so :meth:`find` answers lookups such as "every
+    metric with ``InstanceId=i-123``" by intersecting pre-built sets instead of
+    calling the API.
+
+    The first :meth:`refresh` lists the whole catalog (one paginated listing per
+    namespace in ``namespaces``, run concurrently). Later refreshes within three
+    hours of the previous one only list recently active metrics, which is
+    enough to pick up every metric that has been published since; older
+    catalogs are rebuilt in full. :meth:`save` and :meth:`load` keep the
+    catalog between processes.
+    """
+
+    def __init__(
+        self,
+        client: CloudWatchClient,
+        namespaces: Iterable[str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._client = client
+        self._namespaces = sorted(set(namespaces)) if namespaces else None
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._metrics: list[dict[str, Any]] = []
+        self._ids: dict[MetricKey, int] = {}
+        self._by_namespace: dict[str, set[int]] = {}
+        self._by_name: dict[str, set[int]] = {}
+        self._by_dimension_name: dict[str, set[int]] = {}
+        self._by_dimension: dict[tuple[str, str], set[int]] = {}
+        self._refreshed_at: float | None = None
+
+    @property
+    def refreshed_at(self) -> float | None:
+        """Epoch seconds of the last refresh, or None before the first one."""
+        return self._refreshed_at
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        Bring the catalog up to date and return the number of metrics added.
+
+        An incremental refresh is used when the previous one is recent enough
+        for the recently-active listing to cover the gap; ``full`` forces a
+        complete rebuild, which also drops metrics CloudWatch has expired.
+        """
+        started = time.time()
+        incremental = (
+            not full
+            and self._refreshed_at is not None
+            and started - self._refreshed_at < _RECENTLY_ACTIVE_SECONDS - _INCREMENTAL_MARGIN_SECONDS
+        )
+        recently_active = _RECENTLY_ACTIVE if incremental else None
+        namespaces: list[str | None] = list(self._namespaces) if self._namespaces else [None]
+        listings = fan_out(
+            lambda ns: list(
+                self._client.iter_metrics(namespace=ns, prefetch=False, recently_active=recently_active)
+            ),
+            namespaces,
+            max_workers=self._max_workers,
+        )
+        with self._lock:
+            if not incremental:
+                self._clear()
+            before = len(self._metrics)
+            for listing in listings:
+                for metric in listing:
+                    self._add(metric)
+            self._refreshed_at = started
+            return len(self._metrics) - before
+
+    def find(
+        self,
+        namespace: str | None = None,
+        metric_name: str | None = None,
+        dimensions: Mapping[str, str | None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the cataloged metrics matching every given criterion.
+
+        ``dimensions`` maps dimension names to required values; a value of
+        None matches any value of that dimension. With no criteria every
+        metric is returned. Results keep the ``list_metrics`` item shape.
+        """
+        with self._lock:
+            candidates: list[set[int]] = []
+            if namespace is not None:
+                candidates.append(self._by_namespace.get(namespace, set()))
+            if metric_name is not None:
+                candidates.append(self._by_name.get(metric_name, set()))
+            for name, value in (dimensions or {}).items():
+                if value is None:
+                    candidates.append(self._by_dimension_name.get(name, set()))
+                else:
+                    candidates.append(self._by_dimension.get((name, value), set()))
+            if not candidates:
+                return list(self._metrics)
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+            return [self._metrics[i] for i in sorted(ids)]
+
+    def namespaces(self) -> list[str]:
+        """Return the namespaces present in the catalog."""
+        with self._lock:
+            return sorted(self._by_namespace)
+
+    def dimension_values(self, dimension_name: str, namespace: str | None = None) -> list[str]:
+        """Return the distinct values of a dimension, optionally within one namespace."""
+        with self._lock:
+            ids = self._by_dimension_name.get(dimension_name, set())
+            if namespace is not None:
+                ids = ids & self._by_namespace.get(namespace, set())
+            values = {
+                d["Value"]
+                for i in ids
+                for d in self._metrics[i].get("Dimensions", [])
+                if d["Name"] == dimension_name
+            }
+            return sorted(values)
+
+    def save(self, path: Path | str) -> None:
+        """Write the catalog to ``path`` as JSON, replacing the file atomically."""
+        with self._lock:
+            data = {
+                "refreshed_at": self._refreshed_at,
+                "namespaces": self._namespaces,
+                "metrics": self._metrics,
+            }
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(data, fh)
+            os.replace(tmp, target)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def load(self, path: Path | str) -> None:
+        """
+        Replace the catalog with one written by :meth:`save`.
+
+        A catalog saved for different ``namespaces`` is ignored so the next
+        :meth:`refresh` rebuilds it in full.
+        """
+        with Path(path).expanduser().open() as fh:
+            data = json.load(fh)
+        if data.get("namespaces") != self._namespaces:
+            return
+        with self._lock:
+            self._clear()
+            for metric in data.get("metrics", []):
+                self._add(metric)
+            self._refreshed_at = data.get("refreshed_at")
+
+    def _clear(self) -> None:
+        self._metrics = []
+        self._ids = {}
+        self._by_namespace = {}
+        self._by_name = {}
+        self._by_dimension_name = {}
+        self._by_dimension = {}
+
+    def _add(self, metric: dict[str, Any]) -> None:
+        key = _metric_key(metric)
+        if key in self._ids:
+            return
+        metric_id = self._ids[key] = len(self._metrics)
+        self._metrics.append(
+            {
+                "Namespace": key[0],
+                "MetricName": key[1],
+                "Dimensions": [dict(d) for d in metric.get("Dimensions", [])],
+            }
+        )
+        self._by_namespace.setdefault(key[0], set()).add(metric_id)
+        self._by_name.setdefault(key[1], set()).add(metric_id)
+        for name, value in key[2]:
+            self._by_dimension_name.setdefault(name, set()).add(metric_id)
+            self._by_dimension.setdefault((name, value), set()).add(metric_id)
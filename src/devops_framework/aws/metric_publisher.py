@@ -0,0 +1,259 @@
+"""Buffered CloudWatch metric publishing through PutMetricData or Embedded Metric Format."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from types import TracebackType
+from typing import Any, TextIO
+
+from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.core.logging import get_logger
+
+# EMF documents may carry at most 100 metrics and 30 dimensions.
+_EMF_MAX_METRICS = 100
+_EMF_MAX_DIMENSIONS = 30
+
+_logger = get_logger(__name__)
+
+AggregateKey = tuple[str, tuple[tuple[str, str], ...], str, int]
+
+
+class MetricPublisher:
+    """
+    Collect datapoints in memory and publish them as CloudWatch statistic sets.
+
+    Every :meth:`put` is folded into a ``StatisticValues`` aggregate (count,
+    sum, min, max) per metric, dimension set, unit and ``resolution``-second
+    bucket, so a thousand observations of one metric in a minute become one
+    MetricDatum. :meth:`flush` sends the aggregates through
+    :meth:`CloudWatchClient.put_metric_data`, which packs them into as few
+    requests as the item and size limits allow.
+
+    With ``flush_interval`` set, a daemon thread flushes on that period and as
+    soon as ``max_buffered`` aggregates are pending. Aggregates from a flush
+    that fails are merged back into the buffer and retried by the next flush;
+    if that would hold more than ``max_buffered`` aggregates, the oldest
+    unsent buckets are dropped. Use the publisher as a
+    context manager, or call :meth:`close`, to flush what is left on exit.
+    """
+
+    def __init__(
+        self,
+        client: CloudWatchClient,
+        namespace: str,
+        flush_interval: float | None = 60.0,
+        resolution: int = 60,
+        max_buffered: int = 10_000,
+    ) -> None:
+        if resolution not in (1, 60):
+            raise ValueError("resolution must be 1 (high resolution) or 60 seconds")
+        self._client = client
+        self._namespace = namespace
+        self._flush_interval = flush_interval
+        self._resolution = resolution
+        self._max_buffered = max_buffered
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: dict[AggregateKey, list[float]] = {}
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        if flush_interval is not None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"metric-publisher-{namespace}", daemon=True
+            )
+            self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of aggregates waiting to be flushed."""
+        return len(self._buffer)
+
+    def put(
+        self,
+        metric_name: str,
+        value: float,
+        unit: str = "None",
+        dimensions: Mapping[str, str] | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Record one observation of ``metric_name``."""
+        if self._closed:
+            raise RuntimeError("MetricPublisher is closed")
+        when = timestamp.timestamp() if timestamp else time.time()
+        bucket = int(when) - int(when) % self._resolution
+        key: AggregateKey = (metric_name, tuple(sorted((dimensions or {}).items())), unit, bucket)
+        value = float(value)
+        with self._lock:
+            stats = self._buffer.get(key)
+            if stats is None:
+                self._buffer[key] = [1.0, value, value, value]
+            else:
+                stats[0] += 1
+                stats[1] += value
+                stats[2] = min(stats[2], value)
+                stats[3] = max(stats[3], value)
+            full = len(self._buffer) >= self._max_buffered
+        if full:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Send every pending aggregate and return the number of MetricDatum items published.
+
+        If publishing fails the aggregates are put back for the next flush and
+        the error is re-raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                buffer, self._buffer = self._buffer, {}
+            if not buffer:
+                return 0
+            metric_data = [
+                {
+                    "MetricName": name,
+                    "Dimensions": [{"Name": k, "Value": v} for k, v in dims],
+                    "Timestamp": datetime.fromtimestamp(bucket, tz=UTC),
+                    "Unit": unit,
+                    "StorageResolution": self._resolution,
+                    "StatisticValues": {
+                        "SampleCount": count,
+                        "Sum": total,
+                        "Minimum": low,
+                        "Maximum": high,
+                    },
+                }
+                for (name, dims, unit, bucket), (count, total, low, high) in buffer.items()
+            ]
+            try:
+                self._client.put_metric_data(self._namespace, metric_data)
+            except Exception:
+                self._restore(buffer)
+                raise
+            return len(metric_data)
+
+    def _restore(self, unsent: dict[AggregateKey, list[float]]) -> None:
+        """Merge aggregates from a failed flush back into the buffer, oldest dropped first."""
+        with self._lock:
+            for key, (count, total, low, high) in unsent.items():
+                stats = self._buffer.get(key)
+                if stats is None:
+                    self._buffer[key] = [count, total, low, high]
+                else:
+                    stats[0] += count
+                    stats[1] += total
+                    stats[2] = min(stats[2], low)
+                    stats[3] = max(stats[3], high)
+            excess = len(self._buffer) - self._max_buffered
+            if excess > 0:
+                for key in sorted(unsent, key=lambda k: k[3])[:excess]:
+                    self._buffer.pop(key, None)
+        if excess > 0:
+            _logger.warning(
+                "Dropped unsent metric aggregates",
+                extra={"namespace": self._namespace, "dropped": excess},
+            )
+
+    def close(self) -> None:
+        """Stop the background thread and flush the remaining aggregates."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._wake.set()
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception:
+                _logger.exception("Background metric flush failed", extra={"namespace": self._namespace})
+
+    def __enter__(self) -> MetricPublisher:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class EMFWriter:
+    """
+    Write metrics as CloudWatch Embedded Metric Format log lines.
+
+    Each :meth:`write` emits one JSON document per 100 metrics to ``stream``
+    (stdout by default). When that output reaches CloudWatch Logs, for example
+    from Lambda or a container with the CloudWatch agent, the metrics are
+    extracted without any PutMetricData calls.
+    """
+
+    def __init__(self, namespace: str, stream: TextIO | None = None) -> None:
+        self._namespace = namespace
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def write(
+        self,
+        metrics: Mapping[str, float | list[float]],
+        dimensions: Mapping[str, str] | None = None,
+        units: Mapping[str, str] | None = None,
+        properties: Mapping[str, Any] | None = None,
+        timestamp: datetime | None = None,
+    ) -> list[str]:
+        """
+        Emit ``metrics`` (name to value, or list of values) and return the lines written.
+
+        ``dimensions`` become the document's single dimension set; ``units``
+        maps metric names to CloudWatch units and ``properties`` adds
+        searchable fields that are not metrics.
+        """
+        dimensions = dict(dimensions or {})
+        if len(dimensions) > _EMF_MAX_DIMENSIONS:
+            raise ValueError(f"EMF supports at most {_EMF_MAX_DIMENSIONS} dimensions")
+        units = units or {}
+        millis = int((timestamp or datetime.now(UTC)).timestamp() * 1000)
+        names = list(metrics)
+        lines = []
+        for i in range(0, len(names), _EMF_MAX_METRICS):
+            chunk = names[i : i + _EMF_MAX_METRICS]
+            document: dict[str, Any] = {
+                "_aws": {
+                    "Timestamp": millis,
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": self._namespace,
+                            "Dimensions": [list(dimensions)],
+                            "Metrics": [{"Name": n, "Unit": units.get(n, "None")} for n in chunk],
+                        }
+                    ],
+                },
+                **(properties or {}),
+                **dimensions,
+            }
+            for name in chunk:
+                document[name] = metrics[name]
+            lines.append(json.dumps(document, default=str))
+        stream = self._stream or sys.stdout
+        with self._lock:
+            for line in lines:
+                stream.write(line + "\n")
+            stream.flush()
+        return lines
@@ -2,59 +2,278 @@
 
 from __future__ import annotations
 
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from functools import cached_property
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from devops_framework.aws.base import AWSBaseClient
+from devops_framework.aws.cloudwatch import CloudWatchClient, metric_query
+from devops_framework.aws.records import RDSInstanceRecord, project_columns
+from devops_framework.core.concurrency import BatchLoader, fan_out
 from devops_framework.core.exceptions import ResourceNotFoundError
 
+# Fleet event collection covers DB instances and clusters unless told otherwise.
+_FLEET_SOURCE_TYPES = ("db-instance", "db-cluster")
+
+
+# Per-instance CloudWatch metrics in a fleet health snapshot, as (column, MetricName).
+_HEALTH_METRICS = (
+    ("cpu_utilization", "CPUUtilization"),
+    ("database_connections", "DatabaseConnections"),
+    ("freeable_memory", "FreeableMemory"),
+    ("replica_lag", "ReplicaLag"),
+    ("free_storage_space", "FreeStorageSpace"),
+)
+
+# Log files are downloaded a few at a time; RDS throttles DownloadDBLogFilePortion per instance.
+_LOG_DOWNLOAD_WORKERS = 4
+
+
+def _event_key(event: dict[str, Any]) -> str:
+    return f"{event.get('SourceArn') or event.get('SourceIdentifier', '')}|{event.get('Message', '')}"
+
+
+def _write_json(path: Path | str, data: Any) -> None:
+    target = Path(path).expanduser()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, target)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(slots=True)
+class RDSEventCursor:
+    """
+    Position of an incremental :meth:`RDSClient.get_fleet_events` collection.
+
+    Holds the newest event ``Date`` seen and the keys of the events delivered
+    at exactly that time. The next collection starts from that instant, so
+    events sharing the boundary timestamp are neither lost nor repeated.
+    """
+
+    last_seen: datetime | None = None
+    seen_keys: set[str] = field(default_factory=set)
+
+    def is_new(self, event: dict[str, Any]) -> bool:
+        """Return True if ``event`` has not been delivered yet."""
+        if self.last_seen is None:
+            return True
+        date = event["Date"]
+        if date != self.last_seen:
+            return bool(date > self.last_seen)
+        return _event_key(event) not in self.seen_keys
+
+    def advance(self, events: Iterable[dict[str, Any]]) -> None:
+        """Record ``events`` as delivered."""
+        for event in events:
+            date = event["Date"]
+            if self.last_seen is None or date > self.last_seen:
+                self.last_seen = date
+                self.seen_keys = set()
+            if date == self.last_seen:
+                self.seen_keys.add(_event_key(event))
+
+    def save(self, path: Path | str) -> None:
+        """Write the cursor to ``path`` as JSON, replacing the file atomically."""
+        _write_json(
+            path,
+            {
+                "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+                "seen_keys": sorted(self.seen_keys),
+            },
+        )
+
+    @classmethod
+    def load(cls, path: Path | str) -> RDSEventCursor:
+        """Read a cursor written by :meth:`save`."""
+        with Path(path).expanduser().open() as fh:
+            data = json.load(fh)
+        last_seen = data.get("last_seen")
+        return cls(
+            last_seen=datetime.fromisoformat(last_seen) if last_seen else None,
+            seen_keys=set(data.get("seen_keys", [])),
+        )
+
+
+@dataclass(slots=True)
+class RDSLogMarkers:
+    """
+    Download positions of RDS log files, keyed by instance and log file name.
+
+    Each entry keeps the ``Marker`` returned by the last downloaded portion and
+    the file size at that time. A file that has shrunk since was rotated or
+    truncated by RDS and is downloaded again from the start.
+    """
+
+    positions: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @staticmethod
+    def _key(db_instance_identifier: str, log_file_name: str) -> str:
+        return f"{db_instance_identifier}/{log_file_name}"
+
+    def marker(self, db_instance_identifier: str, log_file_name: str, size: int | None = None) -> str:
+        """Return the marker to resume ``log_file_name`` from, or ``"0"`` to start over."""
+        position = self.positions.get(self._key(db_instance_identifier, log_file_name))
+        if position is None:
+            return "0"
+        if size is not None and size < position.get("size", 0):
+            return "0"
+        return str(position["marker"])
+
+    def update(
+        self, db_instance_identifier: str, log_file_name: str, marker: str, size: int | None = None
+    ) -> None:
+        """Record that ``log_file_name`` has been downloaded up to ``marker``."""
+        self.positions[self._key(db_instance_identifier, log_file_name)] = {
+            "marker": marker,
+            "size": size or 0,
+        }
+
+    def save(self, path: Path | str) -> None:
+        """Write the markers to ``path`` as JSON, replacing the file atomically."""
+        _write_json(path, self.positions)
+
+    @classmethod
+    def load(cls, path: Path | str) -> RDSLogMarkers:
+        """Read markers written by :meth:`save`."""
+        with Path(path).expanduser().open() as fh:
+            return cls(positions=json.load(fh))
+
 
 class RDSClient(AWSBaseClient):
     """Client for RDS operations."""
 
+    _instance_loader: BatchLoader[str, dict[str, Any]] | None = None
+
     @cached_property
     def _rds(self) -> Any:
         return self._boto_client("rds")
 
     def list_instances(self, db_instance_identifier: str | None = None) -> list[dict[str, Any]]:
         """List RDS DB instances, optionally filtered by identifier."""
+        return list(self.iter_instances(db_instance_identifier, prefetch=False))
+
+    def iter_instances(
+        self,
+        db_instance_identifier: str | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        parse_timestamps: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield RDS DB instances page by page, stopping after ``max_items``.
+
+        ``parse_timestamps=False`` leaves timestamps such as ``InstanceCreateTime`` as strings.
+        """
         kwargs: dict[str, Any] = {}
         if db_instance_identifier:
             kwargs["DBInstanceIdentifier"] = db_instance_identifier
-        instances: list[dict[str, Any]] = []
+        rds = self._rds if parse_timestamps else self._boto_client("rds", parse_timestamps=False)
+        pages = self._iter_pages(
+            rds, "describe_db_instances", prefetch and max_items is None, **kwargs
+        )
         try:
-            paginator = self._rds.get_paginator("describe_db_instances")
-            for page in paginator.paginate(**kwargs):
-                instances.extend(page.get("DBInstances", []))
+            yield from islice(
+                (inst for page in pages for inst in page.get("DBInstances", [])), max_items
+            )
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code == "DBInstanceNotFound":
-                return []
+                return
             raise self._wrap_client_error(exc, "RDS describe_db_instances failed") from exc
-        return instances
+
+    def list_instance_records(self, parse_timestamps: bool = True) -> list[RDSInstanceRecord]:
+        """List DB instances as compact slotted records instead of full API dicts."""
+        return [
+            RDSInstanceRecord.from_api(inst)
+            for inst in self.iter_instances(prefetch=False, parse_timestamps=parse_timestamps)
+        ]
+
+    def list_instance_columns(
+        self, fields: list[str], parse_timestamps: bool = True
+    ) -> dict[str, list[Any]]:
+        """List DB instances as column lists holding only ``fields`` (dotted paths)."""
+        return project_columns(self.iter_instances(parse_timestamps=parse_timestamps), fields)
 
     def get_instance(self, db_instance_identifier: str) -> dict[str, Any]:
         """Return a single DB instance dict or raise ResourceNotFoundError."""
+        if self._instance_loader is not None:
+            instance = self._instance_loader.load(db_instance_identifier)
+            if instance is None:
+                raise ResourceNotFoundError("RDS DBInstance", db_instance_identifier)
+            return instance
         results = self.list_instances(db_instance_identifier=db_instance_identifier)
         if not results:
             raise ResourceNotFoundError("RDS DBInstance", db_instance_identifier)
         return results[0]
 
+    def enable_coalescing(self, window: float = 0.005, max_batch_size: int = 100) -> None:
+        """
+        Batch concurrent :meth:`get_instance` calls into shared describe calls.
+
+        Lookups made within ``window`` seconds of each other, from any thread and
+        any RDSClient with the same region and credentials, are sent as one
+        ``describe_db_instances`` call filtered on up to ``max_batch_size``
+        identifiers. Concurrent lookups of the same identifier share one result.
+        """
+        self._instance_loader = self._shared_loader(
+            "get_instance", self._describe_instances_by_id, window, max_batch_size
+        )
+
+    def disable_coalescing(self) -> None:
+        """Send every :meth:`get_instance` call on its own again."""
+        self._instance_loader = None
+
+    def _describe_instances_by_id(self, identifiers: list[str]) -> dict[str, dict[str, Any]]:
+        filters = [{"Name": "db-instance-id", "Values": identifiers}]
+        try:
+            return {
+                inst["DBInstanceIdentifier"]: inst
+                for page in self._iter_pages(
+                    self._rds, "describe_db_instances", prefetch_pages=False, Filters=filters
+                )
+                for inst in page.get("DBInstances", [])
+            }
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "RDS describe_db_instances failed") from exc
+
     def list_clusters(self, db_cluster_identifier: str | None = None) -> list[dict[str, Any]]:
         """List RDS DB clusters (Aurora), optionally filtered by identifier."""
+        return list(self.iter_clusters(db_cluster_identifier, prefetch=False))
+
+    def iter_clusters(
+        self,
+        db_cluster_identifier: str | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield RDS DB clusters page by page, stopping after ``max_items``."""
         kwargs: dict[str, Any] = {}
         if db_cluster_identifier:
             kwargs["DBClusterIdentifier"] = db_cluster_identifier
-        clusters: list[dict[str, Any]] = []
+        pages = self._iter_pages(
+            self._rds, "describe_db_clusters", prefetch and max_items is None, **kwargs
+        )
         try:
-            paginator = self._rds.get_paginator("describe_db_clusters")
-            for page in paginator.paginate(**kwargs):
-                clusters.extend(page.get("DBClusters", []))
+            yield from islice(
+                (cluster for page in pages for cluster in page.get("DBClusters", [])), max_items
+            )
         except ClientError as exc:
             raise self._wrap_client_error(exc, "RDS describe_db_clusters failed") from exc
-        return clusters
 
     def get_cluster(self, db_cluster_identifier: str) -> dict[str, Any]:
         """Return a single DB cluster dict or raise ResourceNotFoundError."""
@@ -69,12 +288,261 @@ class RDSClient(AWSBaseClient):
         duration: int = 1440,
     ) -> list[dict[str, Any]]:
         """Return recent events for a DB instance (duration in minutes, default 24h)."""
-        try:
-            resp = self._rds.describe_events(
-                SourceIdentifier=db_instance_identifier,
-                SourceType="db-instance",
-                Duration=duration,
+        return list(
+            self.iter_events(
+                source_identifier=db_instance_identifier,
+                source_type="db-instance",
+                duration=duration,
+                prefetch=False,
             )
+        )
+
+    def iter_events(
+        self,
+        source_identifier: str | None = None,
+        source_type: str | None = None,
+        event_categories: list[str] | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        duration: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield RDS events page by page, stopping after ``max_items``.
+
+        Without ``source_identifier``/``source_type`` every event in the account
+        and region is returned. ``duration`` is in minutes; RDS keeps 14 days.
+        """
+        kwargs: dict[str, Any] = {}
+        if source_identifier:
+            kwargs["SourceIdentifier"] = source_identifier
+        if source_type:
+            kwargs["SourceType"] = source_type
+        if event_categories:
+            kwargs["EventCategories"] = event_categories
+        if start_time:
+            kwargs["StartTime"] = start_time
+        if end_time:
+            kwargs["EndTime"] = end_time
+        if duration is not None:
+            kwargs["Duration"] = duration
+        pages = self._iter_pages(
+            self._rds, "describe_events", prefetch and max_items is None, **kwargs
+        )
+        try:
+            yield from islice((event for page in pages for event in page.get("Events", [])), max_items)
+        except ClientError as exc:
+            raise self._wrap_client_error(exc, "RDS describe_events failed") from exc
+
+    def get_fleet_events(
+        self,
+        event_categories: list[str] | None = None,
+        duration: int = 1440,
+        cursor: RDSEventCursor | None = None,
+        source_types: Iterable[str] = _FLEET_SOURCE_TYPES,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Return events for every DB instance and cluster, grouped by source identifier.
+
+        All events come from one paginated ``describe_events`` stream (filtered
+        server-side by ``event_categories``) and are grouped locally; events of
+        other ``source_types`` are dropped. With a ``cursor`` that has seen
+        events before, only events after its position are returned and the
+        cursor is advanced; otherwise the last ``duration`` minutes are read.
+        """
+        wanted = set(source_types)
+        kwargs: dict[str, Any] = {"event_categories": event_categories}
+        if cursor is not None and cursor.last_seen is not None:
+            kwargs["start_time"] = cursor.last_seen
+        else:
+            kwargs["duration"] = duration
+        events = [
+            event
+            for event in self.iter_events(**kwargs)
+            if event.get("SourceType") in wanted and (cursor is None or cursor.is_new(event))
+        ]
+        if cursor is not None:
+            cursor.advance(events)
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for event in sorted(events, key=lambda e: e["Date"]):
+            grouped.setdefault(event.get("SourceIdentifier", ""), []).append(event)
+        return grouped
+
+    def list_log_files(
+        self,
+        db_instance_identifier: str,
+        filename_contains: str | None = None,
+        file_last_written: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List the log files of a DB instance (``LogFileName``, ``Size``, ``LastWritten``).
+
+        ``filename_contains`` filters on a substring such as ``"slowquery"``;
+        ``file_last_written`` keeps only files written since that time.
+        """
+        kwargs: dict[str, Any] = {"DBInstanceIdentifier": db_instance_identifier}
+        if filename_contains:
+            kwargs["FilenameContains"] = filename_contains
+        if file_last_written:
+            kwargs["FileLastWritten"] = int(file_last_written.timestamp() * 1000)
+        try:
+            return [
+                log_file
+                for page in self._iter_pages(
+                    self._rds, "describe_db_log_files", prefetch_pages=False, **kwargs
+                )
+                for log_file in page.get("DescribeDBLogFiles", [])
+            ]
         except ClientError as exc:
-            raise self._wrap_client_error(exc, f"RDS describe_events({db_instance_identifier})") from exc
-        return resp.get("Events", [])
+            code = exc.response.get("Error", {}).get("Code", "")
+            if code == "DBInstanceNotFound":
+                raise ResourceNotFoundError("RDS DBInstance", db_instance_identifier) from exc
+            raise self._wrap_client_error(exc, "RDS describe_db_log_files failed") from exc
+
+    def iter_log_file(
+        self,
+        db_instance_identifier: str,
+        log_file_name: str,
+        marker: str = "0",
+        number_of_lines: int | None = None,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Stream a DB log file as ``(data, marker)`` portions, starting at ``marker``.
+
+        ``Marker`` is followed until RDS reports no ``AdditionalDataPending``.
+        The marker yielded with each portion resumes the download right after
+        it, so it can be stored and passed back later to fetch only new data.
+        """
+        kwargs: dict[str, Any] = {}
+        if number_of_lines:
+            kwargs["NumberOfLines"] = number_of_lines
+        while True:
+            try:
+                response = self._rds.download_db_log_file_portion(
+                    DBInstanceIdentifier=db_instance_identifier,
+                    LogFileName=log_file_name,
+                    Marker=marker,
+                    **kwargs,
+                )
+            except ClientError as exc:
+                code = exc.response.get("Error", {}).get("Code", "")
+                if code == "DBInstanceNotFound":
+                    raise ResourceNotFoundError("RDS DBInstance", db_instance_identifier) from exc
+                if code == "DBLogFileNotFoundFault":
+                    raise ResourceNotFoundError("RDS DBLogFile", log_file_name) from exc
+                raise self._wrap_client_error(exc, "RDS download_db_log_file_portion failed") from exc
+            previous, marker = marker, response.get("Marker") or marker
+            data = response.get("LogFileData") or ""
+            if data:
+                yield data, marker
+            if not response.get("AdditionalDataPending") or marker == previous:
+                return
+
+    def download_log_files(
+        self,
+        db_instance_identifier: str,
+        destination: Path | str,
+        log_file_names: list[str] | None = None,
+        filename_contains: str | None = None,
+        markers: RDSLogMarkers | None = None,
+        max_workers: int = _LOG_DOWNLOAD_WORKERS,
+    ) -> dict[str, int]:
+        """
+        Download log files of a DB instance concurrently into ``destination``.
+
+        Files are written to ``destination/<instance>/<log file name>``; without
+        ``log_file_names`` every file (matching ``filename_contains``) is
+        downloaded. With ``markers`` each file resumes from its stored marker,
+        new data is appended to the local copy and the marker is updated as
+        portions arrive. Returns the number of characters written per file.
+        """
+        files = self.list_log_files(db_instance_identifier, filename_contains=filename_contains)
+        if log_file_names is not None:
+            wanted = set(log_file_names)
+            files = [f for f in files if f["LogFileName"] in wanted]
+        root = Path(destination).expanduser() / db_instance_identifier
+
+        def _download(log_file: dict[str, Any]) -> int:
+            name, size = log_file["LogFileName"], log_file.get("Size")
+            marker = markers.marker(db_instance_identifier, name, size) if markers else "0"
+            target = root / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            written = 0
+            with target.open("a" if marker != "0" else "w") as fh:
+                for data, marker in self.iter_log_file(db_instance_identifier, name, marker):
+                    fh.write(data)
+                    written += len(data)
+                    if markers is not None:
+                        markers.update(db_instance_identifier, name, marker, size)
+            return written
+
+        results = fan_out(_download, files, max_workers=max_workers)
+        return {f["LogFileName"]: written for f, written in zip(files, results)}
+
+    def fleet_health(
+        self,
+        period: int = 300,
+        lookback: int = 3600,
+        stat: str = "Average",
+        cloudwatch: CloudWatchClient | None = None,
+    ) -> dict[str, list[Any]]:
+        """
+        Return a columnar health snapshot of every DB instance.
+
+        Instances are joined with their Aurora cluster (``cluster`` and
+        ``role`` columns) and with the latest ``stat`` datapoint over the last
+        ``lookback`` seconds of CPUUtilization, DatabaseConnections,
+        FreeableMemory, ReplicaLag and FreeStorageSpace. All metrics for the
+        whole fleet are read through :meth:`CloudWatchClient.get_metric_data`,
+        which packs up to 500 series into each request. Metrics an instance
+        does not report (such as ReplicaLag on a primary) are ``None``.
+        """
+        instances = list(self.iter_instances())
+        roles: dict[str, tuple[str, str]] = {}
+        for cluster in self.iter_clusters():
+            for member in cluster.get("DBClusterMembers", []):
+                roles[member["DBInstanceIdentifier"]] = (
+                    cluster["DBClusterIdentifier"],
+                    "writer" if member.get("IsClusterWriter") else "reader",
+                )
+
+        table: dict[str, list[Any]] = {
+            "identifier": [],
+            "cluster": [],
+            "role": [],
+            "engine": [],
+            "instance_class": [],
+            "status": [],
+            **{column: [] for column, _ in _HEALTH_METRICS},
+        }
+        queries: list[dict[str, Any]] = []
+        for i, inst in enumerate(instances):
+            identifier = inst["DBInstanceIdentifier"]
+            cluster_id, role = roles.get(identifier, (inst.get("DBClusterIdentifier", ""), ""))
+            table["identifier"].append(identifier)
+            table["cluster"].append(cluster_id)
+            table["role"].append(role)
+            table["engine"].append(inst.get("Engine", ""))
+            table["instance_class"].append(inst.get("DBInstanceClass", ""))
+            table["status"].append(inst.get("DBInstanceStatus", ""))
+            dimensions = [{"Name": "DBInstanceIdentifier", "Value": identifier}]
+            queries.extend(
+                metric_query(f"m{i}_{j}", "AWS/RDS", metric_name, dimensions, stat=stat, period=period)
+                for j, (_, metric_name) in enumerate(_HEALTH_METRICS)
+            )
+        if not queries:
+            return table
+
+        if cloudwatch is None:
+            cloudwatch = CloudWatchClient(
+                region=self._region, profile=self._profile, config=self.config, role_arn=self._role_arn
+            )
+        end_time = datetime.now(UTC)
+        results = cloudwatch.get_metric_data(queries, end_time - timedelta(seconds=lookback), end_time)
+        for i in range(len(instances)):
+            for j, (column, _) in enumerate(_HEALTH_METRICS):
+                result = results.get(f"m{i}_{j}")
+                latest = result.values[-1] if result is not None and len(result.values) else None
+                table[column].append(None if latest is None else float(latest))
+        return table
@@ -0,0 +1,127 @@
+"""Compact record types and column projection for AWS inventory results."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+Timestamp = datetime | str | None
+
+_TAG_PREFIX = "tag:"
+
+
+def _tag(item: dict[str, Any], key: str) -> str | None:
+    return next((t.get("Value") for t in item.get("Tags", []) or [] if t.get("Key") == key), None)
+
+
+def extract_field(item: dict[str, Any], path: str) -> Any:
+    """
+    Return the value at a dotted ``path`` in an API item, or None if missing.
+
+    ``"State.Name"`` walks nested dicts; ``"tag:Name"`` reads an EC2/RDS style
+    ``Tags`` list.
+    """
+    if path.startswith(_TAG_PREFIX):
+        return _tag(item, path[len(_TAG_PREFIX):])
+    node: Any = item
+    for part in path.split("."):
+        if not isinstance(node, dict):
+            return None
+        node = node.get(part)
+        if node is None:
+            return None
+    return node
+
+
+def project_columns(items: Iterable[dict[str, Any]], fields: Sequence[str]) -> dict[str, list[Any]]:
+    """
+    Project API items onto column lists holding only ``fields``.
+
+    Items are consumed one at a time, so passing an ``iter_*`` generator never
+    materialises the full botocore dicts.
+    """
+    columns: dict[str, list[Any]] = {field: [] for field in fields}
+    for item in items:
+        for field, column in columns.items():
+            column.append(extract_field(item, field))
+    return columns
+
+
+@dataclass(slots=True, frozen=True)
+class EC2InstanceRecord:
+    """The EC2 instance fields used by inventory and the CLI."""
+
+    instance_id: str
+    state: str
+    instance_type: str
+    private_ip: str | None
+    name: str | None
+    availability_zone: str | None
+    launch_time: Timestamp
+
+    @classmethod
+    def from_api(cls, item: dict[str, Any]) -> EC2InstanceRecord:
+        return cls(
+            instance_id=item["InstanceId"],
+            state=item.get("State", {}).get("Name", ""),
+            instance_type=item.get("InstanceType", ""),
+            private_ip=item.get("PrivateIpAddress"),
+            name=_tag(item, "Name"),
+            availability_zone=item.get("Placement", {}).get("AvailabilityZone"),
+            launch_time=item.get("LaunchTime"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RDSInstanceRecord:
+    """The RDS DB instance fields used by inventory and the CLI."""
+
+    identifier: str
+    engine: str
+    engine_version: str
+    status: str
+    instance_class: str
+    endpoint: str | None
+    cluster_identifier: str | None
+    create_time: Timestamp
+
+    @classmethod
+    def from_api(cls, item: dict[str, Any]) -> RDSInstanceRecord:
+        endpoint = item.get("Endpoint") or {}
+        return cls(
+            identifier=item["DBInstanceIdentifier"],
+            engine=item.get("Engine", ""),
+            engine_version=item.get("EngineVersion", ""),
+            status=item.get("DBInstanceStatus", ""),
+            instance_class=item.get("DBInstanceClass", ""),
+            endpoint=f"{endpoint['Address']}:{endpoint.get('Port', '')}" if endpoint.get("Address") else None,
+            cluster_identifier=item.get("DBClusterIdentifier"),
+            create_time=item.get("InstanceCreateTime"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class LambdaFunctionRecord:
+    """The Lambda function fields used by inventory and the CLI."""
+
+    name: str
+    arn: str
+    runtime: str | None
+    memory_size: int | None
+    timeout: int | None
+    code_sha256: str | None
+    last_modified: str | None
+
+    @classmethod
+    def from_api(cls, item: dict[str, Any]) -> LambdaFunctionRecord:
+        return cls(
+            name=item["FunctionName"],
+            arn=item.get("FunctionArn", ""),
+            runtime=item.get("Runtime"),
+            memory_size=item.get("MemorySize"),
+            timeout=item.get("Timeout"),
+            code_sha256=item.get("CodeSha256"),
+            last_modified=item.get("LastModified"),
+        )
@@ -0,0 +1,126 @@
+"""Process-wide pool of shared boto3 sessions and service clients."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import boto3
+import botocore.config
+
+SessionKey = tuple[str, str | None, str | None, bool]
+ClientKey = tuple[str, str | None, str | None, bool, str]
+
+
+class ClientPool:
+    """
+    Thread-safe registry of shared boto3 sessions and botocore clients.
+
+    Sessions are keyed by ``(region, profile, role_arn)`` and clients by
+    ``(region, profile, role_arn, service)``. botocore clients are safe to share
+    between threads once built, so every caller with the same key reuses one
+    client together with its HTTP connection pool. Each key also has a
+    ``parse_timestamps=False`` variant whose clients leave timestamps as the raw
+    wire values instead of building ``datetime`` objects.
+
+    ``boto3.Session.client()`` itself is not thread-safe, so client creation is
+    serialised per session while lookups of existing clients stay lock-free.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._session_locks: dict[SessionKey, threading.Lock] = {}
+        self._sessions: dict[SessionKey, boto3.Session] = {}
+        self._clients: dict[ClientKey, Any] = {}
+
+    def _session_lock(self, key: SessionKey) -> threading.Lock:
+        with self._lock:
+            lock = self._session_locks.get(key)
+            if lock is None:
+                lock = self._session_locks[key] = threading.Lock()
+            return lock
+
+    def session(
+        self,
+        region: str,
+        profile: str | None = None,
+        role_arn: str | None = None,
+        factory: Callable[[], boto3.Session] | None = None,
+        parse_timestamps: bool = True,
+    ) -> boto3.Session:
+        """
+        Return the shared session for ``(region, profile, role_arn)``.
+
+        ``factory`` builds the session on first use; it defaults to a plain
+        ``boto3.Session`` for the region and profile.
+        """
+        key: SessionKey = (region, profile, role_arn, parse_timestamps)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._session_lock(key):
+            session = self._sessions.get(key)
+            if session is None:
+                if factory is None:
+                    session = _default_session(region, profile)
+                else:
+                    session = factory()
+                if not parse_timestamps:
+                    session._session.get_component("response_parser_factory").set_parser_defaults(
+                        timestamp_parser=_raw_timestamp
+                    )
+                self._sessions[key] = session
+            return session
+
+    def client(
+        self,
+        service: str,
+        region: str,
+        profile: str | None = None,
+        role_arn: str | None = None,
+        factory: Callable[[], boto3.Session] | None = None,
+        config: botocore.config.Config | None = None,
+        parse_timestamps: bool = True,
+    ) -> Any:
+        """Return the shared ``service`` client for ``(region, profile, role_arn)``."""
+        key: ClientKey = (region, profile, role_arn, parse_timestamps, service)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        session = self.session(region, profile, role_arn, factory, parse_timestamps)
+        with self._session_lock(key[:4]):
+            client = self._clients.get(key)
+            if client is None:
+                client = session.client(service, config=config)
+                self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        """Drop every pooled session and client."""
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+            self._session_locks.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def _raw_timestamp(value: Any) -> Any:
+    return value
+
+
+def _default_session(region: str, profile: str | None) -> boto3.Session:
+    kwargs: dict[str, Any] = {"region_name": region}
+    if profile:
+        kwargs["profile_name"] = profile
+    return boto3.Session(**kwargs)
+
+
+_POOL = ClientPool()
+
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide :class:`ClientPool` used by every AWS client."""
+    return _POOL
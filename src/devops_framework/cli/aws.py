@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from collections.abc import Iterator
+from typing import Any, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from devops_framework.aws.base import REGION_KEY, AWSBaseClient, is_multi_region
 from devops_framework.aws.cloudwatch import CloudWatchClient
 from devops_framework.aws.ec2 import EC2Client
 from devops_framework.aws.lambda_ import LambdaClient
@@ -19,28 +21,50 @@ console = Console()
 err_console = Console(stderr=True, style="bold red")
 
 
+_REGION_HELP = "AWS region, comma-separated list of regions, or 'all'"
+
+
 def _handle_error(exc: Exception) -> None:
     err_console.print(f"Error: {exc}")
     raise typer.Exit(code=1)
 
 
+def _single_region(region: Optional[str]) -> Optional[str]:
+    """Return the region to bind a client to, or None for multi-region selectors."""
+    return None if is_multi_region(region) else region
+
+
+def _list_in_regions(
+    client: AWSBaseClient, method: str, region: Optional[str], **kwargs: Any
+) -> list[dict[str, Any]]:
+    """Call a list method once, or across regions when ``region`` names several."""
+    if is_multi_region(region):
+        return client.across_regions(method, regions=region, **kwargs)
+    items: list[dict[str, Any]] = getattr(client, method)(**kwargs)
+    return items
+
+
 # ── EC2 ───────────────────────────────────────────────────────────────────────
 
 @app.command("list-instances")
 def list_instances(
-    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    region: Optional[str] = typer.Option(None, "--region", "-r", help=_REGION_HELP),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
     running_only: bool = typer.Option(False, "--running", help="Show only running instances"),
 ) -> None:
     """List EC2 instances."""
+    method = "list_running_instances" if running_only else "list_instances"
     try:
-        client = EC2Client(region=region, profile=profile)
-        instances = client.list_running_instances() if running_only else client.list_instances()
+        client = EC2Client(region=_single_region(region), profile=profile)
+        instances = _list_in_regions(client, method, region)
     except DevOpsFrameworkError as exc:
         _handle_error(exc)
         return
 
+    multi = is_multi_region(region)
     table = Table(title=f"EC2 Instances ({region or 'default region'})")
+    if multi:
+        table.add_column("Region")
     table.add_column("Instance ID", style="cyan")
     table.add_column("State", style="green")
     table.add_column("Type")
@@ -52,13 +76,14 @@ def list_instances(
             (t["Value"] for t in inst.get("Tags", []) if t["Key"] == "Name"),
             "",
         )
-        table.add_row(
+        row = [
             inst.get("InstanceId", ""),
             inst.get("State", {}).get("Name", ""),
             inst.get("InstanceType", ""),
             inst.get("PrivateIpAddress", ""),
             name,
-        )
+        ]
+        table.add_row(*([inst.get(REGION_KEY, "")] if multi else []), *row)
 
     console.print(table)
 
@@ -84,18 +109,21 @@ def describe_instance(
 
 @app.command("list-db-instances")
 def list_db_instances(
-    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    region: Optional[str] = typer.Option(None, "--region", "-r", help=_REGION_HELP),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
 ) -> None:
     """List RDS DB instances."""
     try:
-        client = RDSClient(region=region, profile=profile)
-        instances = client.list_instances()
+        client = RDSClient(region=_single_region(region), profile=profile)
+        instances = _list_in_regions(client, "list_instances", region)
     except DevOpsFrameworkError as exc:
         _handle_error(exc)
         return
 
+    multi = is_multi_region(region)
     table = Table(title="RDS DB Instances")
+    if multi:
+        table.add_column("Region")
     table.add_column("Identifier", style="cyan")
     table.add_column("Engine")
     table.add_column("Status", style="green")
@@ -105,12 +133,59 @@ def list_db_instances(
     for inst in instances:
         endpoint = inst.get("Endpoint", {})
         ep_str = f"{endpoint.get('Address', '')}:{endpoint.get('Port', '')}" if endpoint else ""
-        table.add_row(
+        row = [
             inst.get("DBInstanceIdentifier", ""),
             f"{inst.get('Engine', '')} {inst.get('EngineVersion', '')}",
             inst.get("DBInstanceStatus", ""),
             ep_str,
             inst.get("DBInstanceClass", ""),
+        ]
+        table.add_row(*([inst.get(REGION_KEY, "")] if multi else []), *row)
+
+    console.print(table)
+
+
+@app.command("db-health")
+def db_health(
+    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
+    period: int = typer.Option(300, "--period", help="Metric period in seconds"),
+    lookback: int = typer.Option(3600, "--lookback", help="Seconds of metrics to read"),
+) -> None:
+    """Show a health snapshot of every RDS DB instance with its latest metrics."""
+    try:
+        table_data = RDSClient(region=region, profile=profile).fleet_health(period=period, lookback=lookback)
+    except DevOpsFrameworkError as exc:
+        _handle_error(exc)
+        return
+
+    def _fmt(value: Optional[float], scale: float = 1.0, unit: str = "") -> str:
+        return "-" if value is None else f"{value / scale:.1f}{unit}"
+
+    table = Table(title="RDS Fleet Health")
+    table.add_column("Identifier", style="cyan")
+    table.add_column("Cluster")
+    table.add_column("Role")
+    table.add_column("Status", style="green")
+    table.add_column("Class")
+    table.add_column("CPU", justify="right")
+    table.add_column("Connections", justify="right")
+    table.add_column("Free Memory", justify="right")
+    table.add_column("Replica Lag", justify="right")
+    table.add_column("Free Storage", justify="right")
+
+    for i, identifier in enumerate(table_data["identifier"]):
+        table.add_row(
+            identifier,
+            table_data["cluster"][i],
+            table_data["role"][i],
+            table_data["status"][i],
+            table_data["instance_class"][i],
+            _fmt(table_data["cpu_utilization"][i], unit="%"),
+            _fmt(table_data["database_connections"][i]),
+            _fmt(table_data["freeable_memory"][i], 1024**3, " GiB"),
+            _fmt(table_data["replica_lag"][i], unit=" s"),
+            _fmt(table_data["free_storage_space"][i], 1024**3, " GiB"),
         )
 
     console.print(table)
@@ -120,18 +195,21 @@ def list_db_instances(
 
 @app.command("list-functions")
 def list_functions(
-    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    region: Optional[str] = typer.Option(None, "--region", "-r", help=_REGION_HELP),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
 ) -> None:
     """List Lambda functions."""
     try:
-        client = LambdaClient(region=region, profile=profile)
-        functions = client.list_functions()
+        client = LambdaClient(region=_single_region(region), profile=profile)
+        functions = _list_in_regions(client, "list_functions", region)
     except DevOpsFrameworkError as exc:
         _handle_error(exc)
         return
 
+    multi = is_multi_region(region)
     table = Table(title="Lambda Functions")
+    if multi:
+        table.add_column("Region")
     table.add_column("Name", style="cyan")
     table.add_column("Runtime")
     table.add_column("Memory (MB)")
@@ -139,13 +217,14 @@ def list_functions(
     table.add_column("Last Modified")
 
     for fn in functions:
-        table.add_row(
+        row = [
             fn.get("FunctionName", ""),
             fn.get("Runtime", ""),
             str(fn.get("MemorySize", "")),
             str(fn.get("Timeout", "")),
             fn.get("LastModified", ""),
-        )
+        ]
+        table.add_row(*([fn.get(REGION_KEY, "")] if multi else []), *row)
 
     console.print(table)
 
@@ -156,9 +235,54 @@ def invoke_function(
     region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
     payload: Optional[str] = typer.Option(None, "--payload", help="JSON payload string"),
+    stdin: bool = typer.Option(False, "--stdin", help="Read one JSON payload per line from stdin"),
+    concurrency: int = typer.Option(50, "--concurrency", "-c", help="Maximum concurrent invocations with --stdin"),
+    async_: bool = typer.Option(False, "--async", help="Use the Event (asynchronous) invocation type"),
 ) -> None:
-    """Invoke a Lambda function synchronously."""
+    """Invoke a Lambda function, once or for every JSONL payload on stdin."""
     import json
+    import sys
+
+    invocation_type = "Event" if async_ else "RequestResponse"
+
+    if stdin:
+        if payload:
+            err_console.print("--payload and --stdin cannot be combined")
+            raise typer.Exit(code=1)
+
+        def _payloads() -> Iterator[dict[str, Any]]:
+            for line_no, line in enumerate(sys.stdin, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    err_console.print(f"Invalid JSON payload on line {line_no}: {exc}")
+                    raise typer.Exit(code=1)
+
+        failures = 0
+        try:
+            client = LambdaClient(region=region, profile=profile)
+            for index, result in client.invoke_many(
+                function_name,
+                _payloads(),
+                invocation_type=invocation_type,
+                max_concurrency=concurrency,
+                ordered=False,
+                return_exceptions=True,
+            ):
+                if isinstance(result, Exception):
+                    failures += 1
+                    typer.echo(json.dumps({"index": index, "error": str(result)}))
+                else:
+                    typer.echo(json.dumps({"index": index, **result}, default=str))
+        except DevOpsFrameworkError as exc:
+            _handle_error(exc)
+            return
+        if failures:
+            err_console.print(f"{failures} invocation(s) failed")
+            raise typer.Exit(code=1)
+        return
 
     parsed_payload = None
     if payload:
@@ -170,7 +294,7 @@ def invoke_function(
 
     try:
         client = LambdaClient(region=region, profile=profile)
-        result = client.invoke(function_name, payload=parsed_payload)
+        result = client.invoke(function_name, payload=parsed_payload, invocation_type=invocation_type)
     except DevOpsFrameworkError as exc:
         _handle_error(exc)
         return
@@ -178,32 +302,91 @@ def invoke_function(
     console.print_json(data=result, default=str)
 
 
+@app.command("benchmark-function")
+def benchmark_function(
+    function_name: str = typer.Argument(..., help="Lambda function name or ARN"),
+    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
+    payload: Optional[str] = typer.Option(None, "--payload", help="JSON payload string"),
+    invocations: int = typer.Option(100, "--invocations", "-n", help="Number of invocations"),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", help="Concurrent invocations"),
+) -> None:
+    """Benchmark Lambda latency and cold starts."""
+    import json
+
+    parsed_payload = None
+    if payload:
+        try:
+            parsed_payload = json.loads(payload)
+        except json.JSONDecodeError as exc:
+            err_console.print(f"Invalid JSON payload: {exc}")
+            raise typer.Exit(code=1)
+
+    try:
+        client = LambdaClient(region=region, profile=profile)
+        report = client.benchmark(function_name, parsed_payload, invocations, concurrency)
+    except DevOpsFrameworkError as exc:
+        _handle_error(exc)
+        return
+
+    table = Table(title=f"Lambda Benchmark: {function_name}")
+    table.add_column("Metric", style="cyan")
+    for column in ("p50", "p90", "p99", "Mean", "Max"):
+        table.add_column(column, justify="right")
+    for label, key in (
+        ("Client latency (ms)", "client_ms"),
+        ("Duration (ms)", "duration_ms"),
+        ("Billed duration (ms)", "billed_duration_ms"),
+        ("Init duration (ms)", "init_duration_ms"),
+    ):
+        summary = report.get(key)
+        if summary:
+            table.add_row(label, *(f"{summary[s]:.1f}" for s in ("p50", "p90", "p99", "mean", "max")))
+    console.print(table)
+
+    ratio = report.get("cold_start_ratio")
+    console.print(
+        f"Invocations: {report['invocations']}  Errors: {report['errors']}  "
+        f"Cold starts: {report['cold_starts']}"
+        + (f" ({ratio:.1%})" if ratio is not None else "")
+        + (
+            f"  Max memory used: {report['max_memory_used_mb']:.0f}/{report['memory_size_mb']:.0f} MB"
+            if report.get("max_memory_used_mb") is not None and report.get("memory_size_mb")
+            else ""
+        )
+    )
+
+
 # ── CloudWatch ────────────────────────────────────────────────────────────────
 
 @app.command("list-log-groups")
 def list_log_groups(
-    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    region: Optional[str] = typer.Option(None, "--region", "-r", help=_REGION_HELP),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
     prefix: Optional[str] = typer.Option(None, "--prefix", help="Log group name prefix filter"),
 ) -> None:
     """List CloudWatch Log groups."""
     try:
-        client = CloudWatchClient(region=region, profile=profile)
-        groups = client.list_log_groups(prefix=prefix)
+        client = CloudWatchClient(region=_single_region(region), profile=profile)
+        groups = _list_in_regions(client, "list_log_groups", region, prefix=prefix)
     except DevOpsFrameworkError as exc:
         _handle_error(exc)
         return
 
+    multi = is_multi_region(region)
     table = Table(title="CloudWatch Log Groups")
+    if multi:
+        table.add_column("Region")
     table.add_column("Name", style="cyan")
     table.add_column("Retention (days)")
     table.add_column("Stored Bytes")
 
     for g in groups:
-        table.add_row(
+        row = [
             g.get("logGroupName", ""),
             str(g.get("retentionInDays", "Never expire")),
             str(g.get("storedBytes", 0)),
-        )
+        ]
+        table.add_row(*([g.get(REGION_KEY, "")] if multi else []), *row)
 
     console.print(table)
@@ -8,6 +8,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from devops_framework.aws.base import REGION_KEY, is_multi_region
 from devops_framework.core.exceptions import DevOpsFrameworkError
 from devops_framework.eks.clusters import ClusterClient
 from devops_framework.eks.deployments import DeploymentClient
@@ -28,18 +29,25 @@ def _handle_error(exc: Exception) -> None:
 
 @app.command("list-clusters")
 def list_clusters(
-    region: Optional[str] = typer.Option(None, "--region", "-r", help="AWS region"),
+    region: Optional[str] = typer.Option(
+        None, "--region", "-r", help="AWS region, comma-separated list of regions, or 'all'"
+    ),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="AWS profile name"),
 ) -> None:
     """List all EKS clusters in the AWS account."""
+    multi = is_multi_region(region)
     try:
-        client = ClusterClient(region=region, profile=profile)
-        clusters = client.list_clusters()
+        if multi:
+            clusters = ClusterClient(profile=profile).across_regions("list_clusters", regions=region)
+        else:
+            clusters = ClusterClient(region=region, profile=profile).list_clusters()
     except DevOpsFrameworkError as exc:
         _handle_error(exc)
         return
 
     table = Table(title="EKS Clusters")
+    if multi:
+        table.add_column("Region")
     table.add_column("Cluster Name", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("Kubernetes Version")
@@ -47,13 +55,14 @@ def list_clusters(
     table.add_column("Created")
 
     for cluster in clusters:
-        table.add_row(
+        row = [
             cluster.get("name", ""),
             cluster.get("status", ""),
             cluster.get("version", ""),
             cluster.get("endpoint", ""),
             str(cluster.get("createdAt", "")),
-        )
+        ]
+        table.add_row(*([cluster.get(REGION_KEY, "")] if multi else []), *row)
 
     console.print(table)
 
@@ -1,6 +1,7 @@
 """Core utilities: config, exceptions, logging, and base client."""
 
 from devops_framework.core.base import IntegrationBaseClient
+from devops_framework.core.concurrency import fan_out
 from devops_framework.core.config import Config
 from devops_framework.core.exceptions import (
     AWSAPIError,
@@ -16,6 +17,7 @@ from devops_framework.core.exceptions import (
     ResourceNotFoundError,
 )
 from devops_framework.core.logging import get_logger
+from devops_framework.core.timeseries import TimeSeriesStore
 
 __all__ = [
     "IntegrationBaseClient",
@@ -32,4 +34,6 @@ __all__ = [
     "KubernetesAPIError",
     "ConfigurationError",
     "get_logger",
+    "fan_out",
+    "TimeSeriesStore",
 ]
@@ -0,0 +1,262 @@
+"""Bounded thread-pool helpers shared by the integration clients."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, cast
+
+DEFAULT_MAX_WORKERS = 16
+
+_DONE = object()
+
+
+def fan_out[T, R](
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Call ``func`` on every item on a bounded thread pool.
+
+    Results are returned in input order. When ``return_exceptions`` is True a
+    failing call contributes its exception to the result list instead of
+    aborting the whole batch; otherwise the first failure (in input order) is
+    re-raised once pending work has been cancelled.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = max(1, min(max_workers, len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        results: list[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(exc)
+    return results
+
+
+def prefetch[T](iterable: Iterable[T], executor: Executor | None = None) -> Iterator[T]:
+    """
+    Yield from ``iterable`` while its next item is produced in the background.
+
+    Meant for paginators: the next page is requested while the caller is still
+    working on the current one. At most one item is fetched ahead. Pass a shared
+    ``executor`` to bound the background threads used by many prefetching
+    iterators; otherwise a private single-thread executor is used.
+    """
+    iterator = iter(iterable)
+    pool = executor or ThreadPoolExecutor(max_workers=1)
+    try:
+        future = pool.submit(next, iterator, _DONE)
+        while True:
+            item = future.result()
+            if item is _DONE:
+                return
+            future = pool.submit(next, iterator, _DONE)
+            yield cast(T, item)
+    finally:
+        if executor is None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def chain_concurrently[T](
+    iterables: Iterable[Iterable[T]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    buffer_size: int = 16,
+) -> Iterator[T]:
+    """
+    Yield the items of each iterable in turn while all of them are read concurrently.
+
+    Every iterable is drained by its own task on a pool of up to
+    ``max_workers`` threads into a queue of at most ``buffer_size`` items, so
+    later iterables are already being read while earlier ones are yielded. An
+    exception from an iterable is re-raised once its items are reached.
+    Closing the generator stops the readers.
+    """
+    sources = list(iterables)
+    if not sources:
+        return
+    stop = threading.Event()
+    queues: list[queue.Queue[tuple[object, Exception | None]]] = [
+        queue.Queue(maxsize=buffer_size) for _ in sources
+    ]
+
+    def _drain(index: int) -> None:
+        out = queues[index]
+
+        def _put(entry: tuple[object, Exception | None]) -> bool:
+            while not stop.is_set():
+                try:
+                    out.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for item in sources[index]:
+                if not _put((item, None)):
+                    return
+        except Exception as exc:
+            _put((_DONE, exc))
+            return
+        _put((_DONE, None))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources))))
+    try:
+        for index in range(len(sources)):
+            executor.submit(_drain, index)
+        for source_queue in queues:
+            while True:
+                item, error = source_queue.get()
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    break
+                yield cast(T, item)
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class BatchLoader[K: Hashable, V]:
+    """
+    Coalesce concurrent single-key lookups into batched calls (a "dataloader").
+
+    The first :meth:`load` call opens a batch and waits ``window`` seconds for
+    other threads to add keys; the batch is then resolved with one
+    ``batch_fn(keys)`` call, which returns a mapping of the keys it found. A
+    batch is sent early once it holds ``max_batch_size`` keys. Lookups of a key
+    that is already queued or in flight share its result. Keys missing from
+    the mapping resolve to None. When ``batch_fn`` raises, every caller in the
+    batch receives the exception, unless ``is_key_error`` says a specific key
+    can have caused it: then the batch is split in half and retried until the
+    failing keys are isolated, so the exception reaches only their callers.
+    Throttling, credential and network errors should not be key errors, since
+    splitting would multiply the failing calls. Results are not cached after
+    delivery.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Mapping[K, V]],
+        window: float = 0.005,
+        max_batch_size: int = 100,
+        is_key_error: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._is_key_error = is_key_error
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._futures: dict[K, Future[V | None]] = {}
+        self._queue: list[K] = []
+
+    def load(self, key: K) -> V | None:
+        """Return the value for ``key``, batched with concurrent lookups."""
+        batch: list[K] = []
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                leader = False
+            else:
+                future = self._futures[key] = Future()
+                self._queue.append(key)
+                leader = len(self._queue) == 1
+                if len(self._queue) >= self._max_batch_size:
+                    batch, self._queue = self._queue, []
+        if batch:
+            self._dispatch(batch)
+        elif leader:
+            time.sleep(self._window)
+            with self._lock:
+                batch, self._queue = self._queue, []
+            if batch:
+                self._dispatch(batch)
+        return future.result()
+
+    def _dispatch(self, keys: list[K]) -> None:
+        results, errors = self._resolve(keys)
+        with self._lock:
+            futures = [(key, self._futures.pop(key)) for key in keys]
+        for key, future in futures:
+            if key in errors:
+                future.set_exception(errors[key])
+            else:
+                future.set_result(results.get(key))
+
+    def _resolve(self, keys: list[K]) -> tuple[dict[K, V], dict[K, Exception]]:
+        try:
+            return dict(self._batch_fn(keys)), {}
+        except Exception as exc:
+            if len(keys) == 1 or self._is_key_error is None or not self._is_key_error(exc):
+                return {}, dict.fromkeys(keys, exc)
+        middle = len(keys) // 2
+        left, left_errors = self._resolve(keys[:middle])
+        right, right_errors = self._resolve(keys[middle:])
+        return left | right, left_errors | right_errors
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts to throttling (additive increase, multiplicative decrease).
+
+    Callers wrap each request in :meth:`acquire` / :meth:`release`. Every
+    successful request raises the limit by about one per "round" of ``limit``
+    requests, up to ``max_limit``; a throttled one multiplies it by
+    ``decrease``, at most once per round, down to ``min_limit``.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial: int | None = None,
+        decrease: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        self._max = max_limit
+        self._min = min_limit
+        self._limit = float(initial if initial is not None else max_limit)
+        self._decrease = decrease
+        self._in_flight = 0
+        self._since_decrease = max_limit
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return max(self._min, int(self._limit))
+
+    def acquire(self) -> None:
+        """Block until a request may start."""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        """Finish a request, reporting whether it was throttled."""
+        with self._cond:
+            self._in_flight -= 1
+            self._since_decrease += 1
+            if throttled:
+                if self._since_decrease >= self.limit:
+                    self._limit = max(float(self._min), self._limit * self._decrease)
+                    self._since_decrease = 0
+            else:
+                self._limit = min(float(self._max), self._limit + 1 / max(self._limit, 1.0))
+            self._cond.notify_all()
@@ -61,7 +61,22 @@ class Config:
 
     @property
     def aws_role_arn(self) -> str | None:
-        return os.environ.get("AWS_ROLE_ARN") or _deep_get(self._yaml, "aws", "role_arn")
+        # Not AWS_ROLE_ARN: EKS IRSA sets that in every pod for web-identity credentials.
+        return os.environ.get("DEVOPS_ASSUME_ROLE_ARN") or _deep_get(self._yaml, "aws", "role_arn")
+
+    @property
+    def aws_role_session_name(self) -> str:
+        return (
+            os.environ.get("AWS_ROLE_SESSION_NAME")
+            or _deep_get(self._yaml, "aws", "role_session_name")
+            or "devops-framework"
+        )
+
+    @property
+    def aws_credential_cache_dir(self) -> str | None:
+        return os.environ.get("DEVOPS_AWS_CREDENTIAL_CACHE") or _deep_get(
+            self._yaml, "aws", "credential_cache_dir"
+        )
 
     # ── EKS / Kubernetes ──────────────────────────────────────────────────────
 
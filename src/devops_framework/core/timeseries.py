@@ -0,0 +1,423 @@
+"""Local columnar store for metric time series fetched from monitoring APIs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import uuid
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from devops_framework.core.concurrency import DEFAULT_MAX_WORKERS, fan_out
+
+Series = tuple[np.ndarray, np.ndarray]
+Interval = tuple[int, int]
+
+ROLLUP_RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600}
+ROLLUP_STATS = ("avg", "sum", "min", "max", "count")
+_ROLLUP_DTYPE = np.dtype(
+    [("ts", "<i8"), ("count", "<i8"), ("sum", "<f8"), ("min", "<f8"), ("max", "<f8")]
+)
+# Segments are merged into one once a series has accumulated this many.
+_MAX_SEGMENTS = 64
+_META = "meta.json"
+_SERIES_SEPARATOR = "#"
+
+
+def _to_seconds(value: datetime) -> int:
+    return int(value.timestamp())
+
+
+def _from_seconds(value: int) -> datetime:
+    return datetime.fromtimestamp(value, tz=UTC)
+
+
+def _empty() -> Series:
+    return np.empty(0, dtype="datetime64[s]"), np.empty(0, dtype="float64")
+
+
+def _as_arrays(timestamps: Any, values: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Normalise to sorted int64 epoch seconds and float64 values, dropping NaNs and repeats."""
+    ts = np.asarray(timestamps)
+    if ts.dtype.kind != "M":
+        ts = ts.astype("int64").astype("datetime64[s]")
+    ts = ts.astype("datetime64[s]").astype("int64")
+    vals = np.asarray(values, dtype="float64")
+    if ts.shape != vals.shape:
+        raise ValueError("timestamps and values must have the same length")
+    keep = ~np.isnan(vals)
+    ts, vals = ts[keep], vals[keep]
+    order = np.argsort(ts, kind="stable")
+    ts, vals = ts[order], vals[order]
+    if ts.size:
+        # keep the last value written for a repeated timestamp
+        last = np.append(ts[1:] != ts[:-1], True)
+        ts, vals = ts[last], vals[last]
+    return ts, vals
+
+
+def _merge_intervals(intervals: list[Interval]) -> list[Interval]:
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _align_intervals(
+    intervals: list[tuple[datetime, datetime]], align: int
+) -> list[tuple[datetime, datetime]]:
+    """Widen intervals to multiples of ``align`` seconds, merging any that then touch."""
+    widened = [
+        (_to_seconds(s) - _to_seconds(s) % align, -(-_to_seconds(e) // align) * align)
+        for s, e in intervals
+    ]
+    return [(_from_seconds(s), _from_seconds(e)) for s, e in _merge_intervals(widened)]
+
+
+def _subtract_intervals(start: int, end: int, covered: list[Interval]) -> list[Interval]:
+    """Return the parts of ``[start, end)`` not inside any ``covered`` interval."""
+    gaps: list[Interval] = []
+    cursor = start
+    for c_start, c_end in covered:
+        if c_end <= cursor:
+            continue
+        if c_start >= end:
+            break
+        if c_start > cursor:
+            gaps.append((cursor, c_start))
+        cursor = max(cursor, c_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _rollup(ts: np.ndarray, vals: np.ndarray, resolution: int) -> np.ndarray:
+    buckets = ts - ts % resolution
+    if ts.size:
+        starts = np.flatnonzero(np.append(True, buckets[1:] != buckets[:-1]))
+    else:
+        starts = np.empty(0, "int64")
+    out = np.empty(starts.size, dtype=_ROLLUP_DTYPE)
+    if starts.size:
+        out["ts"] = buckets[starts]
+        out["count"] = np.diff(np.append(starts, ts.size))
+        out["sum"] = np.add.reduceat(vals, starts)
+        out["min"] = np.minimum.reduceat(vals, starts)
+        out["max"] = np.maximum.reduceat(vals, starts)
+    return out
+
+
+def _combine_rollups(rows: np.ndarray) -> np.ndarray:
+    """Merge rollup rows that share a bucket (a bucket can straddle two segments)."""
+    if rows.size == 0:
+        return rows
+    rows = rows[np.argsort(rows["ts"], kind="stable")]
+    starts = np.flatnonzero(np.append(True, rows["ts"][1:] != rows["ts"][:-1]))
+    out = np.empty(starts.size, dtype=_ROLLUP_DTYPE)
+    out["ts"] = rows["ts"][starts]
+    out["count"] = np.add.reduceat(rows["count"], starts)
+    out["sum"] = np.add.reduceat(rows["sum"], starts)
+    out["min"] = np.minimum.reduceat(rows["min"], starts)
+    out["max"] = np.maximum.reduceat(rows["max"], starts)
+    return out
+
+
+class TimeSeriesStore:
+    """
+    On-disk cache of metric series with coverage tracking and rollups.
+
+    Every series key owns a directory of immutable segments: an ``int64``
+    epoch-second timestamp array and a ``float64`` value array saved as
+    ``.npy`` files and memory-mapped on read, plus 1m/5m/1h rollups holding
+    count/sum/min/max per bucket. ``meta.json`` records the segments and the
+    time intervals that have been fetched, so :meth:`get_or_fetch` only calls
+    the API for the parts of a window that are not stored yet.
+
+    Writes are append-only: data for an interval that is already covered is
+    dropped rather than rewritten. The store is safe to share between threads;
+    across processes it supports one writer with any number of readers.
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self._root = Path(root).expanduser()
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    # ── Metadata ──────────────────────────────────────────────────────────────
+
+    def _dir(self, key: str) -> Path:
+        return self._root / hashlib.sha1(key.encode()).hexdigest()
+
+    def _meta(self, key: str) -> dict[str, Any]:
+        try:
+            with (self._dir(key) / _META).open() as fh:
+                meta: dict[str, Any] = json.load(fh)
+        except FileNotFoundError:
+            return {"key": key, "coverage": [], "segments": []}
+        return meta
+
+    def _save_meta(self, key: str, meta: dict[str, Any]) -> None:
+        directory = self._dir(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(meta, fh)
+            os.replace(tmp, directory / _META)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def keys(self, prefix: str = "") -> list[str]:
+        """Return the stored series keys starting with ``prefix``."""
+        if not self._root.is_dir():
+            return []
+        keys = []
+        for meta_path in self._root.glob(f"*/{_META}"):
+            with meta_path.open() as fh:
+                key = json.load(fh).get("key", "")
+            if key.startswith(prefix):
+                keys.append(key)
+        return sorted(keys)
+
+    def coverage(self, key: str) -> list[tuple[datetime, datetime]]:
+        """Return the merged ``[start, end)`` intervals stored for ``key``."""
+        return [(_from_seconds(s), _from_seconds(e)) for s, e in self._meta(key)["coverage"]]
+
+    def missing(self, key: str, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        """Return the parts of ``[start, end)`` that are not stored for ``key``."""
+        covered = [tuple(c) for c in self._meta(key)["coverage"]]
+        gaps = _subtract_intervals(_to_seconds(start), _to_seconds(end), covered)
+        return [(_from_seconds(s), _from_seconds(e)) for s, e in gaps]
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+
+    def write(self, key: str, timestamps: Any, values: Any, start: datetime, end: datetime) -> None:
+        """
+        Store the points of ``[start, end)`` for ``key`` and mark that interval as covered.
+
+        ``timestamps`` may be ``datetime64`` values or epoch seconds. Points
+        outside the interval, or inside an interval that is already covered,
+        are ignored, as are NaN values. An empty write still records coverage,
+        which is how "no data in this window" is remembered.
+        """
+        start_s, end_s = _to_seconds(start), _to_seconds(end)
+        if end_s <= start_s:
+            return
+        ts, vals = _as_arrays(timestamps, values)
+        with self._lock:
+            meta = self._meta(key)
+            covered = [tuple(c) for c in meta["coverage"]]
+            gaps = _subtract_intervals(start_s, end_s, covered)
+            if not gaps:
+                return
+            keep = np.zeros(ts.size, dtype=bool)
+            for g_start, g_end in gaps:
+                keep |= (ts >= g_start) & (ts < g_end)
+            if keep.any():
+                meta["segments"].append(self._write_segment(key, ts[keep], vals[keep]))
+            meta["coverage"] = [list(c) for c in _merge_intervals(covered + gaps)]
+            self._save_meta(key, meta)
+            if len(meta["segments"]) > _MAX_SEGMENTS:
+                self._compact(key, meta)
+
+    def _write_segment(self, key: str, ts: np.ndarray, vals: np.ndarray) -> dict[str, Any]:
+        directory = self._dir(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = uuid.uuid4().hex
+        np.save(directory / f"{name}.ts.npy", ts)
+        np.save(directory / f"{name}.values.npy", vals)
+        for label, resolution in ROLLUP_RESOLUTIONS.items():
+            np.save(directory / f"{name}.{label}.npy", _rollup(ts, vals, resolution))
+        return {"name": name, "start": int(ts[0]), "end": int(ts[-1])}
+
+    def _add_series_names(self, key: str, names: Iterable[str]) -> None:
+        with self._lock:
+            meta = self._meta(key)
+            known = set(meta.get("series", []))
+            if not known.issuperset(names):
+                meta["series"] = sorted(known.union(names))
+                self._save_meta(key, meta)
+
+    def compact(self, key: str) -> None:
+        """Merge all segments of ``key`` into one."""
+        with self._lock:
+            self._compact(key, self._meta(key))
+
+    def _compact(self, key: str, meta: dict[str, Any]) -> None:
+        old = meta["segments"]
+        if len(old) < 2:
+            return
+        ts, vals = self._read_raw(key, old, None, None)
+        meta["segments"] = [self._write_segment(key, ts, vals)] if ts.size else []
+        self._save_meta(key, meta)
+        for segment in old:
+            for path in self._dir(key).glob(f"{segment['name']}.*.npy"):
+                path.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        """Remove every segment and the coverage of ``key``."""
+        with self._lock:
+            directory = self._dir(key)
+            if directory.is_dir():
+                for path in directory.iterdir():
+                    path.unlink()
+                directory.rmdir()
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+
+    def read(
+        self,
+        key: str,
+        start: datetime,
+        end: datetime,
+        resolution: str = "raw",
+        stat: str = "avg",
+    ) -> Series:
+        """
+        Return ``(timestamps, values)`` stored for ``key`` in ``[start, end)``.
+
+        Timestamps are ``datetime64[s]`` and values ``float64``. With a
+        ``resolution`` of ``"1m"``, ``"5m"`` or ``"1h"`` the pre-computed rollup
+        is returned instead, reduced with ``stat`` (avg, sum, min, max or count)
+        and stamped at the start of each bucket.
+        """
+        if resolution != "raw" and resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"resolution must be 'raw' or one of {sorted(ROLLUP_RESOLUTIONS)}")
+        if stat not in ROLLUP_STATS:
+            raise ValueError(f"stat must be one of {ROLLUP_STATS}")
+        start_s, end_s = _to_seconds(start), _to_seconds(end)
+        segments = self._meta(key)["segments"]
+        if resolution == "raw":
+            ts, vals = self._read_raw(key, segments, start_s, end_s)
+            return ts.astype("datetime64[s]"), vals
+        step = ROLLUP_RESOLUTIONS[resolution]
+        first_bucket = start_s - start_s % step
+        parts = []
+        for segment in segments:
+            if segment["end"] < first_bucket or segment["start"] >= end_s:
+                continue
+            rows = np.load(self._dir(key) / f"{segment['name']}.{resolution}.npy", mmap_mode="r")
+            lo, hi = np.searchsorted(rows["ts"], [first_bucket, end_s])
+            parts.append(np.array(rows[lo:hi]))
+        if not parts:
+            return _empty()
+        rows = _combine_rollups(np.concatenate(parts))
+        if stat == "avg":
+            values = rows["sum"] / rows["count"]
+        else:
+            values = rows[stat].astype("float64")
+        return rows["ts"].astype("datetime64[s]"), values
+
+    def _read_raw(
+        self, key: str, segments: list[dict[str, Any]], start_s: int | None, end_s: int | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        directory = self._dir(key)
+        ts_parts, val_parts = [], []
+        for segment in sorted(segments, key=lambda s: s["start"]):
+            if start_s is not None and segment["end"] < start_s:
+                continue
+            if end_s is not None and segment["start"] >= end_s:
+                continue
+            ts = np.load(directory / f"{segment['name']}.ts.npy", mmap_mode="r")
+            vals = np.load(directory / f"{segment['name']}.values.npy", mmap_mode="r")
+            lo = 0 if start_s is None else int(np.searchsorted(ts, start_s))
+            hi = ts.size if end_s is None else int(np.searchsorted(ts, end_s))
+            ts_parts.append(np.array(ts[lo:hi]))
+            val_parts.append(np.array(vals[lo:hi]))
+        if not ts_parts:
+            return np.empty(0, dtype="int64"), np.empty(0, dtype="float64")
+        return np.concatenate(ts_parts), np.concatenate(val_parts)
+
+    # ── Read-through ──────────────────────────────────────────────────────────
+
+    def get_or_fetch(
+        self,
+        key: str,
+        start: datetime,
+        end: datetime,
+        fetch: Callable[[datetime, datetime], tuple[Any, Any]],
+        settle: timedelta = timedelta(minutes=15),
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        align: int | None = None,
+    ) -> Series:
+        """
+        Return the raw series for ``[start, end)``, fetching only what is missing.
+
+        ``fetch(gap_start, gap_end)`` returns ``(timestamps, values)`` for one
+        missing interval; gaps are fetched concurrently. Data newer than
+        ``settle`` before now is returned but not marked as covered, because
+        monitoring APIs keep revising the most recent points. With ``align``
+        (seconds, e.g. the aggregation period of the source) every fetched
+        interval and covered boundary falls on a multiple of ``align``, so
+        buckets of separately fetched gaps line up.
+        """
+        results = self.get_or_fetch_many(
+            key, start, end, lambda s, e: {"": fetch(s, e)}, settle, max_workers, align
+        )
+        return results.get("", _empty())
+
+    def get_or_fetch_many(
+        self,
+        key: str,
+        start: datetime,
+        end: datetime,
+        fetch: Callable[[datetime, datetime], Mapping[str, tuple[Any, Any]]],
+        settle: timedelta = timedelta(minutes=15),
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        align: int | None = None,
+    ) -> dict[str, Series]:
+        """
+        Like :meth:`get_or_fetch` for a query that returns several named series.
+
+        ``fetch`` returns ``{name: (timestamps, values)}``. Coverage is tracked
+        once for ``key`` and each series is stored under ``"<key>#<name>"``.
+        Returns every series stored for ``key`` in the window.
+        """
+        settled = _to_seconds(datetime.now(UTC) - settle)
+        gaps = self.missing(key, start, end)
+        if align:
+            settled -= settled % align
+            gaps = _align_intervals(gaps, align)
+        fetched = fan_out(lambda gap: fetch(gap[0], gap[1]), gaps, max_workers=max_workers)
+        fresh: dict[str, list[tuple[np.ndarray, np.ndarray]]] = {}
+        prefix = f"{key}{_SERIES_SEPARATOR}"
+        for (gap_start, gap_end), series in zip(gaps, fetched):
+            cover_end = _from_seconds(
+                min(_to_seconds(gap_end), max(settled, _to_seconds(gap_start)))
+            )
+            for name, (timestamps, values) in series.items():
+                ts, vals = _as_arrays(timestamps, values)
+                self.write(prefix + name, ts, vals, gap_start, cover_end)
+                recent = (ts >= _to_seconds(cover_end)) & (ts < _to_seconds(gap_end))
+                if recent.any():
+                    fresh.setdefault(name, []).append((ts[recent], vals[recent]))
+            self.write(key, (), (), gap_start, cover_end)
+            self._add_series_names(key, series)
+
+        names = set(self._meta(key).get("series", [])) | set(fresh)
+        results: dict[str, Series] = {}
+        for name in sorted(names):
+            ts, vals = self.read(prefix + name, start, end)
+            extra = fresh.get(name, [])
+            if extra:
+                merged_ts, merged_vals = _as_arrays(
+                    np.concatenate([ts.astype("int64")] + [e[0] for e in extra]),
+                    np.concatenate([vals] + [e[1] for e in extra]),
+                )
+                ts, vals = merged_ts.astype("datetime64[s]"), merged_vals
+            results[name] = (ts, vals)
+        return results
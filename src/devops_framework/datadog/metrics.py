@@ -5,10 +5,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 from datadog_api_client import ApiClient
 from datadog_api_client.v1.api.metrics_api import MetricsApi
 
 from devops_framework.core.exceptions import DatadogAPIError
+from devops_framework.core.timeseries import TimeSeriesStore
 from devops_framework.datadog.base import DatadogBaseClient
 
 
@@ -40,6 +42,31 @@ class MetricsClient(DatadogBaseClient):
 
         return resp.to_dict()
 
+    def query_metric_series(
+        self,
+        store: TimeSeriesStore,
+        query: str,
+        from_time: datetime,
+        to_time: datetime,
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Return ``{scope: (timestamps, values)}`` for a metrics query, read through ``store``.
+
+        Only the parts of the window that ``store`` has not seen yet are sent to
+        :meth:`query_metrics`; the rest is read from disk.
+        """
+
+        def _fetch(start: datetime, end: datetime) -> dict[str, tuple[np.ndarray, list[float]]]:
+            resp = self.query_metrics(query, start, end)
+            series: dict[str, tuple[np.ndarray, list[float]]] = {}
+            for item in resp.get("series") or []:
+                points = [p for p in item.get("pointlist") or [] if p[1] is not None]
+                timestamps = np.array([int(p[0]) // 1000 for p in points], dtype="int64")
+                series[item.get("scope") or item.get("metric", "")] = (timestamps, [p[1] for p in points])
+            return series
+
+        return store.get_or_fetch_many(f"datadog:{query}", from_time, to_time, _fetch)
+
     def list_active_metrics(self, from_time: datetime | None = None, host: str | None = None) -> list[str]:
         """
         Return a list of actively reporting metric names.
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from functools import cached_property
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from devops_framework.aws.base import AWSBaseClient
+from devops_framework.core.concurrency import DEFAULT_MAX_WORKERS
 from devops_framework.core.exceptions import ResourceNotFoundError
 
+# Seconds a cluster description is reused by list_clusters/iter_clusters.
+_DEFAULT_CACHE_TTL = 300.0
+
 
 class ClusterClient(AWSBaseClient):
     """Client for AWS EKS cluster operations."""
@@ -18,30 +25,89 @@ class ClusterClient(AWSBaseClient):
     def _eks(self) -> Any:
         return self._boto_client("eks")
 
-    def list_clusters(self) -> list[dict[str, Any]]:
+    @cached_property
+    def _description_cache(self) -> dict[str, tuple[float, dict[str, Any]]]:
+        return {}
+
+    def list_clusters(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+    ) -> list[dict[str, Any]]:
         """
         List all EKS clusters in the AWS account.
 
-        Returns a list of cluster dicts with cluster name, ARN, status, version, and other metadata.
+        Returns a list of cluster dicts with cluster name, ARN, status, version,
+        and other metadata, in listing order. Use :meth:`list_cluster_names`
+        when only the names are needed.
         """
-        clusters: list[dict[str, Any]] = []
+        names = self.list_cluster_names()
+        described = {
+            cluster["name"]: cluster
+            for cluster in self.iter_clusters(names, max_workers=max_workers, cache_ttl=cache_ttl)
+        }
+        return [described[name] for name in names if name in described]
+
+    def list_cluster_names(self) -> list[str]:
+        """Return the names of all EKS clusters without describing any of them."""
+        return list(self.iter_cluster_names())
+
+    def iter_cluster_names(self) -> Iterator[str]:
+        """Yield the names of all EKS clusters page by page."""
         try:
-            # First, list cluster names using paginator
-            paginator = self._eks.get_paginator("list_clusters")
-            cluster_names: list[str] = []
-            for page in paginator.paginate():
-                cluster_names.extend(page.get("clusters", []))
-
-            # Then, describe the clusters to get full details
-            if cluster_names:
-                # Describe clusters in batches (AWS limits to 100 per call)
-                for i in range(0, len(cluster_names), 100):
-                    batch = cluster_names[i : i + 100]
-                    resp = self._eks.describe_clusters(names=batch)
-                    clusters.extend(resp.get("clusters", []))
+            for page in self._iter_pages(self._eks, "list_clusters"):
+                yield from page.get("clusters", [])
         except ClientError as exc:
             raise self._wrap_client_error(exc, "EKS list_clusters failed") from exc
-        return clusters
+
+    def iter_clusters(
+        self,
+        names: list[str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield cluster descriptions as they arrive.
+
+        ``describe_cluster`` is called for every cluster in ``names`` (default:
+        all clusters) on a pool of ``max_workers`` threads, and each result is
+        yielded as soon as it completes. Descriptions of ACTIVE clusters are
+        cached on the client for ``cache_ttl`` seconds and yielded first
+        without an API call; clusters that are being created, updated (such as
+        a version upgrade) or deleted are always described again. Clusters
+        deleted while listing are skipped.
+        """
+        cache = self._description_cache
+        now = time.monotonic()
+        pending: list[str] = []
+        for name in self.iter_cluster_names() if names is None else names:
+            entry = cache.get(name)
+            if entry is not None and now - entry[0] < cache_ttl:
+                yield entry[1]
+            else:
+                pending.append(name)
+        if not pending:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))))
+        try:
+            futures: dict[Future[dict[str, Any]], str] = {
+                executor.submit(self.get_cluster, name): name for name in pending
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    cluster = future.result()
+                except ResourceNotFoundError:
+                    cache.pop(name, None)
+                    continue
+                if cluster.get("status") == "ACTIVE":
+                    cache[name] = (time.monotonic(), cluster)
+                else:
+                    cache.pop(name, None)
+                yield cluster
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_cluster(self, cluster_name: str) -> dict[str, Any]:
         """Return a single cluster dict or raise ResourceNotFoundError."""
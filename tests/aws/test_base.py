@@ -0,0 +1,63 @@
+"""Tests for aws/base.py region handling and multi-region fan-out."""
+
+from __future__ import annotations
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from devops_framework.aws.base import is_multi_region
+from devops_framework.aws.ec2 import EC2Client
+from devops_framework.aws.lambda_ import LambdaClient
+from devops_framework.core.exceptions import AWSAPIError
+
+
+@pytest.fixture()
+def ec2_client():
+    with mock_aws():
+        yield EC2Client(region="us-east-1")
+
+
+def _create_instance(region: str) -> str:
+    [inst] = boto3.resource("ec2", region_name=region).create_instances(
+        ImageId="ami-00000000", MinCount=1, MaxCount=1, InstanceType="t3.micro"
+    )
+    return inst.id
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, False), ("", False), ("us-east-1", False), ("all", True), ("us-east-1,eu-west-1", True)],
+)
+def test_is_multi_region(value: str | None, expected: bool) -> None:
+    assert is_multi_region(value) is expected
+
+
+def test_resolve_regions(ec2_client: EC2Client) -> None:
+    assert ec2_client.resolve_regions(None) == ["us-east-1"]
+    assert ec2_client.resolve_regions("us-east-1, eu-west-1,us-east-1") == ["us-east-1", "eu-west-1"]
+    assert "eu-west-1" in ec2_client.resolve_regions("all")
+
+
+def test_for_region_keeps_type(ec2_client: EC2Client) -> None:
+    other = ec2_client.for_region("eu-west-1")
+    assert isinstance(other, EC2Client)
+    assert other.region == "eu-west-1"
+
+
+def test_across_regions_merges_and_tags(ec2_client: EC2Client) -> None:
+    east = _create_instance("us-east-1")
+    west = _create_instance("us-west-2")
+
+    instances = ec2_client.across_regions("list_instances", regions=["us-east-1", "us-west-2"])
+
+    by_id = {i["InstanceId"]: i["Region"] for i in instances}
+    assert by_id == {east: "us-east-1", west: "us-west-2"}
+
+
+def test_across_regions_reports_failed_regions() -> None:
+    with mock_aws():
+        client = LambdaClient(region="us-east-1")
+        with pytest.raises(AWSAPIError) as excinfo:
+            client.across_regions("get_function", "missing", regions=["us-east-1"])
+    assert "us-east-1" in excinfo.value.details["failed_regions"]
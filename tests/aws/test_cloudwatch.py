@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import boto3
+import numpy as np
 import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
 
-from devops_framework.aws.cloudwatch import CloudWatchClient
-from devops_framework.core.exceptions import ResourceNotFoundError
+import devops_framework.aws.cloudwatch as cloudwatch
+from devops_framework.aws.cloudwatch import (
+    CloudWatchClient,
+    LogTailCursor,
+    _dedupe_events,
+    _pack_metric_queries,
+    _shard_millis,
+    _split_time_range,
+    metric_query,
+)
+from devops_framework.core.exceptions import AWSAPIError, ResourceNotFoundError
+from devops_framework.core.timeseries import TimeSeriesStore
 
 
 @pytest.fixture()
@@ -45,7 +59,7 @@ def test_list_log_groups_prefix_filter(cw_client: CloudWatchClient, log_group: s
 
 
 def test_get_metric_statistics(cw_client: CloudWatchClient) -> None:
-    now = datetime.now(timezone.utc)
+    now = datetime.now(UTC)
     datapoints = cw_client.get_metric_statistics(
         namespace="AWS/EC2",
         metric_name="CPUUtilization",
@@ -59,3 +73,430 @@ def test_get_metric_statistics(cw_client: CloudWatchClient) -> None:
 def test_filter_log_events_not_found(cw_client: CloudWatchClient) -> None:
     with pytest.raises(ResourceNotFoundError):
         cw_client.filter_log_events("/nonexistent/group")
+
+
+def test_iter_metrics_streams_with_max_items(cw_client: CloudWatchClient) -> None:
+    boto3.client("cloudwatch", region_name="us-east-1").put_metric_data(
+        Namespace="Test/App",
+        MetricData=[{"MetricName": f"metric-{i}", "Value": 1.0} for i in range(5)],
+    )
+    metrics = cw_client.iter_metrics(namespace="Test/App", max_items=3)
+    assert not isinstance(metrics, list)
+    assert len(list(metrics)) == 3
+    assert len(cw_client.list_metrics(namespace="Test/App")) == 5
+
+
+def test_pack_metric_queries_keeps_expressions_with_inputs() -> None:
+    queries = [metric_query(f"m{i}", "AWS/EC2", "CPUUtilization") for i in range(7)]
+    queries.append({"Id": "total", "Expression": "m0 + m6"})
+
+    batches = _pack_metric_queries(queries, limit=3)
+
+    assert sum(len(b) for b in batches) == 8
+    assert all(len(b) <= 3 for b in batches)
+    [with_expr] = [b for b in batches if any(q["Id"] == "total" for q in b)]
+    assert {q["Id"] for q in with_expr} >= {"m0", "m6", "total"}
+
+
+def test_pack_metric_queries_keeps_request_wide_expressions_together() -> None:
+    queries = [metric_query(f"m{i}", "AWS/EC2", "CPUUtilization") for i in range(4)]
+    queries.append({"Id": "avg", "Expression": "AVG(METRICS())"})
+    assert _pack_metric_queries(queries, limit=5) == [queries]
+    with pytest.raises(ValueError, match="METRICS"):
+        _pack_metric_queries(queries, limit=3)
+
+
+def test_pack_metric_queries_rejects_duplicate_ids() -> None:
+    with pytest.raises(ValueError):
+        _pack_metric_queries([metric_query("a", "N", "M"), metric_query("a", "N", "M")])
+
+
+def test_get_metric_data_returns_arrays(cw_client: CloudWatchClient) -> None:
+    now = datetime.now(UTC).replace(second=0, microsecond=0)
+    boto3.client("cloudwatch", region_name="us-east-1").put_metric_data(
+        Namespace="Test/App",
+        MetricData=[
+            {"MetricName": "Latency", "Value": float(i), "Timestamp": now - timedelta(minutes=i)}
+            for i in range(5)
+        ],
+    )
+    queries = [metric_query("lat", "Test/App", "Latency", period=60)]
+    queries += [metric_query(f"empty{i}", "Test/App", "Missing", period=60) for i in range(600)]
+
+    results = cw_client.get_metric_data(queries, now - timedelta(hours=1), now + timedelta(minutes=1))
+
+    assert len(results) == 601
+    lat = results["lat"]
+    assert lat.timestamps.dtype == np.dtype("datetime64[s]")
+    assert list(lat.values) == [4.0, 3.0, 2.0, 1.0, 0.0]
+    assert np.all(np.diff(lat.timestamps.astype("int64")) > 0)
+
+
+def test_split_time_range() -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    windows = _split_time_range(start, start + timedelta(days=30), 60 * 1440)
+    assert len(windows) == 30
+    assert windows[0][0] == start
+    assert windows[-1][1] == start + timedelta(days=30)
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+
+
+def test_get_metric_statistics_splits_long_ranges(cw_client: CloudWatchClient) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    end = start + timedelta(days=3)
+
+    def fake_window(namespace, metric_name, dimensions, window_start, window_end, period, statistics):
+        # overlapping boundary datapoint to exercise de-duplication
+        return [{"Timestamp": window_end, "Average": 2.0}, {"Timestamp": window_start, "Average": 1.0}]
+
+    with patch.object(cw_client, "_get_metric_statistics_window", side_effect=fake_window) as spy:
+        points = cw_client.get_metric_statistics(
+            "AWS/EC2", "CPUUtilization", [], start, end, period=60
+        )
+
+    assert spy.call_count == 3
+    stamps = [p["Timestamp"] for p in points]
+    assert stamps == sorted(set(stamps))
+    assert stamps[0] == start and stamps[-1] == end
+
+
+def _put_events(group: str, stream: str, timestamps: list[int]) -> None:
+    logs = boto3.client("logs", region_name="us-east-1")
+    logs.create_log_stream(logGroupName=group, logStreamName=stream)
+    logs.put_log_events(
+        logGroupName=group,
+        logStreamName=stream,
+        logEvents=[{"timestamp": ts, "message": f"ERROR {stream} {ts}"} for ts in timestamps],
+    )
+
+
+def test_iter_filter_log_events_shards_merge_in_order(cw_client: CloudWatchClient, log_group: str) -> None:
+    start = datetime.now(UTC) - timedelta(hours=1)
+    base = int(start.timestamp() * 1000)
+    _put_events(log_group, "a", [base + i * 1000 for i in range(0, 200, 2)])
+    _put_events(log_group, "b", [base + i * 1000 for i in range(1, 200, 2)])
+
+    events = list(
+        cw_client.iter_filter_log_events(
+            log_group, "ERROR", start, start + timedelta(minutes=10), shards=4, max_workers=2
+        )
+    )
+
+    stamps = [e["timestamp"] for e in events]
+    assert len(events) == 200
+    assert stamps == sorted(stamps)
+    assert len({e["eventId"] for e in events}) == 200
+
+
+def test_filter_log_events_respects_limit(cw_client: CloudWatchClient, log_group: str) -> None:
+    base = int((datetime.now(UTC) - timedelta(minutes=30)).timestamp() * 1000)
+    _put_events(log_group, "a", [base + i for i in range(50)])
+    with patch.object(cw_client, "_iter_pages", wraps=cw_client._iter_pages) as spy:
+        assert len(cw_client.filter_log_events(log_group, limit=20)) == 20
+    assert spy.call_args.kwargs["limit"] == 20
+    assert spy.call_args.kwargs["prefetch_pages"] is False
+
+
+def test_iter_filter_log_events_reads_shards_concurrently(cw_client: CloudWatchClient) -> None:
+    def slow_pages(client, operation, prefetch_pages=True, **kwargs):
+        for page in range(3):
+            time.sleep(0.1)
+            yield {"events": [{"eventId": f"{kwargs['startTime']}-{page}", "timestamp": kwargs["startTime"] + page}]}
+
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    began = time.monotonic()
+    with patch.object(cw_client, "_iter_pages", side_effect=slow_pages):
+        events = list(
+            cw_client.iter_filter_log_events("/g", "", start, start + timedelta(hours=1), shards=4)
+        )
+    elapsed = time.monotonic() - began
+
+    assert len(events) == 12
+    assert [e["timestamp"] for e in events] == sorted(e["timestamp"] for e in events)
+    assert elapsed < 0.8  # sequential reading takes 1.2s
+
+
+def test_iter_filter_log_events_requires_start_for_shards(cw_client: CloudWatchClient) -> None:
+    with pytest.raises(ValueError):
+        list(cw_client.iter_filter_log_events("/test/group", shards=2))
+
+
+def test_shard_millis_are_disjoint_and_cover_range() -> None:
+    shards = _shard_millis(1_000, 10_999, 4)
+    assert shards[0][0] == 1_000 and shards[-1][1] == 10_999
+    assert all(a[1] + 1 == b[0] for a, b in zip(shards, shards[1:]))
+    assert _shard_millis(None, 5, 4) == [(None, 5)]
+
+
+def test_dedupe_events_drops_repeated_ids() -> None:
+    events = [
+        {"timestamp": 1, "eventId": "x"},
+        {"timestamp": 1, "eventId": "x"},
+        {"timestamp": 2, "eventId": "y"},
+        {"timestamp": 2, "eventId": "y"},
+    ]
+    assert [e["eventId"] for e in _dedupe_events(events)] == ["x", "y"]
+
+
+class _FakeInsights:
+    """
+    Minimal stand-in for the Logs Insights API: each query completes after three polls.
+
+    ``fields`` queries gain one row per poll; ``stats`` queries return one
+    row whose count is revised on every poll, as the real API does.
+    """
+
+    def __init__(self, reject_first_start: bool = False, fail_query: int | None = None) -> None:
+        self.started: list[list[str]] = []
+        self.stopped: list[str] = []
+        self.polls: dict[str, int] = {}
+        self.queries: dict[str, str] = {}
+        self.max_running = 0
+        self._running: set[str] = set()
+        self._reject = reject_first_start
+        self._fail_query = fail_query
+
+    def start_query(self, **kwargs):
+        if self._reject:
+            self._reject = False
+            raise ClientError({"Error": {"Code": "LimitExceededException", "Message": "busy"}}, "StartQuery")
+        query_id = f"q{len(self.started)}"
+        self.started.append(kwargs["logGroupNames"])
+        self.queries[query_id] = kwargs["queryString"]
+        self._running.add(query_id)
+        self.max_running = max(self.max_running, len(self._running))
+        return {"queryId": query_id}
+
+    def get_query_results(self, queryId):
+        polls = self.polls[queryId] = self.polls.get(queryId, 0) + 1
+        if self._fail_query is not None and queryId == f"q{self._fail_query}":
+            return {"status": "Failed", "results": []}
+        if self.queries[queryId].startswith("stats"):
+            rows = [[{"field": "query", "value": queryId}, {"field": "count()", "value": str(polls)}]]
+        else:
+            rows = [
+                [{"field": "query", "value": queryId}, {"field": "n", "value": str(i)}]
+                for i in range(polls)
+            ]
+        status = "Complete" if polls >= 3 else "Running"
+        if status == "Complete":
+            self._running.discard(queryId)
+        return {"status": status, "results": rows}
+
+    def stop_query(self, queryId):
+        self.stopped.append(queryId)
+        return {"success": True}
+
+
+def _insights_client(monkeypatch: pytest.MonkeyPatch, fake: _FakeInsights) -> CloudWatchClient:
+    monkeypatch.setattr(cloudwatch.time, "sleep", lambda _seconds: None)
+    client = CloudWatchClient(region="us-east-1")
+    client.__dict__["_logs"] = fake
+    return client
+
+
+def test_run_insights_query_batches_groups_and_limits_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeInsights(reject_first_start=True)
+    client = _insights_client(monkeypatch, fake)
+    now = datetime.now(UTC)
+    groups = [f"/g/{i}" for i in range(120)]
+
+    rows = list(
+        client.run_insights_query(
+            "fields @message",
+            groups,
+            now - timedelta(hours=1),
+            now,
+            max_concurrent_queries=2,
+            partial_results=True,
+        )
+    )
+
+    assert [len(batch) for batch in fake.started] == [50, 50, 20]
+    assert fake.max_running <= 2
+    # every query streams its three rows exactly once
+    assert sorted((r["query"], r["n"]) for r in rows) == [(f"q{q}", str(n)) for q in range(3) for n in range(3)]
+    assert fake.stopped == []
+
+
+def test_run_insights_query_final_rows_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeInsights()
+    client = _insights_client(monkeypatch, fake)
+    now = datetime.now(UTC)
+    rows = list(client.run_insights_query("fields @message", ["/g/a"], now - timedelta(hours=1), now))
+    assert [r["n"] for r in rows] == ["0", "1", "2"]
+    assert fake.polls == {"q0": 3}
+
+
+def test_run_insights_query_does_not_stream_revised_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeInsights()
+    client = _insights_client(monkeypatch, fake)
+    now = datetime.now(UTC)
+    rows = list(
+        client.run_insights_query(
+            "stats count()", ["/g/a"], now - timedelta(hours=1), now, partial_results=True
+        )
+    )
+    # the partial counts 1 and 2 are revised, so only the final row is yielded
+    assert rows == [{"query": "q0", "count()": "3"}]
+
+
+def test_run_insights_query_failure_stops_running_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeInsights(fail_query=1)
+    client = _insights_client(monkeypatch, fake)
+    now = datetime.now(UTC)
+    groups = [f"/g/{i}" for i in range(150)]
+    with pytest.raises(AWSAPIError):
+        list(client.run_insights_query("fields @message", groups, now - timedelta(hours=1), now))
+    assert fake.stopped == ["q0", "q2"]
+
+
+def test_tail_resumes_from_saved_cursor(cw_client: CloudWatchClient, log_group: str, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(cloudwatch.time, "sleep", lambda _seconds: None)
+    logs = boto3.client("logs", region_name="us-east-1")
+    start = datetime.now(UTC) - timedelta(minutes=5)
+    base = int(start.timestamp() * 1000)
+    _put_events(log_group, "a", [base + 1000, base + 2000])
+    cursor_path = tmp_path / "cursor.json"
+
+    first = list(cw_client.tail(log_group, cursor_path=cursor_path, start_time=start, max_polls=2))
+    assert [e["timestamp"] for e in first] == [base + 1000, base + 2000]
+
+    logs.put_log_events(
+        logGroupName=log_group,
+        logStreamName="a",
+        logEvents=[{"timestamp": base + 3000, "message": "later"}],
+    )
+    second = list(cw_client.tail(log_group, cursor_path=cursor_path, max_polls=2))
+    assert [e["message"] for e in second] == ["later"]
+
+
+def test_tail_redelivers_events_not_consumed(
+    cw_client: CloudWatchClient, log_group: str, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(cloudwatch.time, "sleep", lambda _seconds: None)
+    start = datetime.now(UTC) - timedelta(minutes=5)
+    base = int(start.timestamp() * 1000)
+    _put_events(log_group, "a", [base + 1000, base + 2000, base + 3000])
+    cursor_path = tmp_path / "cursor.json"
+
+    tail = cw_client.tail(log_group, cursor_path=cursor_path, start_time=start, max_polls=1)
+    assert next(tail)["timestamp"] == base + 1000
+    tail.close()
+    # the batch was not consumed, so nothing was saved and it is delivered again
+    assert not cursor_path.exists()
+    events = list(cw_client.tail(log_group, cursor_path=cursor_path, start_time=start, max_polls=1))
+    assert [e["timestamp"] for e in events] == [base + 1000, base + 2000, base + 3000]
+    assert cursor_path.exists()
+
+
+def test_tail_rejects_filter_pattern_for_single_stream(cw_client: CloudWatchClient) -> None:
+    with pytest.raises(ValueError):
+        next(cw_client.tail("/g", "ERROR", log_stream_name="a", max_polls=1))
+
+
+def test_tail_single_stream_uses_forward_token(cw_client: CloudWatchClient, log_group: str, monkeypatch) -> None:
+    monkeypatch.setattr(cloudwatch.time, "sleep", lambda _seconds: None)
+    start = datetime.now(UTC) - timedelta(minutes=5)
+    base = int(start.timestamp() * 1000)
+    _put_events(log_group, "a", [base + 1000, base + 2000])
+    cursor = LogTailCursor(log_group, base)
+
+    events = list(cw_client.tail(log_group, log_stream_name="a", cursor=cursor, max_polls=3))
+
+    assert [e["timestamp"] for e in events] == [base + 1000, base + 2000]
+    assert cursor.streams["a"].forward_token
+    restored = LogTailCursor.from_dict(cursor.to_dict())
+    assert restored.streams["a"].forward_token == cursor.streams["a"].forward_token
+
+
+def test_log_tail_cursor_tracks_ids_at_same_timestamp() -> None:
+    cursor = LogTailCursor("/g", start_time=100)
+    first = {"logStreamName": "s", "timestamp": 200, "eventId": "1"}
+    second = {"logStreamName": "s", "timestamp": 200, "eventId": "2"}
+    assert cursor.is_new(first)
+    cursor.advance(first)
+    assert not cursor.is_new(first)
+    assert cursor.is_new(second)
+    assert not cursor.is_new({"logStreamName": "s", "timestamp": 150, "eventId": "0"})
+    assert not cursor.is_new({"logStreamName": "other", "timestamp": 50, "eventId": "x"})
+
+
+def test_get_log_events_follows_forward_token(cw_client: CloudWatchClient, log_group: str) -> None:
+    base = int((datetime.now(UTC) - timedelta(minutes=30)).timestamp() * 1000)
+    _put_events(log_group, "a", [base + i for i in range(25)])
+
+    with patch("devops_framework.aws.cloudwatch._MAX_LOG_EVENTS_PAGE", 10):
+        events = cw_client.get_log_events(log_group, "a", limit=25)
+    assert [e["timestamp"] for e in events] == [base + i for i in range(25)]
+
+
+def test_iter_merged_log_events_interleaves_streams(cw_client: CloudWatchClient, log_group: str) -> None:
+    start = datetime.now(UTC) - timedelta(minutes=30)
+    base = int(start.timestamp() * 1000)
+    for n, stream in enumerate(["a", "b", "c"]):
+        _put_events(log_group, stream, [base + i * 10 + n for i in range(30)])
+
+    events = list(cw_client.iter_merged_log_events(log_group, start, page_size=7, max_workers=2))
+
+    assert len(events) == 90
+    stamps = [e["timestamp"] for e in events]
+    assert stamps == sorted(stamps)
+    assert [e["logStreamName"] for e in events[:3]] == ["a", "b", "c"]
+
+
+def test_iter_merged_log_events_requests_first_pages_in_parallel(cw_client: CloudWatchClient) -> None:
+    def slow_pages(log_group_name, log_stream_name, start_time, end_time, page_size=None):
+        time.sleep(0.1)
+        yield [{"timestamp": start_time + len(log_stream_name), "message": "x"}], "token"
+
+    names = [f"stream-{'x' * n}" for n in range(6)]
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    began = time.monotonic()
+    with patch.object(cw_client, "_iter_stream_pages", side_effect=slow_pages):
+        events = list(cw_client.iter_merged_log_events("/g", start, log_stream_names=names))
+    elapsed = time.monotonic() - began
+
+    assert [e["logStreamName"] for e in events] == names
+    assert elapsed < 0.4  # fetching the first pages one by one takes 0.6s
+
+
+def test_iter_active_log_streams_skips_idle_streams(cw_client: CloudWatchClient, log_group: str) -> None:
+    now = datetime.now(UTC)
+    _put_events(log_group, "old", [int((now - timedelta(days=3)).timestamp() * 1000)])
+    _put_events(log_group, "new", [int((now - timedelta(minutes=5)).timestamp() * 1000)])
+
+    streams = cw_client.iter_active_log_streams(log_group, now - timedelta(minutes=10))
+
+    assert [s["logStreamName"] for s in streams] == ["new"]
+
+
+def test_get_metric_series_reads_through_store(cw_client: CloudWatchClient, tmp_path) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    end = start + timedelta(hours=1)
+    points = [{"Timestamp": start + timedelta(minutes=5 * i), "Average": float(i)} for i in range(12)]
+    store = TimeSeriesStore(tmp_path)
+
+    with patch.object(cw_client, "get_metric_statistics", return_value=points) as spy:
+        ts, values = cw_client.get_metric_series(store, "AWS/EC2", "CPUUtilization", [], start, end)
+        again, _ = cw_client.get_metric_series(store, "AWS/EC2", "CPUUtilization", [], start, end)
+
+    assert spy.call_count == 1
+    assert list(values) == [float(i) for i in range(12)]
+    assert np.array_equal(ts, again)
+
+
+def test_get_metric_series_keys_store_by_account(tmp_path) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    end = start + timedelta(hours=1)
+    store = TimeSeriesStore(tmp_path)
+    clients = [CloudWatchClient(region="us-east-1") for _ in range(2)]
+    for client, account in zip(clients, ["111111111111", "222222222222"]):
+        client.__dict__["account_id"] = account
+
+    for n, client in enumerate(clients):
+        points = [{"Timestamp": start, "Average": float(n)}]
+        with patch.object(client, "get_metric_statistics", return_value=points) as spy:
+            _, values = client.get_metric_series(store, "AWS/EC2", "CPUUtilization", [], start, end)
+        assert spy.call_count == 1
+        assert list(values) == [float(n)]
@@ -0,0 +1,88 @@
+"""Tests for aws/credentials.py and assume-role support in AWSBaseClient."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from devops_framework.aws.credentials import AssumeRoleCredentialCache
+from devops_framework.aws.ec2 import EC2Client
+from devops_framework.core.exceptions import AWSAuthError
+
+ROLE_A = "arn:aws:iam::111111111111:role/audit"
+ROLE_B = "arn:aws:iam::222222222222:role/audit"
+
+
+@pytest.fixture()
+def sts():
+    with mock_aws():
+        yield boto3.client("sts", region_name="us-east-1")
+
+
+def test_cache_reuses_credentials(sts) -> None:
+    cache = AssumeRoleCredentialCache()
+    with patch.object(sts, "assume_role", wraps=sts.assume_role) as spy:
+        first = cache.get(ROLE_A, sts)
+        second = cache.get(ROLE_A, sts)
+        cache.get(ROLE_B, sts)
+    assert first is second
+    assert spy.call_count == 2
+
+
+def test_cache_refreshes_near_expiry(sts) -> None:
+    cache = AssumeRoleCredentialCache()
+    entry = cache.get(ROLE_A, sts)
+    entry["expiry_time"] = "2000-01-01T00:00:00+00:00"
+    assert cache.get(ROLE_A, sts)["expiry_time"] != "2000-01-01T00:00:00+00:00"
+
+
+def test_disk_cache_shared_between_instances(sts, tmp_path: Path) -> None:
+    first = AssumeRoleCredentialCache(cache_dir=tmp_path)
+    creds = first.get(ROLE_A, sts)
+    [path] = tmp_path.glob("*.json")
+    assert json.loads(path.read_text())["access_key"] == creds["access_key"]
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    second = AssumeRoleCredentialCache(cache_dir=tmp_path)
+    with patch.object(sts, "assume_role") as never:
+        assert second.get(ROLE_A, sts) == creds
+    never.assert_not_called()
+
+
+def test_assume_role_failure_raises_auth_error() -> None:
+    class FailingSTS:
+        def assume_role(self, **kwargs):
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "no"}}, "AssumeRole")
+
+    with pytest.raises(AWSAuthError, match="AccessDenied"):
+        AssumeRoleCredentialCache().get(ROLE_A, FailingSTS())
+
+
+def test_client_uses_role_from_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DEVOPS_ASSUME_ROLE_ARN", ROLE_A)
+    with mock_aws():
+        client = EC2Client(region="us-east-1")
+        assert client.role_arn == ROLE_A
+        creds = client.session.get_credentials().get_frozen_credentials()
+        assert creds.access_key != "testing"
+        identity = client._boto_client("sts").get_caller_identity()
+    assert identity["Account"] == "111111111111"
+
+
+def test_across_accounts() -> None:
+    with mock_aws():
+        client = EC2Client(region="us-east-1")
+        results = client.across_accounts("list_instances", [ROLE_A, ROLE_B])
+    assert results == {ROLE_A: [], ROLE_B: []}
+
+
+def test_client_ignores_irsa_role_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AWS_ROLE_ARN", ROLE_A)
+    monkeypatch.delenv("DEVOPS_ASSUME_ROLE_ARN", raising=False)
+    assert EC2Client(region="us-east-1").role_arn is None
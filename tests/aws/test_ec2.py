@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
 
-from devops_framework.aws.ec2 import EC2Client
+from devops_framework.aws.ec2 import EC2Client, _ids_in_message
+from devops_framework.core.concurrency import fan_out
 from devops_framework.core.exceptions import ResourceNotFoundError
 
 
@@ -69,3 +73,146 @@ def test_stop_and_start_instance(ec2_client: EC2Client, instance_id: str) -> Non
 def test_get_instance_status(ec2_client: EC2Client, instance_id: str) -> None:
     status = ec2_client.get_instance_status(instance_id)
     assert "InstanceId" in status
+
+
+def test_iter_instances_max_items(ec2_client: EC2Client) -> None:
+    boto3.resource("ec2", region_name="us-east-1").create_instances(
+        ImageId="ami-00000000", MinCount=3, MaxCount=3, InstanceType="t3.micro"
+    )
+    assert len(list(ec2_client.iter_instances())) == 3
+    assert len(list(ec2_client.iter_instances(max_items=2))) == 2
+
+
+def test_iter_instances_max_items_does_not_prefetch(ec2_client: EC2Client) -> None:
+    with patch.object(EC2Client, "_iter_pages", wraps=EC2Client._iter_pages) as iter_pages:
+        list(ec2_client.iter_instances())
+        list(ec2_client.iter_instances(max_items=2))
+    assert [c.args[2] for c in iter_pages.call_args_list] == [True, False]
+
+
+def test_iter_instances_unknown_id_is_empty(ec2_client: EC2Client) -> None:
+    assert list(ec2_client.iter_instances(instance_ids=["i-nonexistent00000000"])) == []
+
+
+def test_get_instance_statuses_bulk(ec2_client: EC2Client) -> None:
+    created = boto3.resource("ec2", region_name="us-east-1").create_instances(
+        ImageId="ami-00000000", MinCount=150, MaxCount=150, InstanceType="t3.micro"
+    )
+    ids = [inst.id for inst in created]
+
+    statuses = ec2_client.get_instance_statuses(ids + ids[:5], max_workers=2)
+
+    assert set(statuses) == set(ids)
+    assert statuses[ids[0]]["InstanceId"] == ids[0]
+
+
+def test_get_instance_statuses_skips_unknown_ids(ec2_client: EC2Client, instance_id: str) -> None:
+    statuses = ec2_client.get_instance_statuses([instance_id, "i-0123456789abcdef0"])
+    assert list(statuses) == [instance_id]
+
+
+def test_stop_and_start_fleet(ec2_client: EC2Client) -> None:
+    created = boto3.resource("ec2", region_name="us-east-1").create_instances(
+        ImageId="ami-00000000", MinCount=3, MaxCount=3, InstanceType="t3.micro"
+    )
+    ids = [inst.id for inst in created]
+
+    stopped = ec2_client.stop_instances(ids + ["i-0123456789abcdef0"], poll_interval=0.01, timeout=5)
+
+    assert all(stopped[i]["Completed"] and stopped[i]["CurrentState"] == "stopped" for i in ids)
+    assert stopped[ids[0]]["PreviousState"] == "running"
+    assert stopped["i-0123456789abcdef0"]["Error"] == "instance not found"
+
+    started = ec2_client.start_instances(
+        filters=[{"Name": "instance-state-name", "Values": ["stopped"]}], poll_interval=0.01, timeout=5
+    )
+    assert set(started) == set(ids)
+    assert all(entry["Completed"] for entry in started.values())
+
+
+def test_stop_fleet_skips_instances_in_incorrect_state(ec2_client: EC2Client) -> None:
+    created = boto3.resource("ec2", region_name="us-east-1").create_instances(
+        ImageId="ami-00000000", MinCount=4, MaxCount=4, InstanceType="t3.micro"
+    )
+    ids = [inst.id for inst in created]
+    stuck = ids[1]
+    stop = ec2_client._ec2.stop_instances
+
+    def stop_unless_stuck(InstanceIds):
+        if stuck in InstanceIds:
+            message = f"The instance '{stuck}' is not in a state from which it can be stopped."
+            raise ClientError(
+                {"Error": {"Code": "IncorrectInstanceState", "Message": message}}, "StopInstances"
+            )
+        return stop(InstanceIds=InstanceIds)
+
+    with patch.object(ec2_client._ec2, "stop_instances", side_effect=stop_unless_stuck):
+        report = ec2_client.stop_instances(ids, poll_interval=0.01, timeout=5)
+
+    assert report[stuck]["Error"] == "instance is not in a state that allows stop_instances"
+    assert report[stuck]["Completed"] is False
+    assert all(report[i]["Completed"] and not report[i]["Error"] for i in ids if i != stuck)
+
+
+def test_fleet_filters_skip_terminated_instances(ec2_client: EC2Client) -> None:
+    created = boto3.resource("ec2", region_name="us-east-1").create_instances(
+        ImageId="ami-00000000", MinCount=2, MaxCount=2, InstanceType="t3.micro"
+    )
+    created[0].terminate()
+
+    report = ec2_client.stop_instances(
+        filters=[{"Name": "instance-type", "Values": ["t3.micro"]}], wait=False
+    )
+
+    assert list(report) == [created[1].id]
+
+
+def test_wait_for_fleet_reports_ids_not_yet_visible(ec2_client: EC2Client, instance_id: str) -> None:
+    ghost = "i-0123456789abcdef1"
+    ec2_client.stop_instances([instance_id], wait=False)
+    report = {
+        i: {"InstanceId": i, "CurrentState": None, "Completed": False, "Error": None}
+        for i in (instance_id, ghost)
+    }
+
+    ec2_client._wait_for_fleet(report, "stopped", timeout=0.2, poll_interval=0.01, max_workers=2)
+
+    assert report[instance_id]["Completed"] is True
+    assert report[ghost]["Completed"] is False
+    assert report[ghost]["Error"] == "instance not found"
+
+
+def test_stop_instances_without_wait(ec2_client: EC2Client, instance_id: str) -> None:
+    report = ec2_client.stop_instances([instance_id], wait=False)
+    assert report[instance_id]["CurrentState"] == "stopping"
+    assert report[instance_id]["Completed"] is False
+
+
+def test_get_instance_coalesced(ec2_client: EC2Client, instance_id: str) -> None:
+    ec2_client.enable_coalescing(window=0.05)
+    lookups = [instance_id] * 5 + ["i-0123456789abcdef0"]
+    with patch.object(ec2_client._ec2, "get_paginator", wraps=ec2_client._ec2.get_paginator) as spy:
+        results = fan_out(
+            lambda i: ec2_client.get_instance(i)["InstanceId"], lookups, return_exceptions=True
+        )
+    assert results[:5] == [instance_id] * 5
+    assert isinstance(results[5], ResourceNotFoundError)
+    assert spy.call_count < len(lookups)
+    ec2_client.disable_coalescing()
+
+
+def test_get_instance_coalesced_with_malformed_id(ec2_client: EC2Client, instance_id: str) -> None:
+    ec2_client.enable_coalescing(window=0.05)
+    results = fan_out(
+        lambda i: ec2_client.get_instance(i)["InstanceId"],
+        [instance_id, "bogus-id"],
+        return_exceptions=True,
+    )
+    ec2_client.disable_coalescing()
+    assert results[0] == instance_id
+    assert isinstance(results[1], ResourceNotFoundError)
+
+
+def test_ids_in_message_matches_whole_ids() -> None:
+    message = 'Invalid id: "bogus-id" (expecting "i-..."); i-0abc does not exist'
+    assert _ids_in_message(message, ["bogus-id", "i-0abc", "i-0ab", "i-1"]) == {"bogus-id", "i-0abc"}
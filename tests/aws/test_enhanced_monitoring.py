@@ -0,0 +1,88 @@
+"""Tests for aws/enhanced_monitoring.py using moto."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import boto3
+import numpy as np
+import pytest
+from moto import mock_aws
+
+from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.aws.enhanced_monitoring import get_os_metrics, parse_os_metrics
+
+
+@pytest.fixture()
+def cw_client():
+    with mock_aws():
+        yield CloudWatchClient(region="us-east-1")
+
+
+def _doc(resource_id: str, cpu: float, processes: dict[str, float]) -> str:
+    return json.dumps(
+        {
+            "engine": "POSTGRES",
+            "instanceID": f"db-{resource_id[-1].lower()}",
+            "instanceResourceID": resource_id,
+            "cpuUtilization": {"total": cpu, "user": cpu - 1, "idle": 100 - cpu},
+            "memory": {"total": 4096, "free": 1024},
+            "diskIO": [
+                {"device": "rdsdev", "readIOsPS": 10, "writeIOsPS": 5, "util": 20},
+                {"device": "filesystem", "readIOsPS": 2, "writeIOsPS": 1, "util": 60},
+            ],
+            "processList": [
+                {"name": name, "cpuUsedPc": used} for name, used in processes.items()
+            ],
+        }
+    )
+
+
+def _event(resource_id: str, ts: int, cpu: float, processes: dict[str, float]) -> dict:
+    return {"timestamp": ts, "message": _doc(resource_id, cpu, processes), "logStreamName": resource_id}
+
+
+def test_parse_os_metrics_builds_aligned_series() -> None:
+    events = [
+        _event("db-AAA", 1_700_000_000_000, 30.0, {"postgres": 10.0, "vacuum": 5.0, "idle": 0.1}),
+        {"timestamp": 1_700_000_030_000, "message": "not json", "logStreamName": "db-AAA"},
+        _event("db-AAA", 1_700_000_060_000, 50.0, {"postgres": 12.0, "analyze": 8.0}),
+    ]
+
+    series = parse_os_metrics(events, top_processes=2)["db-AAA"]
+
+    assert len(series) == 2
+    assert series.instance_id == "db-a"
+    assert series.timestamps[0] == np.datetime64(1_700_000_000, "s")
+    assert series.cpu["total"].tolist() == [30.0, 50.0]
+    assert np.isnan(series.cpu["steal"]).all()
+    assert series.disk_io["readIOsPS"].tolist() == [12.0, 12.0]
+    assert series.disk_io["util"].tolist() == [60.0, 60.0]
+    assert set(series.processes) == {"postgres", "vacuum", "analyze"}
+    assert series.processes["postgres"].tolist() == [10.0, 12.0]
+    assert np.isnan(series.processes["vacuum"][1])
+    assert np.isnan(series.processes["analyze"][0])
+
+
+def test_get_os_metrics_reads_instances_concurrently(cw_client: CloudWatchClient) -> None:
+    logs = boto3.client("logs", region_name="us-east-1")
+    logs.create_log_group(logGroupName="RDSOSMetrics")
+    start = datetime.now(UTC) - timedelta(minutes=30)
+    base = int(start.timestamp() * 1000) + 1000
+    for resource_id in ("db-AAA", "db-BBB", "db-CCC"):
+        logs.create_log_stream(logGroupName="RDSOSMetrics", logStreamName=resource_id)
+        logs.put_log_events(
+            logGroupName="RDSOSMetrics",
+            logStreamName=resource_id,
+            logEvents=[
+                {"timestamp": base + i * 60_000, "message": _doc(resource_id, float(i), {"postgres": i})}
+                for i in range(5)
+            ],
+        )
+
+    result = get_os_metrics(cw_client, ["db-AAA", "db-BBB", "db-MISSING"], start, max_workers=2)
+
+    assert sorted(result) == ["db-AAA", "db-BBB"]
+    assert result["db-BBB"].cpu["total"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert result["db-AAA"].memory["free"].tolist() == [1024.0] * 5
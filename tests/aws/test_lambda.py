@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import json
+import threading
 import zipfile
 from io import BytesIO
+from unittest.mock import patch
 
 import boto3
 import pytest
 from moto import mock_aws
 
-from devops_framework.aws.lambda_ import LambdaClient
-from devops_framework.core.exceptions import ResourceNotFoundError
+import devops_framework.aws.lambda_ as lambda_module
+from devops_framework.aws.lambda_ import LambdaClient, parse_report_line
+from devops_framework.core.exceptions import AWSAPIError, ResourceNotFoundError
 
 
 def _make_lambda_zip(handler_code: str = "def handler(event, context): return {'ok': True}") -> bytes:
@@ -73,8 +76,6 @@ def test_get_function_not_found(lambda_client: LambdaClient) -> None:
 
 def test_invoke_function(lambda_client: LambdaClient, function_name: str) -> None:
     """Invoke is tested with a patched boto3 client to avoid docker dependency."""
-    from io import BytesIO
-    from unittest.mock import MagicMock, patch
 
     fake_payload = BytesIO(b'{"ok": true}')
     fake_response = {
@@ -88,3 +89,125 @@ def test_invoke_function(lambda_client: LambdaClient, function_name: str) -> Non
 
     assert result["StatusCode"] == 200
     assert result["Payload"] == {"ok": True}
+
+
+def _throttle() -> Exception:
+    return AWSAPIError("throttled", status_code=429, details={"error_code": "TooManyRequestsException"})
+
+
+def test_invoke_many_ordered_with_throttle_retries(lambda_client: LambdaClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(lambda_module.time, "sleep", lambda _seconds: None)
+    throttled: set[int] = set()
+    lock = threading.Lock()
+
+    def fake_invoke(name, payload, invocation_type):
+        with lock:
+            if payload["n"] % 3 == 0 and payload["n"] not in throttled:
+                throttled.add(payload["n"])
+                raise _throttle()
+        return {"StatusCode": 200, "Payload": payload["n"] * 2}
+
+    with patch.object(lambda_client, "invoke", side_effect=fake_invoke):
+        results = list(lambda_client.invoke_many("fn", ({"n": n} for n in range(40)), max_concurrency=4))
+
+    assert [index for index, _ in results] == list(range(40))
+    assert [r["Payload"] for _, r in results] == [n * 2 for n in range(40)]
+    assert len(throttled) == 14
+
+
+def test_invoke_many_unordered_returns_exceptions(lambda_client: LambdaClient) -> None:
+    def fake_invoke(name, payload, invocation_type):
+        if payload["n"] == 2:
+            raise AWSAPIError("boom", details={"error_code": "ServiceException"})
+        return {"StatusCode": 202, "Payload": ""}
+
+    with patch.object(lambda_client, "invoke", side_effect=fake_invoke) as spy:
+        results = dict(
+            lambda_client.invoke_many(
+                "fn", [{"n": n} for n in range(5)], invocation_type="Event", ordered=False, return_exceptions=True
+            )
+        )
+
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert isinstance(results[2], AWSAPIError)
+    assert spy.call_args.args[2] == "Event"
+    with patch.object(lambda_client, "invoke", side_effect=fake_invoke):
+        with pytest.raises(AWSAPIError):
+            list(lambda_client.invoke_many("fn", [{"n": n} for n in range(5)]))
+
+
+def test_parse_report_line() -> None:
+    log = (
+        "START RequestId: abc Version: $LATEST\n"
+        "END RequestId: abc\n"
+        "REPORT RequestId: abc\tDuration: 12.34 ms\tBilled Duration: 13 ms\t"
+        "Memory Size: 128 MB\tMax Memory Used: 64 MB\tInit Duration: 150.22 ms\t\n"
+    )
+    assert parse_report_line(log) == {
+        "duration_ms": 12.34,
+        "billed_duration_ms": 13.0,
+        "memory_size_mb": 128.0,
+        "max_memory_used_mb": 64.0,
+        "init_duration_ms": 150.22,
+    }
+    assert parse_report_line("no report here") is None
+
+
+def test_parse_report_line_snapstart() -> None:
+    log = (
+        "REPORT RequestId: abc\tDuration: 10.00 ms\tBilled Duration: 11 ms\t"
+        "Memory Size: 128 MB\tMax Memory Used: 64 MB\t"
+        "Restore Duration: 250.50 ms\tBilled Restore Duration: 100 ms\t\n"
+    )
+    report = parse_report_line(log)
+    assert report is not None
+    assert report["duration_ms"] == 10.0
+    assert report["billed_duration_ms"] == 11.0
+    assert report["restore_duration_ms"] == 250.5
+    assert report["billed_restore_duration_ms"] == 100.0
+
+
+def test_benchmark_summarises_reports(lambda_client: LambdaClient) -> None:
+    calls = iter(range(10))
+
+    def fake_invoke(name, payload, log_type):
+        n = next(calls)
+        init = "\tInit Duration: 200.0 ms" if n < 2 else ""
+        return {
+            "StatusCode": 200,
+            "LogResult": f"REPORT RequestId: r{n}\tDuration: {10 + n}.0 ms\tBilled Duration: {11 + n} ms\t"
+            f"Memory Size: 256 MB\tMax Memory Used: {60 + n} MB{init}",
+        }
+
+    with patch.object(lambda_client, "invoke", side_effect=fake_invoke) as spy:
+        report = lambda_client.benchmark("fn", invocations=10, concurrency=1)
+
+    assert spy.call_args.kwargs["log_type"] == "Tail"
+    assert report["cold_starts"] == 2
+    assert report["cold_start_ratio"] == 0.2
+    assert report["duration_ms"]["max"] == 19.0
+    assert report["max_memory_used_mb"] == 69.0
+    assert report["client_ms"]["p50"] >= 0
+
+
+def test_list_functions_enriched_caches_by_revision(lambda_client: LambdaClient, function_name: str) -> None:
+    raw = boto3.client("lambda", region_name="us-east-1")
+    arn = raw.get_function(FunctionName=function_name)["Configuration"]["FunctionArn"]
+    raw.tag_resource(Resource=arn, Tags={"team": "payments"})
+    raw.put_function_concurrency(FunctionName=function_name, ReservedConcurrentExecutions=5)
+    version = raw.publish_version(FunctionName=function_name)["Version"]
+    raw.create_alias(FunctionName=function_name, Name="live", FunctionVersion=version)
+
+    functions = lambda_client.list_functions_enriched()
+    assert len(functions) == 1
+    fn = functions[0]
+    assert fn["Tags"] == {"team": "payments"}
+    assert fn["ReservedConcurrentExecutions"] == 5
+    assert [a["Name"] for a in fn["Aliases"]] == ["live"]
+
+    with patch.object(lambda_client, "get_function", wraps=lambda_client.get_function) as spy:
+        again = lambda_client.list_functions_enriched()
+        assert spy.call_count == 0
+        assert again[0]["Tags"] == {"team": "payments"}
+        lambda_client.list_functions_enriched(force=True)
+        assert spy.call_count == 1
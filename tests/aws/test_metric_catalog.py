@@ -0,0 +1,76 @@
+"""Tests for aws/metric_catalog.py using moto."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.aws.metric_catalog import MetricCatalog
+
+
+def _put(namespace: str, name: str, **dimensions: str) -> None:
+    boto3.client("cloudwatch", region_name="us-east-1").put_metric_data(
+        Namespace=namespace,
+        MetricData=[
+            {
+                "MetricName": name,
+                "Dimensions": [{"Name": k, "Value": v} for k, v in dimensions.items()],
+                "Value": 1.0,
+            }
+        ],
+    )
+
+
+@pytest.fixture()
+def cw_client():
+    with mock_aws():
+        _put("App/Web", "Latency", InstanceId="i-1")
+        _put("App/Web", "Errors", InstanceId="i-1")
+        _put("App/Web", "Latency", InstanceId="i-2")
+        _put("App/Jobs", "Duration", Queue="q1")
+        yield CloudWatchClient(region="us-east-1")
+
+
+def test_find_intersects_index(cw_client: CloudWatchClient) -> None:
+    catalog = MetricCatalog(cw_client, namespaces=["App/Web", "App/Jobs"])
+    assert catalog.refresh() == 4
+
+    by_instance = catalog.find(dimensions={"InstanceId": "i-1"})
+    assert sorted(m["MetricName"] for m in by_instance) == ["Errors", "Latency"]
+    assert len(catalog.find(namespace="App/Web", metric_name="Latency")) == 2
+    assert len(catalog.find(dimensions={"InstanceId": None})) == 3
+    assert catalog.find(namespace="App/Jobs", dimensions={"InstanceId": "i-1"}) == []
+    assert catalog.dimension_values("InstanceId") == ["i-1", "i-2"]
+    assert catalog.namespaces() == ["App/Jobs", "App/Web"]
+
+
+def test_refresh_is_incremental_when_recent(cw_client: CloudWatchClient) -> None:
+    catalog = MetricCatalog(cw_client)
+    catalog.refresh()
+    _put("App/Web", "Latency", InstanceId="i-3")
+
+    with patch.object(cw_client, "iter_metrics", wraps=cw_client.iter_metrics) as spy:
+        added = catalog.refresh()
+
+    assert added == 1
+    assert spy.call_args.kwargs["recently_active"] == "PT3H"
+    assert len(catalog.find(dimensions={"InstanceId": "i-3"})) == 1
+
+
+def test_save_and_load_round_trip(cw_client: CloudWatchClient, tmp_path) -> None:
+    catalog = MetricCatalog(cw_client, namespaces=["App/Web"])
+    catalog.refresh()
+    catalog.save(tmp_path / "catalog.json")
+
+    restored = MetricCatalog(cw_client, namespaces=["App/Web"])
+    restored.load(tmp_path / "catalog.json")
+    assert len(restored) == 3
+    assert restored.refreshed_at == catalog.refreshed_at
+
+    other = MetricCatalog(cw_client, namespaces=["App/Jobs"])
+    other.load(tmp_path / "catalog.json")
+    assert len(other) == 0
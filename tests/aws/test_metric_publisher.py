@@ -0,0 +1,114 @@
+"""Tests for aws/metric_publisher.py using moto."""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from moto import mock_aws
+
+from devops_framework.aws.cloudwatch import CloudWatchClient, _batch_metric_data
+from devops_framework.aws.metric_publisher import EMFWriter, MetricPublisher
+from devops_framework.core.exceptions import AWSAPIError
+
+
+@pytest.fixture()
+def cw_client():
+    with mock_aws():
+        yield CloudWatchClient(region="us-east-1")
+
+
+def test_batch_metric_data_respects_item_and_size_limits() -> None:
+    data = [{"MetricName": f"m{i}", "Value": 1.0} for i in range(2500)]
+    assert [len(b) for b in _batch_metric_data(data)] == [1000, 1000, 500]
+    big = [{"MetricName": "x" * 200, "Value": 1.0} for _ in range(100)]
+    batches = _batch_metric_data(big, max_bytes=5_000)
+    assert all(sum(len(json.dumps(d)) + 1 for d in b) <= 5_000 for b in batches)
+    assert sum(len(b) for b in batches) == 100
+
+
+def test_publisher_aggregates_into_statistic_sets(cw_client: CloudWatchClient) -> None:
+    now = datetime.now(UTC).replace(second=0, microsecond=0) - timedelta(minutes=5)
+    with patch.object(cw_client, "put_metric_data", wraps=cw_client.put_metric_data) as spy:
+        with MetricPublisher(cw_client, "Test/App", flush_interval=None) as publisher:
+            for value in (1.0, 5.0, 3.0):
+                publisher.put("Latency", value, unit="Milliseconds", dimensions={"Service": "api"}, timestamp=now)
+            publisher.put("Errors", 1, dimensions={"Service": "api"}, timestamp=now)
+            assert publisher.pending == 2
+
+    assert spy.call_count == 1
+    data = {d["MetricName"]: d for d in spy.call_args.args[1]}
+    assert data["Latency"]["StatisticValues"] == {"SampleCount": 3.0, "Sum": 9.0, "Minimum": 1.0, "Maximum": 5.0}
+
+    points = cw_client.get_metric_statistics(
+        "Test/App", "Latency", [{"Name": "Service", "Value": "api"}],
+        now - timedelta(minutes=1), now + timedelta(minutes=1), period=60, statistics=["Maximum"],
+    )
+    assert points and points[0]["Maximum"] == 5.0
+
+
+def test_publisher_background_flush_when_buffer_full(cw_client: CloudWatchClient) -> None:
+    publisher = MetricPublisher(cw_client, "Test/App", flush_interval=3600, max_buffered=2)
+    with patch.object(cw_client, "put_metric_data") as spy:
+        publisher.put("a", 1)
+        publisher.put("b", 1)
+        for _ in range(100):
+            if spy.called:
+                break
+            time.sleep(0.01)
+        assert spy.called
+        publisher.close()
+    with pytest.raises(RuntimeError):
+        publisher.put("c", 1)
+
+
+def test_publisher_keeps_aggregates_when_flush_fails(cw_client: CloudWatchClient) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    publisher = MetricPublisher(cw_client, "Test/App", flush_interval=None, max_buffered=2)
+    attempts = []
+
+    def failing(namespace, metric_data):
+        attempts.append(metric_data)
+        if len(attempts) == 1:
+            # an observation arriving during the failed flush is merged with the unsent one
+            publisher.put("Latency", 6.0, timestamp=start + timedelta(minutes=1))
+        raise AWSAPIError("throttled")
+
+    with patch.object(cw_client, "put_metric_data", side_effect=failing):
+        publisher.put("Latency", 2.0, timestamp=start)
+        with pytest.raises(AWSAPIError):
+            publisher.put("Latency", 4.0, timestamp=start + timedelta(minutes=1))
+        assert publisher.pending == 2
+        # a third bucket exceeds max_buffered, so the oldest unsent one is dropped
+        with pytest.raises(AWSAPIError):
+            publisher.put("Errors", 1, timestamp=start + timedelta(minutes=2))
+        assert publisher.pending == 2
+
+    with patch.object(cw_client, "put_metric_data") as spy:
+        assert publisher.flush() == 2
+    data = {(d["MetricName"], d["Timestamp"]): d for d in spy.call_args.args[1]}
+    assert ("Latency", start) not in data
+    latency = data[("Latency", start + timedelta(minutes=1))]["StatisticValues"]
+    assert latency == {"SampleCount": 2.0, "Sum": 10.0, "Minimum": 4.0, "Maximum": 6.0}
+    assert publisher.pending == 0
+
+
+def test_emf_writer_splits_documents() -> None:
+    out = io.StringIO()
+    writer = EMFWriter("Test/App", stream=out)
+    metrics = {f"m{i}": float(i) for i in range(150)}
+
+    lines = writer.write(metrics, dimensions={"Service": "api"}, units={"m0": "Count"}, properties={"requestId": "r1"})
+
+    assert len(lines) == 2
+    first = json.loads(out.getvalue().splitlines()[0])
+    directive = first["_aws"]["CloudWatchMetrics"][0]
+    assert directive["Namespace"] == "Test/App"
+    assert directive["Dimensions"] == [["Service"]]
+    assert len(directive["Metrics"]) == 100
+    assert directive["Metrics"][0] == {"Name": "m0", "Unit": "Count"}
+    assert first["Service"] == "api" and first["requestId"] == "r1" and first["m99"] == 99.0
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
 import boto3
 import pytest
 from moto import mock_aws
 
-from devops_framework.aws.rds import RDSClient
+from devops_framework.aws.cloudwatch import CloudWatchClient
+from devops_framework.aws.rds import RDSClient, RDSEventCursor, RDSLogMarkers
+from devops_framework.core.concurrency import fan_out
 from devops_framework.core.exceptions import ResourceNotFoundError
 
 
@@ -48,3 +53,151 @@ def test_get_instance(rds_client: RDSClient, db_identifier: str) -> None:
 def test_get_instance_not_found(rds_client: RDSClient) -> None:
     with pytest.raises(ResourceNotFoundError):
         rds_client.get_instance("nonexistent-db")
+
+
+def test_get_instance_coalesced(rds_client: RDSClient, db_identifier: str) -> None:
+    rds_client.enable_coalescing(window=0.05)
+    results = fan_out(
+        lambda ident: rds_client.get_instance(ident)["DBInstanceIdentifier"],
+        [db_identifier, db_identifier, "missing-db"],
+        return_exceptions=True,
+    )
+    assert results[:2] == [db_identifier, db_identifier]
+    assert isinstance(results[2], ResourceNotFoundError)
+    rds_client.disable_coalescing()
+
+
+def _event(source: str, source_type: str, minute: int, message: str = "event") -> dict:
+    return {
+        "SourceIdentifier": source,
+        "SourceType": source_type,
+        "SourceArn": f"arn:aws:rds:us-east-1:123456789012:{source}",
+        "Message": message,
+        "Date": datetime(2024, 1, 1, 0, minute, tzinfo=UTC),
+    }
+
+
+def test_get_fleet_events_groups_one_stream(rds_client: RDSClient) -> None:
+    pages = [
+        {"Events": [_event("db-1", "db-instance", 1), _event("snap-1", "db-snapshot", 2)]},
+        {"Events": [_event("cluster-1", "db-cluster", 3), _event("db-1", "db-instance", 4, "restarted")]},
+    ]
+    with patch.object(rds_client, "_iter_pages", return_value=iter(pages)) as spy:
+        grouped = rds_client.get_fleet_events(event_categories=["failover"], duration=60)
+
+    assert spy.call_count == 1
+    assert spy.call_args.kwargs == {"EventCategories": ["failover"], "Duration": 60}
+    assert sorted(grouped) == ["cluster-1", "db-1"]
+    assert [e["Message"] for e in grouped["db-1"]] == ["event", "restarted"]
+
+
+def test_get_fleet_events_cursor_skips_seen(rds_client: RDSClient, tmp_path) -> None:
+    cursor = RDSEventCursor()
+    first = [{"Events": [_event("db-1", "db-instance", 1), _event("db-2", "db-instance", 2)]}]
+    with patch.object(rds_client, "_iter_pages", return_value=iter(first)):
+        assert len(rds_client.get_fleet_events(cursor=cursor)) == 2
+    cursor.save(tmp_path / "cursor.json")
+    cursor = RDSEventCursor.load(tmp_path / "cursor.json")
+
+    # the service returns the boundary event again along with new ones
+    second = [{"Events": [_event("db-2", "db-instance", 2), _event("db-2", "db-instance", 2, "other"), _event("db-3", "db-instance", 5)]}]
+    with patch.object(rds_client, "_iter_pages", return_value=iter(second)) as spy:
+        grouped = rds_client.get_fleet_events(cursor=cursor)
+
+    assert "StartTime" in spy.call_args.kwargs
+    assert [e["Message"] for e in grouped["db-2"]] == ["other"]
+    assert list(grouped) == ["db-2", "db-3"]
+    assert cursor.last_seen.minute == 5
+
+
+def test_get_instance_events_follows_pages(rds_client: RDSClient) -> None:
+    pages = [{"Events": [_event("db-1", "db-instance", 1)]}, {"Events": [_event("db-1", "db-instance", 2)]}]
+    with patch.object(rds_client, "_iter_pages", return_value=iter(pages)) as spy:
+        events = rds_client.get_instance_events("db-1", duration=30)
+
+    assert len(events) == 2
+    assert spy.call_args.kwargs == {"SourceIdentifier": "db-1", "SourceType": "db-instance", "Duration": 30}
+
+
+def test_list_log_files(rds_client: RDSClient, db_identifier: str) -> None:
+    files = rds_client.list_log_files(db_identifier)
+    assert files and all("LogFileName" in f for f in files)
+
+
+def test_list_log_files_missing_instance(rds_client: RDSClient) -> None:
+    with pytest.raises(ResourceNotFoundError):
+        rds_client.list_log_files("nonexistent-db")
+
+
+class _FakeLogFile:
+    """Serve ``text`` through download_db_log_file_portion in fixed-size portions."""
+
+    def __init__(self, text: str, portion: int = 4) -> None:
+        self.text = text
+        self.portion = portion
+        self.calls: list[str] = []
+
+    def __call__(self, DBInstanceIdentifier: str, LogFileName: str, Marker: str, **_: object) -> dict:
+        self.calls.append(Marker)
+        start = int(Marker)
+        end = min(start + self.portion, len(self.text))
+        return {
+            "LogFileData": self.text[start:end],
+            "Marker": str(end),
+            "AdditionalDataPending": end < len(self.text),
+        }
+
+
+def test_iter_log_file_follows_markers(rds_client: RDSClient) -> None:
+    fake = _FakeLogFile("line one\nline two\n")
+    with patch.object(rds_client._rds, "download_db_log_file_portion", side_effect=fake):
+        portions = list(rds_client.iter_log_file("test-db", "error/mysql-error.log"))
+    assert "".join(data for data, _ in portions) == fake.text
+    assert portions[-1][1] == str(len(fake.text))
+    assert fake.calls[0] == "0"
+
+
+def test_download_log_files_resumes_from_markers(
+    rds_client: RDSClient, db_identifier: str, tmp_path
+) -> None:
+    name = rds_client.list_log_files(db_identifier)[0]["LogFileName"]
+    fake = _FakeLogFile("first\n")
+    markers = RDSLogMarkers()
+    with patch.object(rds_client._rds, "download_db_log_file_portion", side_effect=fake):
+        written = rds_client.download_log_files(db_identifier, tmp_path, markers=markers)
+    assert written == {name: 6}
+    markers.save(tmp_path / "markers.json")
+
+    fake.text += "second\n"
+    fake.calls.clear()
+    markers = RDSLogMarkers.load(tmp_path / "markers.json")
+    with patch.object(rds_client._rds, "download_db_log_file_portion", side_effect=fake):
+        written = rds_client.download_log_files(db_identifier, tmp_path, markers=markers)
+    assert written == {name: 7}
+    assert fake.calls[0] == "6"
+    assert (tmp_path / db_identifier / name).read_text() == "first\nsecond\n"
+
+
+def test_fleet_health_joins_metrics(rds_client: RDSClient, db_identifier: str) -> None:
+    cloudwatch = CloudWatchClient(region="us-east-1")
+    cloudwatch._cw.put_metric_data(
+        Namespace="AWS/RDS",
+        MetricData=[
+            {
+                "MetricName": "CPUUtilization",
+                "Dimensions": [{"Name": "DBInstanceIdentifier", "Value": db_identifier}],
+                "Timestamp": datetime.now(UTC) - timedelta(minutes=5),
+                "Value": 42.0,
+            }
+        ],
+    )
+    with patch.object(cloudwatch, "_iter_pages", wraps=cloudwatch._iter_pages) as spy:
+        table = rds_client.fleet_health(cloudwatch=cloudwatch)
+
+    now = datetime.now(UTC)
+    print('DBG', cloudwatch._cw.get_metric_data(MetricDataQueries=[{"Id":"a","MetricStat":{"Metric":{"Namespace":"AWS/RDS","MetricName":"CPUUtilization","Dimensions":[{"Name": "DBInstanceIdentifier", "Value": db_identifier}]},"Period":300,"Stat":"Average"}}], StartTime=now-timedelta(hours=1), EndTime=now))
+    assert spy.call_count == 1
+    assert table["identifier"] == [db_identifier]
+    assert table["engine"] == ["mysql"]
+    assert table["cpu_utilization"] == [42.0]
+    assert table["replica_lag"] == [None]
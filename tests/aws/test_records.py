@@ -0,0 +1,69 @@
+"""Tests for aws/records.py and the compact projection methods."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from devops_framework.aws.ec2 import EC2Client
+from devops_framework.aws.records import EC2InstanceRecord, extract_field, project_columns
+
+ITEM = {
+    "InstanceId": "i-1",
+    "State": {"Name": "running"},
+    "Tags": [{"Key": "Name", "Value": "web"}],
+}
+
+
+@pytest.fixture()
+def ec2_client():
+    with mock_aws():
+        boto3.resource("ec2", region_name="us-east-1").create_instances(
+            ImageId="ami-00000000",
+            MinCount=2,
+            MaxCount=2,
+            InstanceType="t3.micro",
+            TagSpecifications=[{"ResourceType": "instance", "Tags": [{"Key": "Name", "Value": "web"}]}],
+        )
+        yield EC2Client(region="us-east-1")
+
+
+def test_extract_field_paths() -> None:
+    assert extract_field(ITEM, "State.Name") == "running"
+    assert extract_field(ITEM, "tag:Name") == "web"
+    assert extract_field(ITEM, "Placement.AvailabilityZone") is None
+    assert extract_field(ITEM, "InstanceId.Nested") is None
+
+
+def test_project_columns() -> None:
+    columns = project_columns([ITEM, {"InstanceId": "i-2"}], ["InstanceId", "State.Name"])
+    assert columns == {"InstanceId": ["i-1", "i-2"], "State.Name": ["running", None]}
+
+
+def test_records_are_slotted() -> None:
+    record = EC2InstanceRecord.from_api(ITEM)
+    assert not hasattr(record, "__dict__")
+    assert record.name == "web"
+
+
+def test_list_instance_records(ec2_client: EC2Client) -> None:
+    records = ec2_client.list_instance_records()
+    assert len(records) == 2
+    assert all(r.name == "web" and r.instance_type == "t3.micro" for r in records)
+    assert isinstance(records[0].launch_time, datetime)
+
+
+def test_list_instance_records_raw_timestamps(ec2_client: EC2Client) -> None:
+    [record, _] = ec2_client.list_instance_records(parse_timestamps=False)
+    assert isinstance(record.launch_time, str)
+    # the default client keeps parsing timestamps
+    assert isinstance(ec2_client.list_instances()[0]["LaunchTime"], datetime)
+
+
+def test_list_instance_columns(ec2_client: EC2Client) -> None:
+    columns = ec2_client.list_instance_columns(["InstanceId", "tag:Name"])
+    assert columns["tag:Name"] == ["web", "web"]
+    assert len(columns["InstanceId"]) == 2
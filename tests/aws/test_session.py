@@ -0,0 +1,70 @@
+"""Tests for aws/session.py (shared session and client pool)."""
+
+from __future__ import annotations
+
+import threading
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from devops_framework.aws.ec2 import EC2Client
+from devops_framework.aws.rds import RDSClient
+from devops_framework.aws.session import ClientPool, get_client_pool
+
+
+@pytest.fixture()
+def pool() -> ClientPool:
+    return ClientPool()
+
+
+def test_session_shared_per_key(pool: ClientPool) -> None:
+    a = pool.session("us-east-1")
+    b = pool.session("us-east-1")
+    c = pool.session("eu-west-1")
+    assert a is b
+    assert a is not c
+
+
+def test_client_shared_per_service(pool: ClientPool) -> None:
+    ec2_a = pool.client("ec2", "us-east-1")
+    ec2_b = pool.client("ec2", "us-east-1")
+    rds = pool.client("rds", "us-east-1")
+    assert ec2_a is ec2_b
+    assert ec2_a is not rds
+    assert len(pool) == 2
+
+
+def test_factory_called_once(pool: ClientPool) -> None:
+    calls: list[int] = []
+
+    def factory() -> boto3.Session:
+        calls.append(1)
+        return boto3.Session(region_name="us-east-1")
+
+    threads = [
+        threading.Thread(target=pool.client, args=("sts", "us-east-1", None, "arn:role"), kwargs={"factory": factory})
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == [1]
+    assert len(pool) == 1
+
+
+def test_clear(pool: ClientPool) -> None:
+    pool.client("ec2", "us-east-1")
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_aws_clients_share_pool() -> None:
+    with mock_aws():
+        first = EC2Client(region="us-east-1")
+        second = EC2Client(region="us-east-1")
+        assert first._ec2 is second._ec2
+        assert first.session is RDSClient(region="us-east-1").session
+        assert first.health_check() is True
+        assert len(get_client_pool()) == 2
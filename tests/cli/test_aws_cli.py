@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -54,8 +55,85 @@ def test_list_db_instances_empty() -> None:
     assert result.exit_code == 0
 
 
+def test_db_health_prints_table() -> None:
+    snapshot = {
+        "identifier": ["db-1"],
+        "cluster": ["aurora-1"],
+        "role": ["writer"],
+        "engine": ["aurora-mysql"],
+        "instance_class": ["db.r6g.large"],
+        "status": ["available"],
+        "cpu_utilization": [12.5],
+        "database_connections": [40.0],
+        "freeable_memory": [2 * 1024**3],
+        "replica_lag": [None],
+        "free_storage_space": [None],
+    }
+    with patch("devops_framework.cli.aws.RDSClient") as MockRDS:
+        MockRDS.return_value.fleet_health.return_value = snapshot
+        result = runner.invoke(app, ["aws", "db-health"])
+    assert result.exit_code == 0
+    assert "db-1" in result.output
+    assert "12.5%" in result.output
+
+
 def test_list_log_groups_empty() -> None:
     with patch("devops_framework.cli.aws.CloudWatchClient") as MockCW:
         MockCW.return_value.list_log_groups.return_value = []
         result = runner.invoke(app, ["aws", "list-log-groups"])
     assert result.exit_code == 0
+
+
+def test_list_instances_all_regions() -> None:
+    fake_instance = {"InstanceId": "i-12345", "State": {"Name": "running"}, "Region": "eu-west-1"}
+    with patch("devops_framework.cli.aws.EC2Client") as MockEC2:
+        MockEC2.return_value.across_regions.return_value = [fake_instance]
+        result = runner.invoke(app, ["aws", "list-instances", "--region", "all"])
+    assert result.exit_code == 0
+    MockEC2.assert_called_once_with(region=None, profile=None)
+    MockEC2.return_value.across_regions.assert_called_once_with("list_instances", regions="all")
+    assert "eu-west-1" in result.output
+
+
+def test_invoke_function_reads_jsonl_from_stdin() -> None:
+    payloads: list[dict] = []
+
+    def fake_invoke_many(name, items, **kwargs):
+        payloads.extend(items)
+        return iter([(1, {"StatusCode": 202}), (0, RuntimeError("throttled"))])
+
+    with patch("devops_framework.cli.aws.LambdaClient") as MockLambda:
+        MockLambda.return_value.invoke_many.side_effect = fake_invoke_many
+        result = runner.invoke(
+            app, ["aws", "invoke-function", "fn", "--stdin", "--async", "-c", "8"], input='{"a": 1}\n\n{"a": 2}\n'
+        )
+
+    assert result.exit_code == 1
+    call = MockLambda.return_value.invoke_many.call_args
+    assert payloads == [{"a": 1}, {"a": 2}]
+    assert call.kwargs["invocation_type"] == "Event"
+    assert call.kwargs["max_concurrency"] == 8
+    lines = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+    assert lines[0] == {"index": 1, "StatusCode": 202}
+    assert lines[1]["error"] == "throttled"
+
+
+def test_benchmark_function_prints_summary() -> None:
+    summary = {"p50": 10.0, "p90": 12.0, "p99": 15.0, "mean": 10.5, "max": 16.0}
+    with patch("devops_framework.cli.aws.LambdaClient") as MockLambda:
+        MockLambda.return_value.benchmark.return_value = {
+            "invocations": 20,
+            "errors": 0,
+            "cold_starts": 1,
+            "cold_start_ratio": 0.05,
+            "client_ms": summary,
+            "duration_ms": summary,
+            "billed_duration_ms": None,
+            "init_duration_ms": None,
+            "max_memory_used_mb": 70.0,
+            "memory_size_mb": 128.0,
+        }
+        result = runner.invoke(app, ["aws", "benchmark-function", "fn", "-n", "20", "-c", "5"])
+    assert result.exit_code == 0
+    MockLambda.return_value.benchmark.assert_called_once_with("fn", None, 20, 5)
+    assert "5.0%" in result.output
@@ -9,6 +9,7 @@ import boto3
 import pytest
 from moto import mock_aws
 
+from devops_framework.aws.session import get_client_pool
 from devops_framework.core.config import Config
 
 
@@ -26,6 +27,14 @@ def clear_aws_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
 
 
+@pytest.fixture(autouse=True)
+def reset_client_pool():
+    """Give every test a fresh process-wide boto3 session/client pool."""
+    get_client_pool().clear()
+    yield
+    get_client_pool().clear()
+
+
 @pytest.fixture()
 def aws_config() -> Config:
     return Config()
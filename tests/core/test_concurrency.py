@@ -0,0 +1,202 @@
+"""Tests for core/concurrency.py."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from devops_framework.core.concurrency import (
+    AdaptiveLimiter,
+    BatchLoader,
+    chain_concurrently,
+    fan_out,
+    prefetch,
+)
+
+
+def test_fan_out_preserves_order() -> None:
+    assert fan_out(lambda x: x * 2, [3, 1, 2]) == [6, 2, 4]
+
+
+def test_fan_out_empty() -> None:
+    assert fan_out(lambda x: x, []) == []
+
+
+def test_fan_out_bounded_workers() -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    gate = threading.Event()
+
+    def work(_: int) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        gate.wait(0.05)
+        with lock:
+            active -= 1
+
+    fan_out(work, range(20), max_workers=3)
+    assert peak <= 3
+
+
+def test_fan_out_raises_first_error() -> None:
+    def work(x: int) -> int:
+        if x == 2:
+            raise ValueError("boom")
+        return x
+
+    with pytest.raises(ValueError):
+        fan_out(work, [1, 2, 3])
+
+
+def test_fan_out_return_exceptions() -> None:
+    def work(x: int) -> int:
+        if x == 2:
+            raise ValueError("boom")
+        return x
+
+    results = fan_out(work, [1, 2, 3], return_exceptions=True)
+    assert results[0] == 1 and results[2] == 3
+    assert isinstance(results[1], ValueError)
+
+
+def test_prefetch_yields_all_items_in_order() -> None:
+    assert list(prefetch(iter(range(5)))) == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_fetches_ahead() -> None:
+    produced: list[int] = []
+    second_ready = threading.Event()
+
+    def pages():
+        for i in range(3):
+            produced.append(i)
+            if i == 1:
+                second_ready.set()
+            yield i
+
+    it = prefetch(pages())
+    assert next(it) == 0
+    assert second_ready.wait(1.0)
+    assert produced[:2] == [0, 1]
+    it.close()
+
+
+def test_prefetch_propagates_errors() -> None:
+    def pages():
+        yield 1
+        raise RuntimeError("page failed")
+
+    it = prefetch(pages())
+    assert next(it) == 1
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_chain_concurrently_reads_sources_in_parallel() -> None:
+    def source(n: int) -> Iterator[int]:
+        for i in range(3):
+            time.sleep(0.05)
+            yield n * 10 + i
+
+    began = time.monotonic()
+    items = list(chain_concurrently([source(n) for n in range(4)], buffer_size=1))
+    assert items == [0, 1, 2, 10, 11, 12, 20, 21, 22, 30, 31, 32]
+    assert time.monotonic() - began < 0.45  # sequential reading takes 0.6s
+
+
+def test_chain_concurrently_raises_source_errors_in_order() -> None:
+    def failing() -> Iterator[int]:
+        yield 1
+        raise RuntimeError("boom")
+
+    it = chain_concurrently([iter([0]), failing()])
+    assert next(it) == 0
+    assert next(it) == 1
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_batch_loader_coalesces_and_dedupes() -> None:
+    batches: list[list[int]] = []
+
+    def batch_fn(keys: list[int]) -> dict[int, int]:
+        batches.append(list(keys))
+        return {k: k * 10 for k in keys if k != 3}
+
+    loader = BatchLoader(batch_fn, window=0.05)
+    keys = [1, 2, 2, 3, 4, 1]
+    results = fan_out(loader.load, keys, max_workers=len(keys))
+
+    assert results == [10, 20, 20, None, 40, 10]
+    assert sum(len(b) for b in batches) == 4
+    assert len(batches) < len(keys)
+
+
+def test_batch_loader_respects_max_batch_size() -> None:
+    sizes: list[int] = []
+
+    def batch_fn(keys: list[int]) -> dict[int, int]:
+        sizes.append(len(keys))
+        return {k: k for k in keys}
+
+    loader = BatchLoader(batch_fn, window=0.05, max_batch_size=2)
+    fan_out(loader.load, range(6), max_workers=6)
+    assert max(sizes) <= 2
+
+
+def test_batch_loader_propagates_errors() -> None:
+    def batch_fn(keys: list[int]) -> dict[int, int]:
+        raise RuntimeError("describe failed")
+
+    loader = BatchLoader(batch_fn, window=0.0)
+    with pytest.raises(RuntimeError):
+        loader.load(1)
+
+
+def test_batch_loader_fails_whole_batch_once_on_other_errors() -> None:
+    calls: list[list[int]] = []
+
+    def batch_fn(keys: list[int]) -> dict[int, int]:
+        calls.append(keys)
+        raise RuntimeError("throttled")
+
+    loader = BatchLoader(batch_fn, window=0.05, is_key_error=lambda exc: False)
+    results = fan_out(loader.load, range(8), max_workers=8, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(calls) == 1
+
+
+def test_batch_loader_isolates_failing_keys() -> None:
+    def batch_fn(keys: list[int]) -> dict[int, int]:
+        if 3 in keys:
+            raise KeyError(3)
+        return {k: k for k in keys}
+
+    loader = BatchLoader(batch_fn, window=0.05, is_key_error=lambda exc: isinstance(exc, KeyError))
+    results = fan_out(loader.load, [1, 2, 3, 4], max_workers=4, return_exceptions=True)
+
+    assert results[:2] == [1, 2]
+    assert isinstance(results[2], KeyError)
+    assert results[3] == 4
+
+
+def test_adaptive_limiter_aimd() -> None:
+    limiter = AdaptiveLimiter(max_limit=8)
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4
+    # a second throttle within the same round does not shrink it again
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4
+    for _ in range(40):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 8
@@ -79,3 +79,13 @@ def test_require_passes_when_set(monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     monkeypatch.setenv("DD_API_KEY", "key")
     cfg = Config(config_path=tmp_path / "nonexistent.yaml")
     cfg.require("datadog_api_key")  # should not raise
+
+
+def test_assume_role_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("AWS_ROLE_SESSION_NAME", raising=False)
+    monkeypatch.delenv("DEVOPS_AWS_CREDENTIAL_CACHE", raising=False)
+    yaml_path = tmp_path / "config.yaml"
+    yaml_path.write_text(yaml.dump({"aws": {"credential_cache_dir": "/tmp/sts-cache"}}))
+    cfg = Config(config_path=yaml_path)
+    assert cfg.aws_role_session_name == "devops-framework"
+    assert cfg.aws_credential_cache_dir == "/tmp/sts-cache"
@@ -0,0 +1,134 @@
+"""Tests for core/timeseries.py."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from devops_framework.core.timeseries import TimeSeriesStore
+
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+S0 = int(T0.timestamp())
+
+
+def _minutes(start: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+    ts = np.arange(start, start + count * 60, 60, dtype="int64")
+    return ts, np.arange(count, dtype="float64")
+
+
+def test_write_and_read_raw(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    ts, vals = _minutes(S0, 120)
+    store.write("k", ts, vals, T0, T0 + timedelta(hours=2))
+
+    out_ts, out_vals = store.read("k", T0 + timedelta(minutes=30), T0 + timedelta(minutes=40))
+    assert out_ts.dtype == np.dtype("datetime64[s]")
+    assert list(out_vals) == [float(v) for v in range(30, 40)]
+    assert store.coverage("k") == [(T0, T0 + timedelta(hours=2))]
+
+
+def test_missing_and_append_only(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    ts, vals = _minutes(S0, 60)
+    store.write("k", ts, vals, T0, T0 + timedelta(hours=1))
+    assert store.missing("k", T0 - timedelta(hours=1), T0 + timedelta(hours=2)) == [
+        (T0 - timedelta(hours=1), T0),
+        (T0 + timedelta(hours=1), T0 + timedelta(hours=2)),
+    ]
+    # overlapping write only adds the uncovered tail
+    ts2, _ = _minutes(S0 + 1800, 60)
+    store.write("k", ts2, np.full(60, 99.0), T0 + timedelta(minutes=30), T0 + timedelta(minutes=90))
+    _, out = store.read("k", T0, T0 + timedelta(minutes=90))
+    assert out.size == 90
+    assert out[59] == 59.0 and out[60] == 99.0
+
+
+def test_rollups_span_segments(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    ts, vals = _minutes(S0, 10)
+    store.write("k", ts[:3], vals[:3], T0, T0 + timedelta(minutes=3))
+    store.write("k", ts[3:], vals[3:], T0 + timedelta(minutes=3), T0 + timedelta(minutes=10))
+
+    buckets, avg = store.read("k", T0, T0 + timedelta(minutes=10), resolution="5m")
+    assert list(avg) == [2.0, 7.0]
+    _, counts = store.read("k", T0, T0 + timedelta(minutes=10), resolution="5m", stat="count")
+    assert list(counts) == [5.0, 5.0]
+    _, peak = store.read("k", T0, T0 + timedelta(hours=1), resolution="1h", stat="max")
+    assert list(peak) == [9.0]
+    with pytest.raises(ValueError):
+        store.read("k", T0, T0 + timedelta(hours=1), resolution="2m")
+
+
+def test_compact_keeps_data(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    for i in range(5):
+        ts, vals = _minutes(S0 + i * 600, 10)
+        store.write("k", ts, vals, T0 + timedelta(minutes=10 * i), T0 + timedelta(minutes=10 * (i + 1)))
+    before = store.read("k", T0, T0 + timedelta(hours=1))
+    store.compact("k")
+    after = store.read("k", T0, T0 + timedelta(hours=1))
+    assert np.array_equal(before[0], after[0]) and np.array_equal(before[1], after[1])
+    assert len(list(store._dir("k").glob("*.ts.npy"))) == 1
+
+
+def test_get_or_fetch_only_fetches_gaps(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    calls: list[tuple[datetime, datetime]] = []
+
+    def fetch(start: datetime, end: datetime):
+        calls.append((start, end))
+        first = int(start.timestamp())
+        return _minutes(first, int((end - start).total_seconds()) // 60)
+
+    store.get_or_fetch("k", T0, T0 + timedelta(hours=1), fetch)
+    ts, _ = store.get_or_fetch("k", T0 + timedelta(minutes=30), T0 + timedelta(hours=2), fetch)
+
+    assert calls == [(T0, T0 + timedelta(hours=1)), (T0 + timedelta(hours=1), T0 + timedelta(hours=2))]
+    assert ts.size == 90
+
+
+def test_get_or_fetch_does_not_cover_unsettled_data(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    now = datetime.now(UTC).replace(microsecond=0)
+    start = now - timedelta(hours=1)
+
+    def fetch(gap_start: datetime, gap_end: datetime):
+        return _minutes(int(gap_start.timestamp()), 60)
+
+    ts, _ = store.get_or_fetch("k", start, now, fetch, settle=timedelta(minutes=15))
+    assert ts.size == 60
+    assert store.missing("k", start, now) == [(now - timedelta(minutes=15), now)]
+
+
+def test_get_or_fetch_aligns_gaps_to_period(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+    now = datetime.now(UTC).replace(microsecond=0)
+    start = now - timedelta(hours=1, seconds=17)
+    calls: list[tuple[datetime, datetime]] = []
+
+    def fetch(gap_start: datetime, gap_end: datetime):
+        calls.append((gap_start, gap_end))
+        return _minutes(int(gap_start.timestamp()), 0)
+
+    store.get_or_fetch("k", start, now, fetch, settle=timedelta(minutes=15), align=300)
+    store.get_or_fetch("k", start, now, fetch, settle=timedelta(minutes=15), align=300)
+
+    assert all(int(t.timestamp()) % 300 == 0 for call in calls for t in call)
+    # the second fetch starts where the settled coverage ended, on the period grid
+    settled = int((now - timedelta(minutes=15)).timestamp())
+    assert int(calls[1][0].timestamp()) == settled - settled % 300
+
+
+def test_get_or_fetch_many_tracks_series_names(tmp_path) -> None:
+    store = TimeSeriesStore(tmp_path)
+
+    def fetch(start: datetime, end: datetime):
+        ts, vals = _minutes(int(start.timestamp()), 10)
+        return {"host:a": (ts, vals), "host:b": (ts, vals * 2)}
+
+    first = store.get_or_fetch_many("q", T0, T0 + timedelta(minutes=10), fetch)
+    second = store.get_or_fetch_many("q", T0, T0 + timedelta(minutes=10), lambda s, e: {})
+    assert sorted(first) == sorted(second) == ["host:a", "host:b"]
+    assert list(second["host:b"][1][:3]) == [0.0, 2.0, 4.0]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from devops_framework.core.exceptions import DatadogAPIError
+from devops_framework.core.timeseries import TimeSeriesStore
 from devops_framework.datadog.metrics import MetricsClient
 
 
@@ -54,3 +56,26 @@ def test_get_metric_metadata(metrics_client: MetricsClient) -> None:
         MockApi.return_value.get_metric_metadata.return_value = fake_resp
         metadata = metrics_client.get_metric_metadata("system.cpu.user")
         assert metadata["type"] == "gauge"
+
+
+def test_query_metric_series_reads_through_store(metrics_client: MetricsClient, tmp_path) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    base_ms = int(start.timestamp()) * 1000
+    fake_resp = MagicMock()
+    fake_resp.to_dict.return_value = {
+        "series": [
+            {"scope": "host:a", "pointlist": [[base_ms, 1.0], [base_ms + 60_000, None], [base_ms + 120_000, 3.0]]},
+            {"scope": "host:b", "pointlist": [[base_ms, 5.0]]},
+        ]
+    }
+    store = TimeSeriesStore(tmp_path)
+
+    with patch("devops_framework.datadog.metrics.ApiClient"), \
+         patch("devops_framework.datadog.metrics.MetricsApi") as MockApi:
+        MockApi.return_value.query_metrics.return_value = fake_resp
+        first = metrics_client.query_metric_series(store, "avg:cpu{*} by {host}", start, start + timedelta(hours=1))
+        second = metrics_client.query_metric_series(store, "avg:cpu{*} by {host}", start, start + timedelta(hours=1))
+
+    assert MockApi.return_value.query_metrics.call_count == 1
+    assert list(first["host:a"][1]) == list(second["host:a"][1]) == [1.0, 3.0]
+    assert list(second["host:b"][1]) == [5.0]
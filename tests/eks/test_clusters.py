@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import boto3
 import pytest
 from moto import mock_aws
 
-from devops_framework.eks.clusters import ClusterClient
 from devops_framework.core.exceptions import ResourceNotFoundError
+from devops_framework.eks.clusters import ClusterClient
 
 
 @pytest.fixture()
@@ -86,3 +88,39 @@ def test_cluster_contains_metadata(cluster_client: ClusterClient, cluster_name:
     assert "version" in cluster
     assert "roleArn" in cluster
     assert "resourcesVpcConfig" in cluster
+
+
+def _create_clusters(count: int) -> None:
+    boto_eks = boto3.client("eks", region_name="us-east-1")
+    for i in range(1, count + 1):
+        boto_eks.create_cluster(
+            name=f"cluster-{i}",
+            version="1.28",
+            roleArn="arn:aws:iam::123456789012:role/eks-service-role",
+            resourcesVpcConfig={"subnetIds": ["subnet-12345", "subnet-67890"]},
+        )
+
+
+def test_list_cluster_names(cluster_client: ClusterClient) -> None:
+    _create_clusters(3)
+    with patch.object(cluster_client, "get_cluster") as spy:
+        names = cluster_client.list_cluster_names()
+    assert sorted(names) == ["cluster-1", "cluster-2", "cluster-3"]
+    spy.assert_not_called()
+
+
+def test_list_clusters_caches_descriptions(cluster_client: ClusterClient) -> None:
+    _create_clusters(3)
+    with patch.object(cluster_client, "get_cluster", wraps=cluster_client.get_cluster) as spy:
+        first = cluster_client.list_clusters(max_workers=2)
+        second = cluster_client.list_clusters(max_workers=2)
+        assert spy.call_count == 3
+        cluster_client.list_clusters(cache_ttl=0)
+        assert spy.call_count == 6
+    assert [c["name"] for c in first] == [c["name"] for c in second]
+
+
+def test_iter_clusters_skips_deleted(cluster_client: ClusterClient) -> None:
+    _create_clusters(2)
+    clusters = list(cluster_client.iter_clusters(["cluster-1", "gone", "cluster-2"]))
+    assert sorted(c["name"] for c in clusters) == ["cluster-1", "cluster-2"]